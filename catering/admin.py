@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Dish, Salad, WeddingMenu, MenuDish, MenuSalad
+from .models import Dish, Salad, WeddingMenu, MenuDish, MenuSalad, Ingredient
 
 
 class MenuDishInline(admin.TabularInline):
@@ -58,6 +58,13 @@ class SaladAdmin(admin.ModelAdmin):
     )
 
 
+@admin.register(Ingredient)
+class IngredientAdmin(admin.ModelAdmin):
+    list_display = ['name', 'key']
+    search_fields = ['name', 'key']
+    readonly_fields = ['key']
+
+
 @admin.register(WeddingMenu)
 class WeddingMenuAdmin(admin.ModelAdmin):
     list_display = ['name', 'price_per_person', 'min_guests', 'is_active', 'created_at']
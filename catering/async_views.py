@@ -0,0 +1,61 @@
+"""
+Toý menýulary üçin async (ASGI) okamak görnüşleri.
+
+Jogaplar WeddingMenuViewSet-iň list we retrieve jogaplary bilen deň.
+"""
+
+from django.conf import settings
+from django.db.models import Count, Prefetch
+
+from venue.async_api import json_response, not_found, paginate
+from venue.search import normalize_search_text
+from .filters import WeddingMenuFilter
+from .models import WeddingMenu, MenuDish, MenuSalad
+from .serializers import WeddingMenuSerializer, WeddingMenuDetailSerializer
+
+
+# WeddingMenuViewSet-iň ordering_fields we ordering sazlamalary bilen deň
+ORDERING_FIELDS = ('name', 'price_per_person', 'created_at')
+DEFAULT_ORDERING = ['-created_at']
+
+
+def menu_ordering(value):
+    """'?ordering=-price_per_person,name' -> ['-price_per_person', 'name'], nädogry meýdanlar taşlanýar"""
+    ordering = [
+        term for term in (part.strip() for part in (value or '').split(','))
+        if term.lstrip('-') in ORDERING_FIELDS
+    ]
+    return ordering or DEFAULT_ORDERING
+
+
+async def menu_list(request):
+    queryset = WeddingMenu.objects.filter(is_active=True)
+    queryset = WeddingMenuFilter(request.GET, queryset=queryset).qs
+
+    for term in normalize_search_text(request.GET.get('search', '')).split():
+        queryset = queryset.filter(search_key__icontains=term)
+
+    queryset = queryset.annotate(
+        menu_dishes_count=Count('menudish', distinct=True),
+        menu_salads_count=Count('menusalad', distinct=True),
+    ).order_by(*menu_ordering(request.GET.get('ordering')))
+
+    return await paginate(
+        request,
+        queryset,
+        WeddingMenuSerializer,
+        page_size=settings.REST_FRAMEWORK['PAGE_SIZE'],
+    )
+
+
+async def menu_detail(request, pk):
+    queryset = WeddingMenu.objects.filter(is_active=True).prefetch_related(
+        Prefetch('menudish_set', queryset=MenuDish.objects.select_related('dish')),
+        Prefetch('menusalad_set', queryset=MenuSalad.objects.select_related('salad')),
+    )
+    try:
+        menu = await queryset.aget(pk=pk)
+    except WeddingMenu.DoesNotExist:
+        return not_found(WeddingMenu)
+
+    return json_response(WeddingMenuDetailSerializer(menu, context={'request': request}).data)
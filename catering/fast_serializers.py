@@ -0,0 +1,27 @@
+"""Katering sanawlary üçin ýeňil serializer-ler (venue/fast_serializers.py)"""
+
+from django.db.models import Count
+
+from venue.fast_serializers import FastSerializer
+from .serializers import DishSerializer, WeddingMenuSerializer
+
+
+class DishFastSerializer(FastSerializer):
+    serializer_class = DishSerializer
+
+
+class WeddingMenuFastSerializer(FastSerializer):
+    serializer_class = WeddingMenuSerializer
+    extra_values = ('menu_dishes_count', 'menu_salads_count')
+
+    def values(self, queryset):
+        return super().values(queryset.annotate(
+            menu_dishes_count=Count('menudish', distinct=True),
+            menu_salads_count=Count('menusalad', distinct=True),
+        ))
+
+    def field_dishes_count(self, row):
+        return row['menu_dishes_count']
+
+    def field_salads_count(self, row):
+        return row['menu_salads_count']
@@ -0,0 +1,73 @@
+import django_filters
+from django.db.models import Count
+
+from .models import Salad, WeddingMenu, MenuSalad, parse_ingredients
+
+
+def ingredient_keys(value):
+    """'krewetka, Орех' -> ['krewetka', 'oreh']"""
+    return [key for _, key in parse_ingredients(value)]
+
+
+class SaladFilter(django_filters.FilterSet):
+    """
+    Düzümi boýunça filter:
+    ?ingredients=pomidor,sogan          - ähli görkezilen önümler bar
+    ?exclude_ingredients=hoz,krewetka   - görkezilen önümleriň hiç biri ýok
+    """
+    ingredients = django_filters.CharFilter(method='filter_ingredients')
+    exclude_ingredients = django_filters.CharFilter(method='filter_exclude_ingredients')
+
+    class Meta:
+        model = Salad
+        fields = ['is_vegetarian']
+
+    def filter_ingredients(self, queryset, name, value):
+        keys = ingredient_keys(value)
+        if not keys:
+            return queryset
+        matching = (
+            Salad.ingredient_items.through.objects
+            .filter(ingredient__key__in=keys)
+            .values('salad_id')
+            .annotate(matched=Count('ingredient_id', distinct=True))
+            .filter(matched=len(keys))
+            .values('salad_id')
+        )
+        return queryset.filter(pk__in=matching)
+
+    def filter_exclude_ingredients(self, queryset, name, value):
+        keys = ingredient_keys(value)
+        if not keys:
+            return queryset
+        return queryset.exclude(ingredient_items__key__in=keys)
+
+
+class WeddingMenuFilter(django_filters.FilterSet):
+    """Menýudaky salatlaryň düzümi boýunça filter (SaladFilter bilen deň parametrler)"""
+    ingredients = django_filters.CharFilter(method='filter_ingredients')
+    exclude_ingredients = django_filters.CharFilter(method='filter_exclude_ingredients')
+
+    class Meta:
+        model = WeddingMenu
+        fields = []
+
+    def filter_ingredients(self, queryset, name, value):
+        keys = ingredient_keys(value)
+        if not keys:
+            return queryset
+        matching = (
+            MenuSalad.objects
+            .filter(salad__ingredient_items__key__in=keys)
+            .values('menu_id')
+            .annotate(matched=Count('salad__ingredient_items', distinct=True))
+            .filter(matched=len(keys))
+            .values('menu_id')
+        )
+        return queryset.filter(pk__in=matching)
+
+    def filter_exclude_ingredients(self, queryset, name, value):
+        keys = ingredient_keys(value)
+        if not keys:
+            return queryset
+        return queryset.exclude(menusalad__salad__ingredient_items__key__in=keys)
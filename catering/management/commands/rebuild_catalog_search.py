@@ -0,0 +1,22 @@
+"""
+Ulanylyşy:
+python manage.py rebuild_catalog_search
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from catering import search
+
+
+class Command(BaseCommand):
+    help = 'Tagam, salat we menýu gözleg indeksini täzeden gurýar'
+
+    def handle(self, *args, **options):
+        if not search.is_supported():
+            raise CommandError('FTS5 gözleg indeksi diňe SQLite üçin elýeterli')
+
+        with transaction.atomic():
+            total = search.rebuild_index()
+
+        self.stdout.write(self.style.SUCCESS(f'✓ {total} ýazgy indekslendi'))
@@ -0,0 +1,249 @@
+"""
+Býujete görä menýu düzüji.
+
+Işjeň tagamlaryň we salatlaryň bahalary ýatda saklanýan, massiw görnüşindäki
+suratda (snapshot) saklanýar. Surat diňe katalog üýtgände (baha, işjeňlik,
+täze ýa-da pozulan ýazgy) täzelenýär, şonuň üçin her gözlegde diňe iki
+sany ýeňil aggregate sorag ýerine ýetirilýär.
+
+Düzüji "branch-and-bound" usuly bilen her topar (kategoriýa ýa-da salat)
+üçin talap edilýän sany saýlaýar we bir adama düşýän býujetden geçmeýän iň
+gymmat (býujete iň ýakyn) kombinasiýalary gaýtarýar.
+"""
+
+import heapq
+import threading
+from array import array
+from decimal import Decimal
+
+from django.db.models import Count, Max
+
+from .models import Dish, DishCategory, Salad
+
+SALAD_GROUP = 'salad'
+GROUPS = [value for value, _ in DishCategory.choices] + [SALAD_GROUP]
+
+# Bir toparda talap edilip bilinjek iň köp sany
+MAX_QUOTA = 6
+# Gözleg agajynyň iň köp düwün sany: çäge ýetilse, şol wagta çenli tapylan
+# iň gowy kombinasiýalar gaýtarylýar
+MAX_NODES = 100_000
+
+
+def to_cents(value):
+    """Decimal bahany bitin tiyine öwürýär"""
+    return int(Decimal(value) * 100)
+
+
+def from_cents(value):
+    return (Decimal(value) / 100).quantize(Decimal('0.01'))
+
+
+class _SearchDone(Exception):
+    """Gözlegi doly togtatmak üçin (býujete deň netijeler ýa-da düwün çägi)"""
+
+
+class CatalogGroup:
+    """Bir toparyň elementleri, bahasy boýunça kemelýän tertipde"""
+
+    def __init__(self, rows):
+        rows = sorted(rows, key=lambda row: (-row[1], row[0]))
+        self.ids = array('q', (row[0] for row in rows))
+        self.prices = array('q', (row[1] for row in rows))
+        self.vegetarian = bytes(bool(row[2]) for row in rows)
+
+    def __len__(self):
+        return len(self.ids)
+
+
+class CatalogSnapshot:
+    """Işjeň tagamlaryň we salatlaryň ýatdaky suraty"""
+
+    def __init__(self, version):
+        self.version = version
+        rows = {group: [] for group in GROUPS}
+
+        dishes = Dish.objects.filter(is_active=True).values_list(
+            'id', 'category', 'price', 'is_vegetarian'
+        )
+        for pk, category, price, is_vegetarian in dishes:
+            if category in rows:
+                rows[category].append((pk, to_cents(price), is_vegetarian))
+
+        salads = Salad.objects.filter(is_active=True).values_list(
+            'id', 'price', 'is_vegetarian'
+        )
+        for pk, price, is_vegetarian in salads:
+            rows[SALAD_GROUP].append((pk, to_cents(price), is_vegetarian))
+
+        self.groups = {group: CatalogGroup(items) for group, items in rows.items()}
+
+
+_snapshot = None
+_snapshot_lock = threading.Lock()
+
+
+def catalog_version():
+    """Katalogyň häzirki wersiýasy (soňky üýtgeşme we ýazgylaryň sany)"""
+    dishes = Dish.objects.aggregate(changed=Max('updated_at'), total=Count('id'))
+    salads = Salad.objects.aggregate(changed=Max('updated_at'), total=Count('id'))
+    return (dishes['changed'], dishes['total'], salads['changed'], salads['total'])
+
+
+def get_snapshot():
+    """Suraty gaýtarýar, katalog üýtgän bolsa täzeden ýükleýär"""
+    global _snapshot
+
+    version = catalog_version()
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.version == version:
+        return snapshot
+
+    with _snapshot_lock:
+        if _snapshot is None or _snapshot.version != version:
+            _snapshot = CatalogSnapshot(version)
+        return _snapshot
+
+
+class MenuBuilder:
+    """
+    Talap edilýän toparlary (meselem: {'soup': 1, 'main_course': 2}) we
+    bir adama düşýän býujeti kanagatlandyrýan menýu kombinasiýalaryny tapýar.
+    """
+
+    def __init__(self, snapshot, quotas, budget, vegetarian=False, limit=5):
+        self.quotas = {group: count for group, count in quotas.items() if count > 0}
+        self.budget = to_cents(budget)
+        self.limit = limit
+        self.levels = []
+        # Düwün çägine ýetilip, gözleg doly geçirilmedik bolsa True
+        self.truncated = False
+
+        for group, count in self.quotas.items():
+            catalog = snapshot.groups[group]
+            if vegetarian:
+                picked = [i for i in range(len(catalog)) if catalog.vegetarian[i]]
+            else:
+                picked = range(len(catalog))
+            ids = array('q', (catalog.ids[i] for i in picked))
+            prices = array('q', (catalog.prices[i] for i in picked))
+            self.levels.append((group, count, ids, prices, self._prefix(prices)))
+
+        # Az saýlaw bar bolan toparlary ilki gözden geçirmek agajy kiçeldýär
+        self.levels.sort(key=lambda level: len(level[2]) - level[1])
+
+        # Toparda talap edilenden az saýlaw bar bolsa, kombinasiýa ýok
+        self.feasible = all(len(ids) >= count for _, count, ids, _, _ in self.levels)
+
+        # Galan toparlar üçin iň arzan we iň gymmat mümkin jemler
+        self.min_rest = [0] * (len(self.levels) + 1)
+        self.max_rest = [0] * (len(self.levels) + 1)
+        if not self.feasible:
+            return
+        for index in range(len(self.levels) - 1, -1, -1):
+            _, count, _, prices, prefix = self.levels[index]
+            self.min_rest[index] = self.min_rest[index + 1] + prefix[-1] - prefix[len(prices) - count]
+            self.max_rest[index] = self.max_rest[index + 1] + prefix[count]
+
+    @staticmethod
+    def _prefix(prices):
+        prefix = array('q', [0])
+        for price in prices:
+            prefix.append(prefix[-1] + price)
+        return prefix
+
+    def build(self):
+        """Iň gowy kombinasiýalary jemi bahasy boýunça kemelýän tertipde gaýtarýar"""
+        if not self.levels:
+            return []
+        if not self.feasible:
+            return []
+        if self.min_rest[0] > self.budget:
+            return []
+
+        self._heap = []
+        self._counter = 0
+        self._nodes = 0
+        try:
+            self._search(0, 0, self.levels[0][1], 0, [])
+        except _SearchDone:
+            pass
+
+        results = sorted(self._heap, key=lambda item: (-item[0], item[1]))
+        return [self._candidate(total, selection) for total, _, selection in results]
+
+    def _search(self, level, start, remaining, total, selection):
+        _, _, ids, prices, prefix = self.levels[level]
+        size = len(prices)
+
+        self._nodes += 1
+        if self._nodes > MAX_NODES:
+            self.truncated = True
+            raise _SearchDone
+
+        if remaining == 0:
+            if level + 1 == len(self.levels):
+                self._offer(total, selection)
+                return
+            next_count = self.levels[level + 1][1]
+            self._search(level + 1, 0, next_count, total, selection)
+            return
+
+        rest_min = self.min_rest[level + 1]
+        rest_max = self.max_rest[level + 1]
+        # Saýlanan elementden soň galan (has arzan) elementleriň iň arzan jemi
+        tail_min = prefix[size] - prefix[size - remaining + 1]
+
+        for index in range(start, size - remaining + 1):
+            price = prices[index]
+
+            # Ýokarky çäk: şu we ondan soňky iň gymmat elementler, býujetden
+            # geçmeýär, sebäbi býujetden gymmat kombinasiýa kabul edilmeýär
+            upper = min(total + prefix[index + remaining] - prefix[index] + rest_max, self.budget)
+            if len(self._heap) >= self.limit and upper <= self._heap[0][0]:
+                break
+
+            if total + price + tail_min + rest_min > self.budget:
+                continue
+
+            selection.append((level, ids[index], price))
+            self._search(level, index + 1, remaining - 1, total + price, selection)
+            selection.pop()
+
+    def _offer(self, total, selection):
+        self._counter += 1
+        item = (total, self._counter, tuple(selection))
+        if len(self._heap) < self.limit:
+            heapq.heappush(self._heap, item)
+        elif total > self._heap[0][0]:
+            heapq.heapreplace(self._heap, item)
+        # Ähli netijeler býujete deň: has gowusy ýok
+        if len(self._heap) >= self.limit and self._heap[0][0] == self.budget:
+            raise _SearchDone
+
+    def _candidate(self, total, selection):
+        dishes = []
+        salads = []
+        for level, pk, price in selection:
+            group = self.levels[level][0]
+            if group == SALAD_GROUP:
+                salads.append(pk)
+            else:
+                dishes.append(pk)
+        return {
+            'total_price': from_cents(total),
+            'dish_ids': dishes,
+            'salad_ids': salads,
+        }
+
+
+def build_menus(quotas, budget, vegetarian=False, limit=5):
+    """Häzirki katalog suratyndan menýu kombinasiýalaryny düzýär"""
+    unknown = set(quotas) - set(GROUPS)
+    if unknown:
+        raise ValueError(f"Näbelli toparlar: {', '.join(sorted(unknown))}")
+    too_many = sorted(group for group, count in quotas.items() if count > MAX_QUOTA)
+    if too_many:
+        raise ValueError(f"Toparda iň köp {MAX_QUOTA} sany bolup biler: {', '.join(too_many)}")
+    builder = MenuBuilder(get_snapshot(), quotas, budget, vegetarian=vegetarian, limit=limit)
+    return builder.build()
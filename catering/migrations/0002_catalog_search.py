@@ -0,0 +1,69 @@
+from django.db import migrations
+
+# Migrasiýa häzirki catering.search moduluna bagly bolmaly däl: shema we
+# indeksleýiş şu ýerde şol wagtky görnüşinde saklanýar
+TABLE = 'catering_catalog_search'
+ROWID_BASE = 10 ** 12
+KIND_CODES = {'dish': 1, 'salad': 2, 'menu': 3}
+
+CREATE_SQL = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE} USING fts5(
+        kind UNINDEXED,
+        object_id UNINDEXED,
+        price UNINDEXED,
+        name,
+        description,
+        ingredients,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3'
+    )
+"""
+DROP_SQL = f'DROP TABLE IF EXISTS {TABLE}'
+
+
+def create_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(CREATE_SQL)
+    models = {
+        'dish': (apps.get_model('catering', 'Dish'), 'price'),
+        'salad': (apps.get_model('catering', 'Salad'), 'price'),
+        'menu': (apps.get_model('catering', 'WeddingMenu'), 'price_per_person'),
+    }
+    with schema_editor.connection.cursor() as cursor:
+        for kind, (model, price_field) in models.items():
+            rows = [
+                (
+                    KIND_CODES[kind] * ROWID_BASE + obj.pk,
+                    kind,
+                    obj.pk,
+                    str(getattr(obj, price_field)),
+                    obj.name,
+                    obj.description,
+                    getattr(obj, 'ingredients', ''),
+                )
+                for obj in model.objects.filter(is_active=True)
+            ]
+            cursor.executemany(
+                f'INSERT INTO {TABLE} '
+                f'(rowid, kind, object_id, price, name, description, ingredients) '
+                f'VALUES (%s, %s, %s, %s, %s, %s, %s)',
+                rows
+            )
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(DROP_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catering', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
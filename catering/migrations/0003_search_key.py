@@ -0,0 +1,135 @@
+# Generated by Django 5.2.6 on 2026-10-19 19:27
+
+import re
+import unicodedata
+
+from django.db import migrations, models
+
+# Migrasiýa häzirki venue.search we catering.search modullaryna bagly bolmaly
+# däl: transliterasiýa we FTS shemasy şu ýerde şol wagtky görnüşinde saklanýar
+CYRILLIC = {
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'e',
+    'ж': 'zh', 'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm',
+    'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u',
+    'ф': 'f', 'х': 'h', 'ц': 'ts', 'ч': 'ch', 'ш': 'sh', 'щ': 'sch', 'ъ': '',
+    'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya',
+    'ә': 'a', 'ө': 'o', 'ү': 'u', 'җ': 'j', 'ң': 'n',
+}
+TURKMEN_LATIN = {
+    'ç': 'ch', 'ş': 'sh', 'ž': 'zh', 'ý': 'y', 'ň': 'n',
+    'ä': 'a', 'ö': 'o', 'ü': 'u',
+}
+TRANSLITERATION = str.maketrans({**CYRILLIC, **TURKMEN_LATIN})
+NON_WORD = re.compile(r'[\W_]+')
+
+
+def normalize_search_text(value):
+    if not value:
+        return ''
+    value = unicodedata.normalize('NFC', str(value)).casefold()
+    value = value.translate(TRANSLITERATION)
+    value = ''.join(
+        char for char in unicodedata.normalize('NFKD', value)
+        if not unicodedata.combining(char)
+    )
+    return NON_WORD.sub(' ', value).strip()
+
+
+def build_search_key(*values):
+    return ' '.join(filter(None, (normalize_search_text(value) for value in values)))
+
+
+TABLE = 'catering_catalog_search'
+ROWID_BASE = 10 ** 12
+KIND_CODES = {'dish': 1, 'salad': 2, 'menu': 3}
+
+CREATE_SQL = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE} USING fts5(
+        kind UNINDEXED,
+        object_id UNINDEXED,
+        price UNINDEXED,
+        name,
+        description,
+        ingredients,
+        search_key,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3'
+    )
+"""
+DROP_SQL = f'DROP TABLE IF EXISTS {TABLE}'
+
+SEARCH_KEY_FIELDS = {
+    'Dish': ('name', 'description'),
+    'Salad': ('name', 'description', 'ingredients'),
+    'WeddingMenu': ('name', 'description'),
+}
+
+
+def fill_search_keys(apps, schema_editor):
+    for model_name, fields in SEARCH_KEY_FIELDS.items():
+        model = apps.get_model('catering', model_name)
+        objects = list(model.objects.all())
+        for obj in objects:
+            obj.search_key = build_search_key(*(getattr(obj, field) for field in fields))
+        model.objects.bulk_update(objects, ['search_key'], batch_size=500)
+
+
+def rebuild_catalog_index(apps, schema_editor):
+    """FTS indeksine search_key sütüni goşulýar"""
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(DROP_SQL)
+    schema_editor.execute(CREATE_SQL)
+    models = {
+        'dish': (apps.get_model('catering', 'Dish'), 'price'),
+        'salad': (apps.get_model('catering', 'Salad'), 'price'),
+        'menu': (apps.get_model('catering', 'WeddingMenu'), 'price_per_person'),
+    }
+    with schema_editor.connection.cursor() as cursor:
+        for kind, (model, price_field) in models.items():
+            rows = [
+                (
+                    KIND_CODES[kind] * ROWID_BASE + obj.pk,
+                    kind,
+                    obj.pk,
+                    str(getattr(obj, price_field)),
+                    obj.name,
+                    obj.description,
+                    getattr(obj, 'ingredients', ''),
+                    obj.search_key,
+                )
+                for obj in model.objects.filter(is_active=True)
+            ]
+            cursor.executemany(
+                f'INSERT INTO {TABLE} '
+                f'(rowid, kind, object_id, price, name, description, ingredients, search_key) '
+                f'VALUES (%s, %s, %s, %s, %s, %s, %s, %s)',
+                rows
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catering', '0002_catalog_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dish',
+            name='search_key',
+            field=models.TextField(blank=True, db_index=True, editable=False, verbose_name='Gözleg açary'),
+        ),
+        migrations.AddField(
+            model_name='salad',
+            name='search_key',
+            field=models.TextField(blank=True, db_index=True, editable=False, verbose_name='Gözleg açary'),
+        ),
+        migrations.AddField(
+            model_name='weddingmenu',
+            name='search_key',
+            field=models.TextField(blank=True, db_index=True, editable=False, verbose_name='Gözleg açary'),
+        ),
+        migrations.RunPython(fill_search_keys, migrations.RunPython.noop),
+        migrations.RunPython(rebuild_catalog_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,97 @@
+# Generated by Django 5.2.6 on 2026-10-19 19:28
+
+import re
+import unicodedata
+
+from django.db import migrations, models
+
+# Migrasiýa häzirki catering.models we venue.search modullaryna bagly bolmaly
+# däl: düzümi bölüji we transliterasiýa şu ýerde şol wagtky görnüşinde saklanýar
+CYRILLIC = {
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'e',
+    'ж': 'zh', 'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm',
+    'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u',
+    'ф': 'f', 'х': 'h', 'ц': 'ts', 'ч': 'ch', 'ш': 'sh', 'щ': 'sch', 'ъ': '',
+    'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya',
+    'ә': 'a', 'ө': 'o', 'ү': 'u', 'җ': 'j', 'ң': 'n',
+}
+TURKMEN_LATIN = {
+    'ç': 'ch', 'ş': 'sh', 'ž': 'zh', 'ý': 'y', 'ň': 'n',
+    'ä': 'a', 'ö': 'o', 'ü': 'u',
+}
+TRANSLITERATION = str.maketrans({**CYRILLIC, **TURKMEN_LATIN})
+NON_WORD = re.compile(r'[\W_]+')
+
+
+def normalize_search_text(value):
+    if not value:
+        return ''
+    value = unicodedata.normalize('NFC', str(value)).casefold()
+    value = value.translate(TRANSLITERATION)
+    value = ''.join(
+        char for char in unicodedata.normalize('NFKD', value)
+        if not unicodedata.combining(char)
+    )
+    return NON_WORD.sub(' ', value).strip()
+
+
+def parse_ingredients(text):
+    parsed = {}
+    for part in re.split(r'[,;\n]+', text or ''):
+        name = ' '.join(part.split())[:100]
+        key = normalize_search_text(name)[:100]
+        if key and key not in parsed:
+            parsed[key] = name
+    return [(name, key) for key, name in parsed.items()]
+
+
+def fill_ingredients(apps, schema_editor):
+    Salad = apps.get_model('catering', 'Salad')
+    Ingredient = apps.get_model('catering', 'Ingredient')
+
+    parsed = {salad.pk: parse_ingredients(salad.ingredients) for salad in Salad.objects.all()}
+    names = {key: name for items in parsed.values() for name, key in items}
+    Ingredient.objects.bulk_create(
+        [Ingredient(name=name, key=key) for key, name in names.items()],
+        ignore_conflicts=True
+    )
+
+    ids = dict(Ingredient.objects.values_list('key', 'id'))
+    Link = Salad.ingredient_items.through
+    Link.objects.bulk_create(
+        [
+            Link(salad_id=salad_id, ingredient_id=ids[key])
+            for salad_id, items in parsed.items()
+            for _, key in items
+        ],
+        batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catering', '0003_search_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Ingredient',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, verbose_name='Ady')),
+                ('key', models.CharField(help_text='Kiçi harplar bilen, latyn görnüşinde (gözleg üçin)', max_length=100, unique=True, verbose_name='Açar')),
+            ],
+            options={
+                'verbose_name': 'Önüm',
+                'verbose_name_plural': 'Önümler',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='salad',
+            name='ingredient_items',
+            field=models.ManyToManyField(blank=True, editable=False, related_name='salads', to='catering.ingredient', verbose_name='Önümler'),
+        ),
+        migrations.RunPython(fill_ingredients, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-19 19:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catering', '0004_ingredients'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='dish',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='salad',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='weddingmenu',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
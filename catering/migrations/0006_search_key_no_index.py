@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-19 20:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catering', '0005_updated_at_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='dish',
+            name='search_key',
+            field=models.TextField(blank=True, editable=False, verbose_name='Gözleg açary'),
+        ),
+        migrations.AlterField(
+            model_name='salad',
+            name='search_key',
+            field=models.TextField(blank=True, editable=False, verbose_name='Gözleg açary'),
+        ),
+        migrations.AlterField(
+            model_name='weddingmenu',
+            name='search_key',
+            field=models.TextField(blank=True, editable=False, verbose_name='Gözleg açary'),
+        ),
+    ]
@@ -1,6 +1,10 @@
+import re
+
 from django.db import models
 from django.core.validators import MinValueValidator
 
+from venue.search import SearchKeyMixin, normalize_search_text
+
 
 class DishCategory(models.TextChoices):
     """Tagam kategoriýalary"""
@@ -12,8 +16,10 @@ class DishCategory(models.TextChoices):
     BEVERAGE = 'beverage', 'Içgi'
 
 
-class Dish(models.Model):
+class Dish(SearchKeyMixin, models.Model):
     """Tagam modeli"""
+    search_key_fields = ('name', 'description')
+
     name = models.CharField(max_length=200, verbose_name='Tagam ady')
     description = models.TextField(blank=True, verbose_name='Düşündiriş')
     category = models.CharField(
@@ -40,8 +46,13 @@ class Dish(models.Model):
         default=True,
         verbose_name='Işjeň'
     )
+    search_key = models.TextField(
+        blank=True,
+        editable=False,
+        verbose_name='Gözleg açary'
+    )
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         verbose_name = 'Tagam'
@@ -52,11 +63,58 @@ class Dish(models.Model):
         return f"{self.name} ({self.get_category_display()})"
 
 
-class Salad(models.Model):
+def parse_ingredients(text):
+    """
+    Düzümi tekstini [(ady, açar), ...] sanawyna öwürýär.
+    'Pomidor, hyýar; Сыр' -> [('Pomidor', 'pomidor'), ('hyýar', 'hyyar'), ('Сыр', 'syr')]
+    """
+    parsed = {}
+    for part in re.split(r'[,;\n]+', text or ''):
+        name = ' '.join(part.split())[:100]
+        key = normalize_search_text(name)[:100]
+        if key and key not in parsed:
+            parsed[key] = name
+    return [(name, key) for key, name in parsed.items()]
+
+
+class Ingredient(models.Model):
+    """Salatyň düzümindäki önüm"""
+    name = models.CharField(max_length=100, verbose_name='Ady')
+    key = models.CharField(
+        max_length=100,
+        unique=True,
+        verbose_name='Açar',
+        help_text='Kiçi harplar bilen, latyn görnüşinde (gözleg üçin)'
+    )
+
+    class Meta:
+        verbose_name = 'Önüm'
+        verbose_name_plural = 'Önümler'
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+    def save(self, *args, **kwargs):
+        if not self.key:
+            self.key = normalize_search_text(self.name)[:100]
+        super().save(*args, **kwargs)
+
+
+class Salad(SearchKeyMixin, models.Model):
     """Salat modeli"""
+    search_key_fields = ('name', 'description', 'ingredients')
+
     name = models.CharField(max_length=200, verbose_name='Salat ady')
     description = models.TextField(blank=True, verbose_name='Düşündiriş')
     ingredients = models.TextField(verbose_name='Düzümi')
+    ingredient_items = models.ManyToManyField(
+        Ingredient,
+        related_name='salads',
+        blank=True,
+        editable=False,
+        verbose_name='Önümler'
+    )
     price = models.DecimalField(
         max_digits=10,
         decimal_places=2,
@@ -76,8 +134,13 @@ class Salad(models.Model):
         default=True,
         verbose_name='Işjeň'
     )
+    search_key = models.TextField(
+        blank=True,
+        editable=False,
+        verbose_name='Gözleg açary'
+    )
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         verbose_name = 'Salat'
@@ -87,9 +150,48 @@ class Salad(models.Model):
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.sync_ingredients()
+
+    def sync_ingredients(self):
+        """ingredients tekstini Ingredient tablisasy bilen deňleşdirýär"""
+        parsed = parse_ingredients(self.ingredients)
+        keys = [key for _, key in parsed]
+        current = set(self.ingredient_items.values_list('key', flat=True))
+        if current == set(keys):
+            return
+
+        Ingredient.objects.bulk_create(
+            [Ingredient(name=name, key=key) for name, key in parsed],
+            ignore_conflicts=True
+        )
+        self.ingredient_items.set(Ingredient.objects.filter(key__in=keys))
+
+    @classmethod
+    def sync_ingredients_bulk(cls, salads):
+        """sync_ingredients köp salat üçin (bulk_create/bulk_update-den soň)"""
+        parsed = {salad.pk: parse_ingredients(salad.ingredients) for salad in salads}
+        names = {key: name for items in parsed.values() for name, key in items}
+        Ingredient.objects.bulk_create(
+            [Ingredient(name=name, key=key) for key, name in names.items()],
+            ignore_conflicts=True
+        )
+        ids = dict(Ingredient.objects.filter(key__in=names).values_list('key', 'pk'))
+
+        through = cls.ingredient_items.through
+        through.objects.filter(salad_id__in=parsed).delete()
+        through.objects.bulk_create([
+            through(salad_id=salad_id, ingredient_id=ids[key])
+            for salad_id, items in parsed.items()
+            for _, key in items
+        ])
 
-class WeddingMenu(models.Model):
+
+class WeddingMenu(SearchKeyMixin, models.Model):
     """Toý menýusy modeli"""
+    search_key_fields = ('name', 'description')
+
     name = models.CharField(max_length=200, verbose_name='Menýu ady')
     description = models.TextField(blank=True, verbose_name='Düşündiriş')
     dishes = models.ManyToManyField(
@@ -121,8 +223,13 @@ class WeddingMenu(models.Model):
         default=True,
         verbose_name='Işjeň'
     )
+    search_key = models.TextField(
+        blank=True,
+        editable=False,
+        verbose_name='Gözleg açary'
+    )
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         verbose_name = 'Toý menýusy'
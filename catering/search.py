@@ -0,0 +1,197 @@
+"""
+Tagamlar, salatlar we menýular boýunça bitewi gözleg.
+
+SQLite-da ähli katalog bir FTS5 indeksinde saklanýar: prefiks gözleg
+(type-ahead) we bm25 boýunça tertiplemek bir sorag bilen ýerine ýetirilýär.
+Indeks signallar arkaly täzelenýär; doly täzeden gurmak üçin:
+
+    python manage.py rebuild_catalog_search
+
+Gözleg sözleri we search_key sütüni şol bir görnüşe getirilýär
+(venue.search.normalize_search_text), şonuň üçin kiril we latyn ýazgylary
+biri-biri bilen gabat gelýär. Beýleki maglumat bazalarynda search_key
+boýunça adaty icontains gözlegine geçilýär.
+"""
+
+from decimal import Decimal
+
+from django.db import connection
+
+from venue.search import normalize_search_text
+
+from .models import Dish, Salad, WeddingMenu
+
+TABLE = 'catering_catalog_search'
+
+# rowid = kind kody * ROWID_BASE + obýektiň id-si
+ROWID_BASE = 10 ** 12
+KIND_CODES = {'dish': 1, 'salad': 2, 'menu': 3}
+KIND_MODELS = {'dish': Dish, 'salad': Salad, 'menu': WeddingMenu}
+MODEL_KINDS = {model: kind for kind, model in KIND_MODELS.items()}
+
+CREATE_SQL = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE} USING fts5(
+        kind UNINDEXED,
+        object_id UNINDEXED,
+        price UNINDEXED,
+        name,
+        description,
+        ingredients,
+        search_key,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3'
+    )
+"""
+DROP_SQL = f'DROP TABLE IF EXISTS {TABLE}'
+
+# bm25 agramlary: kind, object_id, price, name, description, ingredients, search_key
+RANK_SQL = f'bm25({TABLE}, 0.0, 0.0, 0.0, 10.0, 1.0, 2.0, 1.0)'
+
+
+def is_supported(conn=None):
+    return (conn or connection).vendor == 'sqlite'
+
+
+def format_price(value):
+    """Bahany serializerlerdäki ýaly iki onluk belgili setir görnüşinde gaýtarýar"""
+    if value is None:
+        return None
+    return str(Decimal(value).quantize(Decimal('0.01')))
+
+
+def document(kind, obj):
+    """Indeks üçin setir: (rowid, kind, object_id, price, name, description, ingredients, search_key)"""
+    price = obj.price_per_person if kind == 'menu' else obj.price
+    return (
+        KIND_CODES[kind] * ROWID_BASE + obj.pk,
+        kind,
+        obj.pk,
+        format_price(price),
+        obj.name,
+        obj.description,
+        getattr(obj, 'ingredients', ''),
+        getattr(obj, 'search_key', ''),
+    )
+
+
+def write_documents(cursor, rows):
+    cursor.executemany(
+        f'INSERT OR REPLACE INTO {TABLE} '
+        f'(rowid, kind, object_id, price, name, description, ingredients, search_key) '
+        f'VALUES (%s, %s, %s, %s, %s, %s, %s, %s)',
+        rows
+    )
+
+
+def index_object(obj):
+    """Obýekti indekse goşýar ýa-da işjeň däl bolsa aýyrýar"""
+    if not is_supported():
+        return
+    if not obj.is_active:
+        remove_object(obj)
+        return
+    with connection.cursor() as cursor:
+        write_documents(cursor, [document(MODEL_KINDS[type(obj)], obj)])
+
+
+def index_objects(objects):
+    """Köp obýekti bir gezekde indeksleýär (bulk_create/bulk_update signal ibermeýär)"""
+    if not is_supported() or not objects:
+        return
+    active = [document(MODEL_KINDS[type(obj)], obj) for obj in objects if obj.is_active]
+    inactive = [
+        [KIND_CODES[MODEL_KINDS[type(obj)]] * ROWID_BASE + obj.pk]
+        for obj in objects if not obj.is_active
+    ]
+    with connection.cursor() as cursor:
+        write_documents(cursor, active)
+        if inactive:
+            cursor.executemany(f'DELETE FROM {TABLE} WHERE rowid = %s', inactive)
+
+
+def remove_object(obj):
+    if not is_supported():
+        return
+    rowid = KIND_CODES[MODEL_KINDS[type(obj)]] * ROWID_BASE + obj.pk
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {TABLE} WHERE rowid = %s', [rowid])
+
+
+def rebuild_index(models=None, conn=None, batch_size=1000):
+    """Indeksi işjeň ýazgylardan täzeden gurýar, indekslenen setirleriň sanyny gaýtarýar"""
+    conn = conn or connection
+    models = models or KIND_MODELS
+    total = 0
+    with conn.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {TABLE}')
+        for kind, model in models.items():
+            batch = []
+            for obj in model.objects.filter(is_active=True).iterator(chunk_size=batch_size):
+                batch.append(document(kind, obj))
+                if len(batch) >= batch_size:
+                    write_documents(cursor, batch)
+                    total += len(batch)
+                    batch = []
+            write_documents(cursor, batch)
+            total += len(batch)
+        cursor.execute(f"INSERT INTO {TABLE}({TABLE}) VALUES ('optimize')")
+    return total
+
+
+def match_expression(query):
+    """Ulanyjynyň ýazanyny FTS5 prefiks sözlemine öwürýär: 'Çor ба' -> "chor"* "ba"*"""
+    terms = normalize_search_text(query).split()
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def search(query, kinds=None, limit=20):
+    """Katalogda gözleg, netijeler derejesi boýunça tertiplenen"""
+    kinds = [kind for kind in (kinds or KIND_MODELS) if kind in KIND_MODELS]
+    expression = match_expression(query)
+    if not expression or not kinds:
+        return []
+
+    if not is_supported():
+        return _fallback_search(query, kinds, limit)
+
+    placeholders = ', '.join(['%s'] * len(kinds))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT kind, object_id, name, description, price, {RANK_SQL} AS rank '
+            f'FROM {TABLE} WHERE {TABLE} MATCH %s AND kind IN ({placeholders}) '
+            f'ORDER BY rank LIMIT %s',
+            [expression, *kinds, limit]
+        )
+        rows = cursor.fetchall()
+
+    return [
+        {
+            'type': kind,
+            'id': object_id,
+            'name': name,
+            'description': description,
+            'price': price,
+            'rank': round(-rank, 4),
+        }
+        for kind, object_id, name, description, price, rank in rows
+    ]
+
+
+def _fallback_search(query, kinds, limit):
+    terms = normalize_search_text(query).split()
+    results = []
+    for kind in kinds:
+        queryset = KIND_MODELS[kind].objects.filter(is_active=True)
+        for term in terms:
+            queryset = queryset.filter(search_key__contains=term)
+        for obj in queryset[:limit]:
+            _, _, object_id, price, name, description, _, _ = document(kind, obj)
+            results.append({
+                'type': kind,
+                'id': object_id,
+                'name': name,
+                'description': description,
+                'price': price,
+                'rank': 0,
+            })
+    return results[:limit]
@@ -87,10 +87,13 @@ class WeddingMenuSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at', 'updated_at']
     
     def get_dishes_count(self, obj):
-        return obj.menudish_set.count()
+        # annotate(menu_dishes_count=...) edilen bolsa goşmaça sorag ýok
+        count = getattr(obj, 'menu_dishes_count', None)
+        return obj.menudish_set.count() if count is None else count
     
     def get_salads_count(self, obj):
-        return obj.menusalad_set.count()
+        count = getattr(obj, 'menu_salads_count', None)
+        return obj.menusalad_set.count() if count is None else count
 
 
 class WeddingMenuDetailSerializer(serializers.ModelSerializer):
@@ -0,0 +1,43 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from . import search
+from .models import Dish, Salad, WeddingMenu, MenuDish, MenuSalad
+
+
+def touch_menus(queryset):
+    """Menýularyň updated_at meýdanyny täzeleýär (keş açarlary üçin)"""
+    queryset.update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Dish)
+def dish_saved(sender, instance, **kwargs):
+    touch_menus(WeddingMenu.objects.filter(menudish__dish=instance))
+
+
+@receiver(post_save, sender=Salad)
+def salad_saved(sender, instance, **kwargs):
+    touch_menus(WeddingMenu.objects.filter(menusalad__salad=instance))
+
+
+@receiver(post_save, sender=MenuDish)
+@receiver(post_delete, sender=MenuDish)
+@receiver(post_save, sender=MenuSalad)
+@receiver(post_delete, sender=MenuSalad)
+def menu_item_changed(sender, instance, **kwargs):
+    touch_menus(WeddingMenu.objects.filter(pk=instance.menu_id))
+
+
+@receiver(post_save, sender=Dish)
+@receiver(post_save, sender=Salad)
+@receiver(post_save, sender=WeddingMenu)
+def catalog_item_saved(sender, instance, **kwargs):
+    search.index_object(instance)
+
+
+@receiver(post_delete, sender=Dish)
+@receiver(post_delete, sender=Salad)
+@receiver(post_delete, sender=WeddingMenu)
+def catalog_item_deleted(sender, instance, **kwargs):
+    search.remove_object(instance)
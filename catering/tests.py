@@ -1,3 +1,203 @@
-from django.test import TestCase
+import os
+import tempfile
+from decimal import Decimal
 
-# Create your tests here.
+from django.test import TestCase, override_settings
+
+from venue.search import normalize_search_text
+
+from . import search
+from .menu_builder import MAX_QUOTA
+from .models import Dish, MenuSalad, Salad, WeddingMenu
+
+# Signallar offline katalog suratyny "hapa" diýip belleýär: synaglar hakyky katalogy üýtgetmesin
+TEST_SNAPSHOT_DIR = os.path.join(tempfile.gettempdir(), 'venue-test-snapshots')
+
+
+@override_settings(CATALOG_SNAPSHOT_DIR=TEST_SNAPSHOT_DIR)
+class DishFastListParityTests(TestCase):
+    """Tagamlaryň sanawy: values() ýoly DishSerializer bilen baýtma-baýt deň"""
+
+    PATHS = [
+        '/api/catering/dishes/',
+        '/api/catering/dishes/?page=2',
+        '/api/catering/dishes/?ordering=-price',
+        '/api/catering/dishes/?category=soup',
+        '/api/catering/dishes/?is_vegetarian=true',
+        '/api/catering/dishes/?search=çorba',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        for index in range(25):
+            Dish.objects.create(
+                name=f'Çorba {index}' if index % 3 == 0 else f'Tagam {index}',
+                description='Öý usulynda' if index % 2 else '',
+                category='soup' if index % 3 == 0 else 'main_course',
+                price=Decimal('12.50') + index,
+                weight=250 + index if index % 4 else None,
+                is_vegetarian=index % 5 == 0,
+            )
+
+    def test_list_responses_match(self):
+        for path in self.PATHS:
+            with self.subTest(path=path):
+                with override_settings(FAST_LIST_SERIALIZERS=False):
+                    expected = self.client.get(path)
+                with override_settings(FAST_LIST_SERIALIZERS=True):
+                    actual = self.client.get(path)
+                self.assertEqual(expected.status_code, 200)
+                self.assertGreater(len(expected.json()['results']), 0)
+                self.assertEqual(actual.content, expected.content)
+
+
+@override_settings(CATALOG_SNAPSHOT_DIR=TEST_SNAPSHOT_DIR)
+class MenuBuildTests(TestCase):
+    """Býujete görä menýu düzmek"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for index, price in enumerate(['40.00', '35.00', '30.00', '25.00']):
+            Dish.objects.create(
+                name=f'Esasy {index}', category='main_course',
+                price=Decimal(price), is_vegetarian=index % 2 == 0,
+            )
+        for index, price in enumerate(['15.00', '10.00']):
+            Dish.objects.create(
+                name=f'Çorba {index}', category='soup',
+                price=Decimal(price), is_vegetarian=index == 1,
+            )
+        Salad.objects.create(name='Gök salat', ingredients='Hyýar, pomidor', price=Decimal('8.50'))
+
+    def build(self, query):
+        return self.client.get(f'/api/catering/menus/build/?{query}')
+
+    def test_feasible(self):
+        response = self.build('budget=80&main_course=2&soup=1&salad=1')
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['budget'], '80.00')
+        totals = [menu['total_price'] for menu in data['menus']]
+        self.assertEqual(totals[0], '78.50')
+        self.assertEqual(totals, sorted(totals, reverse=True))
+        for menu in data['menus']:
+            self.assertEqual(len(menu['dishes']), 3)
+            self.assertEqual(len(menu['salads']), 1)
+            self.assertLessEqual(Decimal(menu['total_price']), Decimal('80'))
+
+    def test_infeasible(self):
+        # Býujet iň arzan kombinasiýadan hem az
+        response = self.build('budget=30&main_course=2')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['menus'], [])
+        # Toparda ýeterlik tagam ýok
+        response = self.build('budget=500&soup=3')
+        self.assertEqual(response.json()['menus'], [])
+
+    def test_vegetarian(self):
+        response = self.build('budget=100&main_course=2&soup=1&vegetarian=true')
+        self.assertEqual(response.status_code, 200)
+        menus = response.json()['menus']
+        self.assertEqual([menu['total_price'] for menu in menus], ['80.00'])
+        self.assertTrue(all(dish['is_vegetarian'] for dish in menus[0]['dishes']))
+
+    def test_quota_limit(self):
+        response = self.build(f'budget=100&main_course={MAX_QUOTA + 1}')
+        self.assertEqual(response.status_code, 400)
+
+
+@override_settings(CATALOG_SNAPSHOT_DIR=TEST_SNAPSHOT_DIR)
+class CatalogSearchSyncTests(TestCase):
+    """FTS indeksi signallar arkaly katalog bilen gabat gelýär"""
+
+    def found(self, query, kind='dish'):
+        return [(row['id'], row['price']) for row in search.search(query, kinds=[kind])]
+
+    def test_save_updates_index(self):
+        dish = Dish.objects.create(name='Mäş çorba', category='soup', price=Decimal('12.5'))
+        self.assertEqual(self.found('mash'), [(dish.pk, '12.50')])
+
+        dish.name = 'Nohut çorba'
+        dish.price = Decimal('14')
+        dish.save()
+        self.assertEqual(self.found('mash'), [])
+        self.assertEqual(self.found('nohut'), [(dish.pk, '14.00')])
+
+    def test_inactive_and_deleted_are_removed(self):
+        dish = Dish.objects.create(name='Palaw', category='main_course', price=Decimal('30'))
+        salad = Salad.objects.create(name='Palaw salat', ingredients='Käşir', price=Decimal('9'))
+        self.assertEqual(self.found('palaw'), [(dish.pk, '30.00')])
+
+        dish.is_active = False
+        dish.save()
+        self.assertEqual(self.found('palaw'), [])
+
+        self.assertEqual(self.found('palaw', kind='salad'), [(salad.pk, '9.00')])
+        salad.delete()
+        self.assertEqual(self.found('palaw', kind='salad'), [])
+
+
+@override_settings(CATALOG_SNAPSHOT_DIR=TEST_SNAPSHOT_DIR)
+class TransliterationTests(TestCase):
+    """Kiril we latyn ýazgylary bir gözleg açaryna getirilýär"""
+
+    def test_normalize_search_text(self):
+        cases = {
+            'Şaşlyk': 'shashlyk',
+            'шашлык': 'shashlyk',
+            'Çorba, Том ям!': 'chorba tom yam',
+            'Gök-önüm_salat': 'gok onum salat',
+            'Ýaňy': 'yany',
+            'җөрә': 'jora',
+            '': '',
+            None: '',
+        }
+        for value, expected in cases.items():
+            with self.subTest(value=value):
+                self.assertEqual(normalize_search_text(value), expected)
+
+    def test_search_key_matches_across_scripts(self):
+        dish = Dish.objects.create(name='Şaşlyk', category='main_course', price=Decimal('20'))
+        self.assertEqual(dish.search_key, 'shashlyk')
+        for query in ('шашлык', 'shashlyk', 'ŞAŞ'):
+            with self.subTest(query=query):
+                response = self.client.get('/api/catering/dishes/', {'search': query})
+                ids = [row['id'] for row in response.json()['results']]
+                self.assertEqual(ids, [dish.pk])
+
+
+@override_settings(CATALOG_SNAPSHOT_DIR=TEST_SNAPSHOT_DIR)
+class AsyncMenuListParityTests(TestCase):
+    """Async menýu sanawy WeddingMenuViewSet bilen şol bir filterleri ulanýar"""
+
+    QUERIES = [
+        '',
+        '?ordering=name',
+        '?ordering=-price_per_person,name',
+        '?ordering=unknown',
+        '?ingredients=pomidor',
+        '?exclude_ingredients=hoz',
+        '?ingredients=pomidor,hyýar&ordering=price_per_person',
+        '?search=toý',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        salads = [
+            Salad.objects.create(name='Çopan', ingredients='Pomidor, hyýar', price=Decimal('8')),
+            Salad.objects.create(name='Hozly', ingredients='Hoz, sogan', price=Decimal('9')),
+        ]
+        for index in range(6):
+            menu = WeddingMenu.objects.create(
+                name=f'Toý {index}' if index % 2 else f'Menýu {index}',
+                price_per_person=Decimal('50') + (index * 3) % 7,
+            )
+            MenuSalad.objects.create(menu=menu, salad=salads[index % 2])
+
+    def test_results_match(self):
+        for query in self.QUERIES:
+            with self.subTest(query=query):
+                expected = self.client.get(f'/api/catering/menus/{query}').json()
+                actual = self.client.get(f'/api/async/catering/menus/{query}').json()
+                self.assertEqual(actual['count'], expected['count'])
+                self.assertEqual(actual['results'], expected['results'])
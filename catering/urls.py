@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import DishViewSet, SaladViewSet, WeddingMenuViewSet
+from .views import DishViewSet, SaladViewSet, WeddingMenuViewSet, CatalogSearchView
 
 router = DefaultRouter()
 router.register(r'dishes', DishViewSet, basename='dish')
@@ -10,5 +10,6 @@ router.register(r'menus', WeddingMenuViewSet, basename='menu')
 app_name = 'catering'
 
 urlpatterns = [
+    path('search/', CatalogSearchView.as_view(), name='catalog-search'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
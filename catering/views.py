@@ -1,8 +1,20 @@
-from rest_framework import viewsets, filters
+from decimal import Decimal, InvalidOperation
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
+from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from django_filters.rest_framework import DjangoFilterBackend
-from .models import Dish, Salad, WeddingMenu
+from venue.batch import BatchObjectCacheMixin
+from venue.fast_serializers import FastListMixin
+from venue.search import NormalizedSearchFilter
+from . import search
+from .fast_serializers import DishFastSerializer
+from .filters import SaladFilter, WeddingMenuFilter
+from .menu_builder import GROUPS, MAX_QUOTA, build_menus
+from .models import Dish, Salad, WeddingMenu, MenuDish, MenuSalad
 from .serializers import (
     DishSerializer,
     SaladSerializer,
@@ -11,13 +23,14 @@ from .serializers import (
 )
 
 
-class DishViewSet(viewsets.ModelViewSet):
+class DishViewSet(FastListMixin, viewsets.ModelViewSet):
     """Tagamlar ViewSet"""
     queryset = Dish.objects.filter(is_active=True)
     serializer_class = DishSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    fast_serializer_class = DishFastSerializer
+    filter_backends = [DjangoFilterBackend, NormalizedSearchFilter, filters.OrderingFilter]
     filterset_fields = ['category', 'is_vegetarian']
-    search_fields = ['name', 'description']
+    search_fields = ['search_key']
     ordering_fields = ['name', 'price', 'created_at']
     ordering = ['category', 'name']
 
@@ -26,18 +39,19 @@ class SaladViewSet(viewsets.ModelViewSet):
     """Salatlar ViewSet"""
     queryset = Salad.objects.filter(is_active=True)
     serializer_class = SaladSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['is_vegetarian']
-    search_fields = ['name', 'description', 'ingredients']
+    filter_backends = [DjangoFilterBackend, NormalizedSearchFilter, filters.OrderingFilter]
+    filterset_class = SaladFilter
+    search_fields = ['search_key']
     ordering_fields = ['name', 'price', 'created_at']
     ordering = ['name']
 
 
-class WeddingMenuViewSet(viewsets.ModelViewSet):
+class WeddingMenuViewSet(BatchObjectCacheMixin, viewsets.ModelViewSet):
     """Toý menýulary ViewSet"""
     queryset = WeddingMenu.objects.filter(is_active=True)
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    search_fields = ['name', 'description']
+    filter_backends = [DjangoFilterBackend, NormalizedSearchFilter, filters.OrderingFilter]
+    filterset_class = WeddingMenuFilter
+    search_fields = ['search_key']
     ordering_fields = ['name', 'price_per_person', 'created_at']
     ordering = ['-created_at']
     
@@ -46,6 +60,38 @@ class WeddingMenuViewSet(viewsets.ModelViewSet):
         if self.action == 'retrieve':
             return WeddingMenuDetailSerializer
         return WeddingMenuSerializer
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ('retrieve', 'calculate_price'):
+            # Menýu, tagamlar we salatlar - jemi 3 sorag
+            queryset = queryset.prefetch_related(
+                Prefetch('menudish_set', queryset=MenuDish.objects.select_related('dish')),
+                Prefetch('menusalad_set', queryset=MenuSalad.objects.select_related('salad')),
+            )
+        return queryset
+
+    def retrieve(self, request, *args, **kwargs):
+        """Doly menýu maglumaty, updated_at boýunça keşlenýär"""
+        timeout = settings.MENU_DETAIL_CACHE_TIMEOUT
+        if not timeout:
+            return super().retrieve(request, *args, **kwargs)
+
+        try:
+            updated_at = self.queryset.filter(pk=kwargs['pk']).values_list(
+                'updated_at', flat=True
+            ).first()
+        except (TypeError, ValueError):
+            updated_at = None
+        if updated_at is None:
+            return super().retrieve(request, *args, **kwargs)
+
+        cache_key = f"catering:menu-detail:{kwargs['pk']}:{updated_at.timestamp()}"
+        data = cache.get(cache_key)
+        if data is None:
+            data = super().retrieve(request, *args, **kwargs).data
+            cache.set(cache_key, data, timeout)
+        return Response(data)
     
     @action(detail=True, methods=['get'])
     def calculate_price(self, request, pk=None):
@@ -67,4 +113,97 @@ class WeddingMenuViewSet(viewsets.ModelViewSet):
             'guests_count': guests,
             'price_per_person': total_per_person,
             'total_price': total_for_guests
-        })
\ No newline at end of file
+        })
+
+    @action(detail=False, methods=['get'])
+    def build(self, request):
+        """
+        Býujete görä menýu düzmek.
+        Mysal: /menus/build/?budget=150&soup=1&main_course=2&salad=1&vegetarian=true
+        """
+        try:
+            budget = Decimal(request.query_params.get('budget', ''))
+            if not budget.is_finite() or budget < 0:
+                raise InvalidOperation
+        except InvalidOperation:
+            return Response(
+                {'error': 'budget gerek (bir adama düşýän baha)'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        quotas = {}
+        for group in GROUPS:
+            value = request.query_params.get(group)
+            if value is None:
+                continue
+            try:
+                quotas[group] = int(value)
+            except ValueError:
+                return Response(
+                    {'error': f'{group} san bolmaly'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if quotas[group] > MAX_QUOTA:
+                return Response(
+                    {'error': f'{group} iň köp {MAX_QUOTA} bolup biler'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        if not any(quotas.values()):
+            return Response(
+                {'error': f"Iň bolmanda bir topar gerek: {', '.join(GROUPS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            limit = min(max(int(request.query_params.get('limit', 5)), 1), 20)
+        except ValueError:
+            limit = 5
+        vegetarian = request.query_params.get('vegetarian', '').lower() in ('1', 'true')
+
+        candidates = build_menus(quotas, budget, vegetarian=vegetarian, limit=limit)
+
+        dish_ids = {pk for candidate in candidates for pk in candidate['dish_ids']}
+        salad_ids = {pk for candidate in candidates for pk in candidate['salad_ids']}
+        dishes = Dish.objects.in_bulk(dish_ids)
+        salads = Salad.objects.in_bulk(salad_ids)
+
+        return Response({
+            'budget': str(budget.quantize(Decimal('0.01'))),
+            'quotas': quotas,
+            'vegetarian': vegetarian,
+            'menus': [
+                {
+                    'total_price': str(candidate['total_price']),
+                    'dishes': DishSerializer(
+                        [dishes[pk] for pk in candidate['dish_ids']], many=True
+                    ).data,
+                    'salads': SaladSerializer(
+                        [salads[pk] for pk in candidate['salad_ids']], many=True
+                    ).data,
+                }
+                for candidate in candidates
+            ]
+        })
+
+
+class CatalogSearchView(APIView):
+    """
+    Tagamlar, salatlar we menýular boýunça bitewi gözleg.
+    Mysal: /api/catering/search/?q=cor&type=dish,salad&limit=10
+    """
+
+    def get(self, request):
+        query = request.query_params.get('q', '').strip()
+        kinds = request.query_params.get('type')
+        kinds = [kind.strip() for kind in kinds.split(',')] if kinds else None
+
+        try:
+            limit = min(max(int(request.query_params.get('limit', 20)), 1), 100)
+        except ValueError:
+            limit = 20
+
+        return Response({
+            'query': query,
+            'results': search.search(query, kinds=kinds, limit=limit) if query else []
+        })
@@ -0,0 +1,75 @@
+"""
+Async (ASGI) okamak görnüşleri üçin kömekçiler.
+
+Jogaplar DRF-iň JSONRenderer-i bilen döredilýär we sahypalara bölmek
+PageNumberPagination bilen deň formatda (count, next, previous, results),
+şonuň üçin müşderi sync we async API-leri tapawutlandyrmaýar.
+"""
+
+import math
+
+from django.http import HttpResponse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+PAGE_QUERY_PARAM = 'page'
+
+renderer = JSONRenderer()
+
+
+def json_response(data, status=200):
+    return HttpResponse(renderer.render(data), status=status, content_type='application/json')
+
+
+def not_found(model):
+    return json_response(
+        {'detail': f'No {model._meta.object_name} matches the given query.'},
+        status=404
+    )
+
+
+def page_size_from(request, page_size, size_param=None, max_page_size=None):
+    if not size_param:
+        return page_size
+    try:
+        size = int(request.GET[size_param])
+    except (KeyError, ValueError):
+        return page_size
+    if size <= 0:
+        return page_size
+    return min(size, max_page_size) if max_page_size else size
+
+
+async def paginate(request, queryset, serializer_class, page_size, size_param=None, max_page_size=None):
+    """Queryset-i async okap, DRF sahypa jogabyny gaýtarýar"""
+    size = page_size_from(request, page_size, size_param, max_page_size)
+
+    count = await queryset.acount()
+    num_pages = max(1, math.ceil(count / size))
+    page = request.GET.get(PAGE_QUERY_PARAM, 1)
+    if page == 'last':
+        page = num_pages
+    try:
+        page = int(page)
+    except (TypeError, ValueError):
+        page = 0
+    if page < 1 or page > num_pages:
+        return json_response({'detail': 'Invalid page.'}, status=404)
+
+    offset = (page - 1) * size
+    objects = [obj async for obj in queryset[offset:offset + size].aiterator(chunk_size=size)]
+
+    url = request.build_absolute_uri()
+    if page == 2:
+        previous_url = remove_query_param(url, PAGE_QUERY_PARAM)
+    elif page > 2:
+        previous_url = replace_query_param(url, PAGE_QUERY_PARAM, page - 1)
+    else:
+        previous_url = None
+
+    return json_response({
+        'count': count,
+        'next': replace_query_param(url, PAGE_QUERY_PARAM, page + 1) if page < num_pages else None,
+        'previous': previous_url,
+        'results': serializer_class(objects, many=True, context={'request': request}).data,
+    })
@@ -0,0 +1,168 @@
+"""
+Birnäçe GET soragyny bir HTTP soragynda ýerine ýetirmek (mobil tor üçin).
+
+POST /api/batch/
+  {"requests": [{"id": "property", "path": "/api/properties/5/"},
+                {"id": "dates", "path": "/api/properties/5/booked_dates/"},
+                {"path": "/api/catering/menus/?page=1"}]}
+->
+  {"responses": [{"id": "property", "status": 200, "body": {...}}, ...]}
+
+Içki soraglar urls.py-daky görnüşlere proses içinde (HTTP-siz) berilýär.
+Async görnüşler (/api/async/...) bir wagtda, sync görnüşler bir thread-de
+yzygiderli işleýär. Şol bir ýol iki gezek soralsa, bir gezek ýerine
+ýetirilýär. Batch-iň içinde get_object() netijeleri paýlaşylýar
+(BatchObjectCacheMixin), şonuň üçin jaýyň özi, booked_dates we
+availability bir jaý soragyny ulanýar.
+"""
+
+import asyncio
+import json
+import logging
+from contextvars import ContextVar
+from urllib.parse import urlsplit
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.http import HttpRequest, QueryDict
+from django.shortcuts import get_object_or_404
+from django.urls import Resolver404, resolve
+from django.views.decorators.csrf import csrf_exempt
+
+from venue.async_api import json_response
+from venue.db_router import read_only_request
+
+logger = logging.getLogger(__name__)
+
+API_PREFIX = '/api/'
+BATCH_PATH = '/api/batch/'
+# Sorag ediji barada maglumat: içki soraglara geçirilýär
+COPIED_ATTRIBUTES = ('user', 'auser', 'session')
+
+_cache = ContextVar('batch_cache', default=None)
+
+
+def current_cache():
+    """Batch-iň içinde paýlaşylýan sözlük, batch daşynda None"""
+    return _cache.get()
+
+
+class BatchObjectCacheMixin:
+    """
+    GenericAPIView üçin: batch-iň içinde şol bir SQL bilen alynýan obýekt
+    bir gezek okalýar (meselem jaý: retrieve, availability, booked_dates).
+    """
+
+    def get_object(self):
+        cache = current_cache()
+        if cache is None:
+            return super().get_object()
+
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        filters = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        sql, params = queryset.filter(**filters).query.sql_with_params()
+        prefetches = tuple(
+            getattr(lookup, 'prefetch_to', lookup) for lookup in queryset._prefetch_related_lookups
+        )
+        key = (queryset.model, sql, params, prefetches)
+        if key not in cache:
+            cache[key] = get_object_or_404(queryset, **filters)
+
+        obj = cache[key]
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+
+def error(status, message):
+    return {'status': status, 'body': {'error': message}}
+
+
+def sub_request(parent, path, query):
+    """Ene soragyň sözbaşylary we ulanyjysy bilen içki GET soragy"""
+    request = HttpRequest()
+    request.method = 'GET'
+    request.path = request.path_info = path
+    request.META = {
+        **{key: value for key, value in parent.META.items() if key not in ('CONTENT_TYPE', 'CONTENT_LENGTH')},
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': path,
+        'QUERY_STRING': query,
+    }
+    request.GET = QueryDict(query)
+    request.COOKIES = parent.COOKIES
+    for name in COPIED_ATTRIBUTES:
+        if hasattr(parent, name):
+            setattr(request, name, getattr(parent, name))
+    return request
+
+
+def to_result(response):
+    if getattr(response, 'streaming', False):
+        response.close()
+        return error(400, 'Akym (stream) jogaplary batch-de goldanmaýar')
+    if hasattr(response, 'render') and not response.is_rendered:
+        response.render()
+    content = response.content.decode(response.charset or 'utf-8')
+    if response.get('Content-Type', '').startswith('application/json'):
+        content = json.loads(content) if content else None
+    return {'status': response.status_code, 'body': content}
+
+
+async def execute(parent, url):
+    parts = urlsplit(url)
+    path = parts.path
+    if parts.scheme or parts.netloc or not path.startswith(API_PREFIX) or path.startswith(BATCH_PATH):
+        return error(400, f'path {API_PREFIX} bilen başlanmaly (batch-den başga)')
+    try:
+        match = resolve(path)
+    except Resolver404:
+        return error(404, 'Tapylmady')
+
+    request = sub_request(parent, path, parts.query)
+    request.resolver_match = match
+    try:
+        if iscoroutinefunction(match.func):
+            response = await match.func(request, *match.args, **match.kwargs)
+            return to_result(response)
+
+        def run():
+            return to_result(match.func(request, *match.args, **match.kwargs))
+        # thread_sensitive: sync görnüşler bir thread-de (ORM birikmesi bilen) yzygiderli
+        return await sync_to_async(run, thread_sensitive=True)()
+    except Exception:
+        logger.exception('Batch içki sorag şowsuz: %s', url)
+        return error(500, 'Içki ýalňyşlyk')
+
+
+@csrf_exempt
+async def batch_view(request):
+    """POST /api/batch/ - diňe GET içki soraglar (maglumat üýtgedilmeýär)"""
+    if request.method != 'POST':
+        return json_response({'error': 'Diňe POST'}, status=405)
+    try:
+        items = json.loads(request.body or b'{}').get('requests')
+    except (ValueError, AttributeError):
+        items = None
+    if not isinstance(items, list) or not items:
+        return json_response({'error': 'requests sanawy gerek'}, status=400)
+    if len(items) > settings.BATCH_MAX_REQUESTS:
+        return json_response({'error': f'Iň köp {settings.BATCH_MAX_REQUESTS} sorag'}, status=400)
+    if not all(isinstance(item, dict) and isinstance(item.get('path'), str) for item in items):
+        return json_response({'error': 'Her sorag {"path": "/api/..."} bolmaly'}, status=400)
+
+    # Şol bir ýol bir gezek ýerine ýetirilýär
+    urls = list(dict.fromkeys(item['path'] for item in items))
+    token = _cache.set({})
+    try:
+        with read_only_request(request):
+            results = dict(zip(urls, await asyncio.gather(*(execute(request, url) for url in urls))))
+    finally:
+        _cache.reset(token)
+
+    return json_response({
+        'responses': [
+            {'id': item.get('id', index), **results[item['path']]}
+            for index, item in enumerate(items)
+        ]
+    })
@@ -0,0 +1,122 @@
+"""
+Okamak/ýazmak maglumat bazasy router-i.
+
+Howpsuz (GET, HEAD, OPTIONS) soraglaryň okamalary replikalara iberilýär,
+ýazgylar elmydama 'default' (esasy) bazada bolýar. Sorag bir gezek ýazsa,
+şol soragyň galan okamalary hem esasy baza geçýär. PrimaryPinningMiddleware
+ýazgydan soň müşderini DB_PRIMARY_PIN_SECONDS sekunt esasy baza berkidýär,
+şeýlelikde replikanyň gijä galmagy öz ýazgyňy görmäge päsgel bermeýär.
+"""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+PRIMARY = 'default'
+PIN_COOKIE = 'db_primary_pin'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+_pinned = ContextVar('db_primary_pinned', default=False)
+_wrote = ContextVar('db_primary_wrote', default=False)
+
+
+def pin_to_primary():
+    return _pinned.set(True)
+
+
+def is_pinned():
+    return _pinned.get()
+
+
+@contextmanager
+def read_only_request(request):
+    """
+    Diňe okaýan POST soragy (meselem /api/batch/) GET ýaly işleýär:
+    okamalar replikalara gidýär we jogap müşderini esasy baza berkitmeýär.
+    """
+    request.db_read_only = True
+    token = _pinned.set(PIN_COOKIE in request.COOKIES)
+    try:
+        yield
+    finally:
+        _pinned.reset(token)
+
+
+class PrimaryReplicaRouter:
+
+    def db_for_read(self, model, **hints):
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db:
+            return instance._state.db
+        if not settings.DATABASE_REPLICAS or _pinned.get():
+            return PRIMARY
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(self, model, **hints):
+        _pinned.set(True)
+        _wrote.set(True)
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replikalar esasy bazanyň nusgasy, şonuň üçin hemme baglanyşyk dogry
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == PRIMARY
+
+
+class PrimaryPinningMiddleware:
+    """Howpsuz däl soraglary we ýaňy ýazan müşderileri esasy baza berkidýär"""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        tokens = self.start(request)
+        try:
+            response = self.get_response(request)
+            wrote = _wrote.get()
+        finally:
+            self.finish(tokens)
+        return self.process_response(request, response, wrote)
+
+    async def __acall__(self, request):
+        tokens = self.start(request)
+        try:
+            response = await self.get_response(request)
+            wrote = _wrote.get()
+        finally:
+            self.finish(tokens)
+        return self.process_response(request, response, wrote)
+
+    def start(self, request):
+        writes = request.method not in SAFE_METHODS
+        return (
+            _pinned.set(writes or PIN_COOKIE in request.COOKIES),
+            _wrote.set(False),
+        )
+
+    def finish(self, tokens):
+        _pinned.reset(tokens[0])
+        _wrote.reset(tokens[1])
+
+    def process_response(self, request, response, wrote):
+        writes = request.method not in SAFE_METHODS and not getattr(request, 'db_read_only', False)
+        if (writes or wrote) and settings.DATABASE_REPLICAS and settings.DB_PRIMARY_PIN_SECONDS:
+            response.set_cookie(
+                PIN_COOKIE,
+                '1',
+                max_age=settings.DB_PRIMARY_PIN_SECONDS,
+                httponly=True,
+                samesite='Lax'
+            )
+        return response
@@ -0,0 +1,189 @@
+"""
+Köp ulanylýan sanaw (list) jogaplary üçin ýeňil, diňe okamak serializer-leri.
+
+ModelSerializer her setir üçin model obýektini döredýär we her meýdan
+üçin get_attribute/to_representation zynjyryny işledýär. FastSerializer
+şol bir serializer-iň meýdanlaryndan bir gezek "konwerterler" düzýär we
+jogaby values() setirlerinden gurýar. Çykyş ModelSerializer bilen
+baýtma-baýt deň bolmaly (bench_fast_serializers barlaýar).
+
+Ýönekeý meýdanlar (model meýdany, 'property.title', get_X_display)
+awtomatik düzülýär. SerializerMethodField we içki (nested) serializer-ler
+üçin subklas field_<ady>(row) usulyny we gerek bolsa prefetch(rows)
+usulyny (tutuş sahypa üçin bir sorag) kesgitleýär.
+"""
+
+import decimal
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+
+def decimal_converter(field):
+    """DecimalField.to_representation bilen deň, quantize parametrleri öňünden hasaplanan"""
+    coerce_to_string = getattr(field, 'coerce_to_string', api_settings.COERCE_DECIMAL_TO_STRING)
+    if not coerce_to_string or field.localize or field.normalize_output or field.decimal_places is None:
+        return field.to_representation
+
+    quantum = decimal.Decimal('.1') ** field.decimal_places
+    context = decimal.getcontext().copy()
+    if field.max_digits is not None:
+        context.prec = field.max_digits
+    rounding = field.rounding
+
+    def convert(value):
+        if not isinstance(value, decimal.Decimal):
+            value = decimal.Decimal(str(value).strip())
+        return f'{value.quantize(quantum, rounding=rounding, context=context):f}'
+    return convert
+
+
+def datetime_converter(field):
+    """DateTimeField.to_representation (ISO 8601) bilen deň, wagt zolagy bir gezek alynýar"""
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    field_timezone = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+    if output_format is None or output_format.lower() != 'iso-8601' or field_timezone is None:
+        return field.to_representation
+
+    def convert(value):
+        value = value.astimezone(field_timezone).isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+    return convert
+
+
+def date_converter(field):
+    output_format = getattr(field, 'format', api_settings.DATE_FORMAT)
+    if output_format is None or output_format.lower() != 'iso-8601':
+        return field.to_representation
+    return lambda value: value.isoformat()
+
+
+def identity(value):
+    return value
+
+
+CONVERTERS = [
+    (serializers.DecimalField, decimal_converter),
+    (serializers.DateTimeField, datetime_converter),
+    (serializers.DateField, date_converter),
+    (serializers.BooleanField, lambda field: identity),
+    (serializers.IntegerField, lambda field: int),
+    (serializers.PrimaryKeyRelatedField, lambda field: identity),
+    (serializers.ChoiceField, lambda field: field.to_representation),
+    (serializers.CharField, lambda field: str),
+]
+
+
+def compile_converter(field):
+    for field_class, factory in CONVERTERS:
+        if isinstance(field, field_class):
+            return factory(field)
+    return field.to_representation
+
+
+_compiled = {}
+
+
+class FastSerializer:
+    """
+    serializer_class-yň çykyşyny values() setirlerinden gurýar.
+    Subklas: field_<ady>(row) - ýörite meýdanlar, extra_values - olar üçin
+    goşmaça values() açarlary, prefetch(rows) - sahypa üçin goşmaça soraglar.
+    """
+    serializer_class = None
+    extra_values = ()
+
+    def __init__(self, context=None):
+        self.context = context or {}
+        self.request = self.context.get('request')
+        fields, self.lookups = self.compile()
+        self.fields = [
+            (name, lookup, getattr(self, convert) if lookup is None else convert)
+            for name, lookup, convert in fields
+        ]
+
+    @classmethod
+    def compile(cls):
+        """Meýdanlar her klas (we wagt zolagy) üçin bir gezek düzülýär"""
+        key = (cls, timezone.get_current_timezone_name())
+        if key not in _compiled:
+            fields = []
+            lookups = {'pk', *cls.extra_values}
+            model = cls.serializer_class.Meta.model
+            for name, field in cls.serializer_class().fields.items():
+                if field.write_only:
+                    continue
+                if hasattr(cls, f'field_{name}'):
+                    fields.append((name, None, f'field_{name}'))
+                    continue
+                lookup, convert = cls.compile_field(model, field)
+                lookups.add(lookup)
+                fields.append((name, lookup, convert))
+            _compiled[key] = fields, sorted(lookups)
+        return _compiled[key]
+
+    @classmethod
+    def compile_field(cls, model, field):
+        source = field.source
+        if isinstance(field, serializers.PrimaryKeyRelatedField):
+            return model._meta.get_field(source).attname, identity
+        if source.startswith('get_') and source.endswith('_display'):
+            # get_category_display -> choices sözlügi
+            model_field = model._meta.get_field(source[4:-8])
+            choices = {str(key): str(label) for key, label in model_field.flatchoices}
+            return model_field.attname, lambda value: choices.get(str(value), value)
+        if '.' in source:
+            return source.replace('.', '__'), compile_converter(field)
+        if source == '*' or isinstance(field, serializers.BaseSerializer):
+            raise TypeError(f'{cls.__name__}: {field.field_name} üçin field_{field.field_name} gerek')
+        return model._meta.get_field(source).attname, compile_converter(field)
+
+    def values(self, queryset):
+        return queryset.values(*self.lookups)
+
+    def prefetch(self, rows):
+        """Içki maglumatlary tutuş sahypa üçin bir gezekde ýüklemek"""
+
+    def to_representation(self, row):
+        data = {}
+        for name, lookup, convert in self.fields:
+            if lookup is None:
+                data[name] = convert(row)
+            else:
+                value = row[lookup]
+                data[name] = None if value is None else convert(value)
+        return data
+
+    def many(self, rows):
+        rows = list(rows)
+        self.prefetch(rows)
+        return [self.to_representation(row) for row in rows]
+
+
+class FastListMixin:
+    """
+    ViewSet üçin: list() jogaby fast_serializer_class bilen gurulýar.
+    settings.FAST_LIST_SERIALIZERS = False bolsa adaty serializer ulanylýar.
+    """
+    fast_serializer_class = None
+
+    def get_fast_serializer_class(self):
+        return self.fast_serializer_class
+
+    def list(self, request, *args, **kwargs):
+        fast_serializer_class = self.get_fast_serializer_class()
+        if fast_serializer_class is None or not settings.FAST_LIST_SERIALIZERS:
+            return super().list(request, *args, **kwargs)
+
+        serializer = fast_serializer_class(context=self.get_serializer_context())
+        rows = serializer.values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(serializer.many(page))
+        return Response(serializer.many(rows))
+
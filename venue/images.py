@@ -0,0 +1,71 @@
+"""
+Suratlaryň metadata-sy: ölçegleri, ululygy, esasy reňki we kiçijik
+LQIP (low quality image placeholder) suraty.
+
+Müşderi kartoçkany surat ýüklenmezden öň dogry ölçegde we reňkde
+çyzyp bilýär. Diňe Pillow ulanylýar; funksiýalar Django-a bagly däl,
+şonuň üçin backfill_image_metadata olary aýratyn prosesslerde işledýär.
+"""
+
+import base64
+import io
+
+from PIL import Image, ImageOps
+
+PLACEHOLDER_SIZE = 16
+EXIF_ORIENTATION = 0x0112
+PLACEHOLDER_QUALITY = 50
+EMPTY = {'width': None, 'height': None, 'size': None, 'dominant_color': '', 'placeholder': ''}
+
+
+def flatten(image):
+    """Aç-açyk (alpha) suratlary ak fonda RGB-a öwürýär"""
+    image = ImageOps.exif_transpose(image)
+    if image.mode in ('RGBA', 'LA', 'P'):
+        image = image.convert('RGBA')
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel('A'))
+        return background
+    return image.convert('RGB')
+
+
+def dominant_color(image):
+    """Iň köp duşýan reňk '#rrggbb' (64px nusgada 5 reňke çenli kwantlanan)"""
+    sample = image.copy()
+    sample.thumbnail((64, 64))
+    quantized = sample.quantize(colors=5)
+    _, index = max(quantized.getcolors())
+    red, green, blue = quantized.getpalette()[index * 3:index * 3 + 3]
+    return f'#{red:02x}{green:02x}{blue:02x}'
+
+
+def placeholder(image):
+    """16px JPEG data URI (adatça 300-700 baýt)"""
+    thumbnail = image.copy()
+    thumbnail.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE))
+    buffer = io.BytesIO()
+    thumbnail.save(buffer, 'JPEG', quality=PLACEHOLDER_QUALITY, optimize=True)
+    return 'data:image/jpeg;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def image_metadata(file, size=None):
+    """
+    Faýldan (ýol ýa-da açyk faýl) metadata: {'width', 'height', 'size',
+    'dominant_color', 'placeholder'}. Surat açylmasa EMPTY gaýtarylýar.
+    """
+    try:
+        with Image.open(file) as source:
+            width, height = source.size
+            if source.getexif().get(EXIF_ORIENTATION) in (5, 6, 7, 8):
+                width, height = height, width  # surat 90° öwrülip görkezilýär
+            source.draft('RGB', (256, 256))  # JPEG: doly ölçegde açmazdan kiçeldip okamak
+            image = flatten(source)
+            return {
+                'width': width,
+                'height': height,
+                'size': size,
+                'dominant_color': dominant_color(image),
+                'placeholder': placeholder(image),
+            }
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return dict(EMPTY, size=size)
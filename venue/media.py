@@ -0,0 +1,162 @@
+"""
+Media faýllaryny production-da bermek (SERVE_MEDIA=True bolanda, venue/urls.py).
+
+- MEDIA_SENDFILE sazlanan bolsa, faýly front proksi (nginx X-Accel-Redirect,
+  Apache X-Sendfile) berýär, Django diňe sözbaşylary goýýar.
+- Bolmasa, FileResponse ulanylýar: WSGI serweriň wsgi.file_wrapper-i
+  (sendfile) arkaly faýl ýatda göçürilmezden iberilýär.
+- Range (bir aralyk), If-Range we If-Modified-Since goldanylýar.
+- Mazmun hash-y boýunça saklanýan faýllar (images/cas/...) hiç haçan
+  üýtgemeýär, olar bir ýyllyk "immutable" keş bilen berilýär.
+
+Serializer-ler üçin media_url(): doly URL-iň prefiksi (MEDIA_CDN_URL ýa-da
+scheme/host + MEDIA_URL) her sorag üçin bir gezek hasaplanýar, galany
+ýönekeý setir birikdirmek. Her obýekt üçin FieldFile.url we
+request.build_absolute_uri() çagyrylmaýar.
+"""
+
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.encoding import filepath_to_uri
+from django.utils.http import http_date, parse_http_date_safe
+from django.views.decorators.http import require_safe
+from django.views.static import was_modified_since
+
+from .storage import is_immutable
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+CHUNK_SIZE = 64 * 1024
+
+
+def media_base_url(request=None):
+    """Media URL-leriniň prefiksi; sorag obýektinde keşlenýär"""
+    if settings.MEDIA_CDN_URL:
+        return settings.MEDIA_CDN_URL
+    if request is None:
+        return settings.MEDIA_URL
+    base = getattr(request, '_media_base_url', None)
+    if base is None:
+        base = request._media_base_url = request.build_absolute_uri(settings.MEDIA_URL)
+    return base
+
+
+def media_url(name, request=None):
+    """Saklanýan faýl ýolundan doly URL (FileSystemStorage.url + build_absolute_uri bilen deň)"""
+    if not name:
+        return None
+    return media_base_url(request) + filepath_to_uri(name)
+
+
+def parse_range(header, size):
+    """'bytes=0-99' -> (0, 99); goldanylmaýan format üçin None, kanagatlandyrylmaýan üçin ValueError"""
+    match = RANGE_RE.match(header.strip())
+    if not match:
+        return None  # köp aralyk ýa-da başga birlik: doly faýl berilýär
+    start, end = match.groups()
+    if not start:
+        if not end:
+            return None
+        # bytes=-500: soňky 500 baýt
+        start, end = max(size - int(end), 0), size - 1
+    else:
+        start, end = int(start), min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        raise ValueError('Range kanagatlandyrylmaýar')
+    return start, end
+
+
+def read_range(path, start, length):
+    with open(path, 'rb') as file:
+        file.seek(start)
+        while length > 0:
+            chunk = file.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def sendfile_response(path, full_path):
+    content_type, _ = mimetypes.guess_type(full_path)
+    response = HttpResponse(content_type=content_type or 'application/octet-stream')
+    if settings.MEDIA_SENDFILE == 'x-accel-redirect':
+        response['X-Accel-Redirect'] = settings.MEDIA_ACCEL_REDIRECT_PREFIX + quote(path)
+    else:
+        response['X-Sendfile'] = full_path
+    return response
+
+
+@require_safe
+def serve_media(request, path):
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404
+    try:
+        stat = os.stat(full_path)
+    except OSError:
+        raise Http404
+    if not os.path.isfile(full_path):
+        raise Http404
+
+    last_modified = http_date(stat.st_mtime)
+    if not was_modified_since(request.headers.get('If-Modified-Since'), stat.st_mtime):
+        response = HttpResponseNotModified()
+    elif settings.MEDIA_SENDFILE:
+        # Proksi Range we If-Modified-Since soraglaryny özi işleýär
+        response = sendfile_response(path, full_path)
+    else:
+        response = file_response(request, full_path, stat, last_modified)
+
+    response['Last-Modified'] = last_modified
+    response['Cache-Control'] = (
+        IMMUTABLE_CACHE_CONTROL if is_immutable(path)
+        else f'public, max-age={settings.MEDIA_CACHE_MAX_AGE}'
+    )
+    return response
+
+
+def file_response(request, full_path, stat, last_modified):
+    content_type, encoding = mimetypes.guess_type(full_path)
+    content_type = content_type or 'application/octet-stream'
+    size = stat.st_size
+
+    range_header = request.headers.get('Range')
+    if_range = request.headers.get('If-Range')
+    if range_header and if_range and parse_http_date_safe(if_range) != int(stat.st_mtime):
+        # Faýl üýtgän: doly faýl berilýär
+        range_header = None
+
+    byte_range = None
+    if range_header and size:
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+
+    if byte_range is None:
+        response = FileResponse(open(full_path, 'rb'), content_type=content_type)
+    else:
+        start, end = byte_range
+        response = StreamingHttpResponse(
+            read_range(full_path, start, end - start + 1),
+            status=206,
+            content_type=content_type
+        )
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = str(end - start + 1)
+
+    if encoding:
+        response['Content-Encoding'] = encoding
+    response['Accept-Ranges'] = 'bytes'
+    return response
@@ -0,0 +1,68 @@
+"""
+Proses içindäki ýönekeý pub/sub (SSE akymlary üçin).
+
+Ýazyjy (sync görnüş, signal, fon işi) publish(channel, event) çagyrýar,
+okyjy (async SSE görnüşi) subscribe(channels) bilen öz asyncio nobatyny
+alýar. Publish islendik thread-den howpsuz: waka okyjynyň event loop-yna
+call_soon_threadsafe bilen berilýär.
+
+Okyjy haýal bolsa nobat dolýar we iň köne waka taşlanýar (her waka doly
+ýagdaýy saklaýar, şonuň üçin soňky waka ýeterlik).
+
+LocalBroker diňe bir prosesiň içinde işleýär; birnäçe proses üçin
+subklas publish()-i paýlaşylýan ýere ýazmaly we deliver() bilen ýaýratmaly
+(meselem venues/events.py DatabaseBroker).
+"""
+
+import asyncio
+import threading
+from collections import defaultdict
+from contextlib import asynccontextmanager
+
+QUEUE_SIZE = 100
+
+
+def offer(queue, event):
+    """Nobat doly bolsa iň köne wakany taşlap goýýar (loop thread-inde)"""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(event)
+
+
+class LocalBroker:
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscribers = defaultdict(set)  # kanal -> {(loop, queue)}
+
+    def has_subscribers(self, channel):
+        """Waka taýýarlamak gymmat bolsa, okyjy ýok wagty ony geçmek üçin"""
+        return bool(self.subscribers.get(channel))
+
+    def publish(self, channel, event):
+        self.deliver(channel, event)
+
+    def deliver(self, channel, event):
+        with self.lock:
+            targets = list(self.subscribers.get(channel, ()))
+        for loop, queue in targets:
+            try:
+                loop.call_soon_threadsafe(offer, queue, event)
+            except RuntimeError:
+                pass  # loop ýapyldy, okyjy gidýär
+
+    @asynccontextmanager
+    async def subscribe(self, channels):
+        """async with broker.subscribe(['a', 'b']) as queue: event = await queue.get()"""
+        entry = (asyncio.get_running_loop(), asyncio.Queue(maxsize=QUEUE_SIZE))
+        with self.lock:
+            for channel in channels:
+                self.subscribers[channel].add(entry)
+        try:
+            yield entry[1]
+        finally:
+            with self.lock:
+                for channel in channels:
+                    self.subscribers[channel].discard(entry)
+                    if not self.subscribers[channel]:
+                        del self.subscribers[channel]
@@ -0,0 +1,77 @@
+"""
+Gözleg üçin tekst normalizasiýasy.
+
+Maglumatlarda türkmen latyn (Çorba, Dograma) we rus kiril (Том ям, Цезарь)
+ýazgylary garyşyk. Ähli gözleg açarlary bir görnüşe getirilýär: kiçi harplar,
+diakritiki belgisiz, kiril harplary latyn harplaryna geçirilen. Şeýlelikde
+"Şaşlyk", "шашлык" we "shashlyk" birmeňzeş açar berýär: "shashlyk".
+"""
+
+import re
+import unicodedata
+
+from rest_framework import filters
+
+# Kiril (rus we türkmen) -> latyn
+CYRILLIC = {
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'e',
+    'ж': 'zh', 'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm',
+    'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u',
+    'ф': 'f', 'х': 'h', 'ц': 'ts', 'ч': 'ch', 'ш': 'sh', 'щ': 'sch', 'ъ': '',
+    'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya',
+    'ә': 'a', 'ө': 'o', 'ү': 'u', 'җ': 'j', 'ң': 'n',
+}
+
+# Türkmen latyn harplary kiril transliterasiýasy bilen gabat gelmeli
+TURKMEN_LATIN = {
+    'ç': 'ch', 'ş': 'sh', 'ž': 'zh', 'ý': 'y', 'ň': 'n',
+    'ä': 'a', 'ö': 'o', 'ü': 'u',
+}
+
+TRANSLITERATION = str.maketrans({**CYRILLIC, **TURKMEN_LATIN})
+NON_WORD = re.compile(r'[\W_]+')
+
+
+def normalize_search_text(value):
+    """Teksti gözleg açaryna öwürýär: 'Çorba, Том ям!' -> 'chorba tom yam'"""
+    if not value:
+        return ''
+    value = unicodedata.normalize('NFC', str(value)).casefold()
+    value = value.translate(TRANSLITERATION)
+    value = ''.join(
+        char for char in unicodedata.normalize('NFKD', value)
+        if not unicodedata.combining(char)
+    )
+    return NON_WORD.sub(' ', value).strip()
+
+
+def build_search_key(*values):
+    return ' '.join(filter(None, (normalize_search_text(value) for value in values)))
+
+
+class SearchKeyMixin:
+    """
+    Modeliň search_key meýdanyny her save() wagtynda täzeleýär.
+    Modelde search_key_fields = ('name', 'description') görkezilmeli.
+    """
+    search_key_fields = ()
+
+    def refresh_search_key(self):
+        self.search_key = build_search_key(
+            *(getattr(self, field) for field in self.search_key_fields)
+        )
+
+    def save(self, *args, **kwargs):
+        self.refresh_search_key()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'search_key'}
+        super().save(*args, **kwargs)
+
+
+class NormalizedSearchFilter(filters.SearchFilter):
+    """SearchFilter, gözleg sözlerini search_key bilen deň görnüşe getirýär"""
+
+    def get_search_terms(self, request):
+        terms = super().get_search_terms(request)
+        return normalize_search_text(' '.join(terms)).split()
@@ -12,7 +12,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 
 import os
 from pathlib import Path
-from decouple import config
+from decouple import config, Csv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -42,6 +42,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
+    'venue.db_router.PrimaryPinningMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -74,13 +75,51 @@ WSGI_APPLICATION = 'venue.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# SQLite her täze birikmede şu PRAGMA-lar bilen sazlanýar:
+# WAL - okaýjylar ýazýanlara garaşmaýar, busy_timeout - gulp boşaýança garaşmak
+SQLITE_PRAGMAS = {
+    'journal_mode': config('SQLITE_JOURNAL_MODE', default='WAL'),
+    'synchronous': config('SQLITE_SYNCHRONOUS', default='NORMAL'),
+    'busy_timeout': config('SQLITE_BUSY_TIMEOUT', default=5000, cast=int),
+    'mmap_size': config('SQLITE_MMAP_SIZE', default=128 * 1024 * 1024, cast=int),
+    'cache_size': config('SQLITE_CACHE_SIZE', default=-20000, cast=int),  # KiB
+    'temp_store': 'MEMORY',
+}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=600, cast=int),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'init_command': ';'.join(
+                f'PRAGMA {name}={value}' for name, value in SQLITE_PRAGMAS.items()
+            ),
+            # Ýazmak üçin gulpy tranzaksiýanyň başynda almak (SQLITE_BUSY ýalňyşlyklarynyň öňüni alýar)
+            'transaction_mode': config('SQLITE_TRANSACTION_MODE', default='IMMEDIATE'),
+        },
     }
 }
 
+# Okamak üçin replikalar (vergül bilen sanaw). SQLite üçin faýl ýollary,
+# beýleki baza hereketlendirijileri üçin replikanyň HOST-y.
+DB_REPLICAS = config('DB_REPLICAS', default='', cast=Csv())
+DATABASE_REPLICAS = []
+for index, replica in enumerate(DB_REPLICAS, start=1):
+    alias = f'replica_{index}'
+    location = 'NAME' if DATABASES['default']['ENGINE'].endswith('sqlite3') else 'HOST'
+    DATABASES[alias] = {
+        **DATABASES['default'],
+        location: replica,
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ['venue.db_router.PrimaryReplicaRouter']
+# Ýazgydan soň müşderiniň okamalary näçe sekunt esasy bazadan bolmaly
+DB_PRIMARY_PIN_SECONDS = config('DB_PRIMARY_PIN_SECONDS', default=5, cast=int)
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -118,6 +157,27 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Media faýllary bermek (venue/media.py):
+#   SERVE_MEDIA = True bolanda Django media ýollaryny özi hyzmat edýär (öňünden
+#   diňe DEBUG-da); production-da media adatça nginx/CDN tarapyndan berilýär.
+#   MEDIA_SENDFILE = 'x-accel-redirect' (nginx) ýa-da 'x-sendfile' (Apache/lighttpd),
+#   boş bolsa faýl Django tarapyndan FileResponse bilen berilýär.
+#   X-Accel-Redirect üçin nginx-de: location /protected-media/ { internal; alias <MEDIA_ROOT>/; }
+SERVE_MEDIA = config('SERVE_MEDIA', default=DEBUG, cast=bool)
+MEDIA_SENDFILE = config('MEDIA_SENDFILE', default='')
+MEDIA_ACCEL_REDIRECT_PREFIX = config('MEDIA_ACCEL_REDIRECT_PREFIX', default='/protected-media/')
+MEDIA_CACHE_MAX_AGE = config('MEDIA_CACHE_MAX_AGE', default=3600, cast=int)
+# Suratlar CDN arkaly berilse, URL-leriň prefiksi (meselem https://cdn.example.com/media/)
+MEDIA_CDN_URL = config('MEDIA_CDN_URL', default='')
+if MEDIA_CDN_URL and not MEDIA_CDN_URL.endswith('/'):
+    MEDIA_CDN_URL += '/'
+
+# Sanaw jogaplaryny values() setirlerinden gurmak (venue/fast_serializers.py)
+FAST_LIST_SERIALIZERS = config('FAST_LIST_SERIALIZERS', default=True, cast=bool)
+
+# Sorag bolmadyk ýerde (meselem, offline katalog suratynda) doly URL gurmak üçin
+SITE_URL = config('SITE_URL', default='http://localhost:8000')
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
@@ -151,3 +211,63 @@ SPECTACULAR_SETTINGS = {
     'VERSION': '1.0.0',
     'SERVE_INCLUDE_SCHEMA': False,
 }
+
+# Catering settings
+# Toý menýusynyň doly maglumatyny keşlemek (sekunt, 0 = öçük)
+MENU_DETAIL_CACHE_TIMEOUT = config('MENU_DETAIL_CACHE_TIMEOUT', default=0, cast=int)
+
+# Delta sinhronizasiýa (/api/sync/)
+# Pozulan ýazgylaryň yzy näçe gün saklanýar; has köne since doly sinhronizasiýa berýär
+SYNC_TOMBSTONE_DAYS = config('SYNC_TOMBSTONE_DAYS', default=90, cast=int)
+# next_since şu sekunt öňräk bellenýär (tamamlanmadyk tranzaksiýalar üçin)
+SYNC_OVERLAP_SECONDS = config('SYNC_OVERLAP_SECONDS', default=5, cast=int)
+
+# Bronlaryň ýaşaýyş tapgyry (process_bookings)
+# Tassyklanmadyk (pending) bron şu sagatdan soň 'expired' bolýar we seneleri boşadýar
+BOOKING_PENDING_TTL_HOURS = config('BOOKING_PENDING_TTL_HOURS', default=48, cast=int)
+# Gutarnykly bronlar çykyş senesinden şu günden soň arhiwe geçirilýär (archive_bookings)
+BOOKING_ARCHIVE_AFTER_DAYS = config('BOOKING_ARCHIVE_AFTER_DAYS', default=365, cast=int)
+# Idempotency-Key bilen saklanan jogaplaryň möhleti (sagat)
+IDEMPOTENCY_KEY_TTL_HOURS = config('IDEMPOTENCY_KEY_TTL_HOURS', default=24, cast=int)
+# Şu sekuntdan köp jogapsyz galan açar (işçi öldi) täzeden eýelenip bilner
+IDEMPOTENCY_LOCK_TIMEOUT = config('IDEMPOTENCY_LOCK_TIMEOUT', default=60, cast=int)
+
+# Fon işleriniň nobaty (venues/tasks.py, run_tasks buýrugy)
+# True: işler nobatsyz, tranzaksiýadan soň şol bada ýerine ýetirilýär (işçi gerek däl)
+TASKS_EAGER = config('TASKS_EAGER', default=False, cast=bool)
+TASK_WORKER_CONCURRENCY = config('TASK_WORKER_CONCURRENCY', default=4, cast=int)
+# Şu sekuntdan köp 'running' bolan iş (işçi ölen) nobata gaýtarylýar
+TASK_LOCK_TIMEOUT = config('TASK_LOCK_TIMEOUT', default=600, cast=int)
+TASK_RETRY_MAX_DELAY = config('TASK_RETRY_MAX_DELAY', default=3600, cast=int)
+
+# Elýeterlilik wakalary (SSE, venues/events.py)
+# 'local' - bir proses; 'database' - birnäçe proses (wakalar tablisa arkaly)
+# 'local' bilen diňe SSE serweriniň öz prosesindäki üýtgeşmeler iberilýär:
+# başga prosesler (process_bookings cron-y, run_tasks, admin başga serwerde)
+# wakany okyjylara ýetirip bilmeýär. Olar üçin 'database' gerek.
+PUBSUB_BACKEND = config('PUBSUB_BACKEND', default='local')
+PUBSUB_POLL_INTERVAL = config('PUBSUB_POLL_INTERVAL', default=1.0, cast=float)
+PUBSUB_EVENT_RETENTION = config('PUBSUB_EVENT_RETENTION', default=3600, cast=int)
+# SSE birikmesini açyk saklamak üçin boş teswir (sekunt)
+SSE_HEARTBEAT_SECONDS = config('SSE_HEARTBEAT_SECONDS', default=15, cast=int)
+SSE_MAX_PROPERTIES = config('SSE_MAX_PROPERTIES', default=50, cast=int)
+
+# Jaýlaryň facet sanlary (/api/properties/?facets=true): kategoriýalar we filtersiz katalog keşi (sekunt)
+PROPERTY_FACETS_CACHE_TIMEOUT = config('PROPERTY_FACETS_CACHE_TIMEOUT', default=300, cast=int)
+
+# /api/batch/ - bir soragdaky içki GET soraglaryň iň köp sany
+BATCH_MAX_REQUESTS = config('BATCH_MAX_REQUESTS', default=20, cast=int)
+
+# Email (bron habarnamalary)
+EMAIL_BACKEND = config('EMAIL_BACKEND', default='django.core.mail.backends.console.EmailBackend')
+EMAIL_HOST = config('EMAIL_HOST', default='localhost')
+EMAIL_PORT = config('EMAIL_PORT', default=25, cast=int)
+EMAIL_HOST_USER = config('EMAIL_HOST_USER', default='')
+EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')
+EMAIL_USE_TLS = config('EMAIL_USE_TLS', default=False, cast=bool)
+DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default='noreply@localhost')
+
+# Offline katalog suratynyň (snapshot) saklanýan ýeri
+CATALOG_SNAPSHOT_DIR = config('CATALOG_SNAPSHOT_DIR', default=str(BASE_DIR / 'snapshots'))
+# Katalog üýtgänden näçe sekunt soň surat fon işinde täzeden gurulýar
+CATALOG_SNAPSHOT_REBUILD_DELAY = config('CATALOG_SNAPSHOT_REBUILD_DELAY', default=10, cast=int)
@@ -0,0 +1,71 @@
+"""
+Mazmun boýunça salgylanýan (content-addressed) media ammary.
+
+Ýüklenen faýlyň sha256 hash-y bölekleýin (chunks) hasaplanýar we faýl
+images/cas/ab/cd/<hash>.<ext> ýolunda saklanýar. Şol bir surat birnäçe
+jaýa ýa-da kategoriýa ýüklense, diskde bir gezek saklanýar we hemişe şol
+bir URL-i alýar. Mazmun üýtgände URL hem üýtgeýär, şonuň üçin bu ýollar
+üýtgemeýän (immutable) hasaplanýar we bir ýyllyk keş bilen berlip bilner.
+
+Faýllar birnäçe ýazgy tarapyndan ulanylyp bilner, şonuň üçin ýazgy
+pozulanda faýl pozulmaly däl.
+"""
+
+import hashlib
+import os
+import re
+
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+CAS_PREFIX = 'images/cas/'
+EXTENSION_ALIASES = {'jpeg': 'jpg'}
+
+
+def content_hash(content):
+    """Faýlyň sha256 hash-y, ýat ulanylyşy faýlyň ululygyna bagly däl"""
+    digest = hashlib.sha256()
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    for chunk in content.chunks():
+        digest.update(chunk)
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    return digest.hexdigest()
+
+
+def content_path(digest, filename):
+    """images/cas/ab/cd/<hash>.<ext>"""
+    ext = os.path.splitext(filename or '')[1].lstrip('.').lower()
+    ext = EXTENSION_ALIASES.get(ext, ext)
+    suffix = f'.{ext}' if re.fullmatch(r'[a-z0-9]{1,5}', ext) else ''
+    return f'{CAS_PREFIX}{digest[:2]}/{digest[2:4]}/{digest}{suffix}'
+
+
+def is_immutable(name):
+    """Bu ýoldaky faýlyň mazmuny hiç haçan üýtgemeýär"""
+    return name.startswith(CAS_PREFIX)
+
+
+@deconstructible(path='venue.storage.ContentAddressedStorage')
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    FileSystemStorage, faýly mazmunynyň hash-y boýunça saklaýar.
+    Şeýle faýl eýýäm bar bolsa, täzeden ýazylmaýar.
+    """
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+
+        name = content_path(content_hash(content), name)
+        if self.exists(name):
+            return name
+        # Bir wagtda şol bir faýl ýüklense, ikinji nusga goşulma bilen saklanýar
+        return super().save(name, content, max_length=max_length)
+
+
+media_storage = ContentAddressedStorage()
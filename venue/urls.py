@@ -1,17 +1,39 @@
+import re
+
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, re_path, include
 from django.conf import settings
-from django.conf.urls.static import static
-
 
+from venue.batch import batch_view
+from venue.media import serve_media
 from venues.urls import router
+from venues.views import catalog_snapshot
+from venues import async_views as venues_async
+from catering import async_views as catering_async
+
+# Köp ulanylýan okamak ýollarynyň async görnüşleri (ASGI serwer üçin)
+async_urlpatterns = [
+    path('properties/', venues_async.property_list),
+    path('properties/<int:pk>/', venues_async.property_detail),
+    path('properties/<int:pk>/availability/', venues_async.property_availability),
+    path('properties/<int:pk>/booked_dates/', venues_async.property_booked_dates),
+    path('availability/events/', venues_async.availability_events),
+    path('catering/menus/', catering_async.menu_list),
+    path('catering/menus/<int:pk>/', catering_async.menu_detail),
+]
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('api/catalog/snapshot/', catalog_snapshot, name='catalog-snapshot'),
+    path('api/batch/', batch_view, name='batch'),
     path('api/', include(router.urls)),
     path('api/catering/', include('catering.urls')),
+    path('api/async/', include(async_urlpatterns)),
 ]
 
-# Media faýllar üçin (DEBUG=True wagtynda)
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+# Media faýllar: diňe SERVE_MEDIA açyk bolsa (MEDIA_URL başga domende/CDN-de
+# bolsa Django bermeýär)
+if settings.SERVE_MEDIA and settings.MEDIA_URL.startswith('/'):
+    urlpatterns += [
+        re_path(r'^%s(?P<path>.*)$' % re.escape(settings.MEDIA_URL.lstrip('/')), serve_media),
+    ]
@@ -1,6 +1,10 @@
 from django.contrib import admin
+from django.utils import timezone
 from django.utils.html import format_html
-from .models import Property, PropertyImage, Service, PropertyService, Booking, BookingService
+from .models import (
+    Property, PropertyImage, Service, PropertyService, Booking, BookingService,
+    ArchivedBooking, ArchivedBookingService, BackgroundTask,
+)
 
 
 class PropertyImageInline(admin.TabularInline):
@@ -100,6 +104,47 @@ class BookingAdmin(admin.ModelAdmin):
         return self.readonly_fields
 
 
+class ArchivedBookingServiceInline(admin.TabularInline):
+    model = ArchivedBookingService
+    extra = 0
+    readonly_fields = ['service', 'quantity', 'price']
+    can_delete = False
+
+
+@admin.register(ArchivedBooking)
+class ArchivedBookingAdmin(admin.ModelAdmin):
+    """Arhiwlenen bronlar - diňe görmek üçin (archive_bookings doldurýar)"""
+    list_display = ['id', 'property', 'customer_name', 'customer_phone',
+                    'check_in', 'check_out', 'total_price', 'status', 'archived_at']
+    list_filter = ['status', 'check_in']
+    search_fields = ['customer_name', 'customer_phone', 'customer_email',
+                     'property__title']
+    date_hierarchy = 'check_in'
+    list_select_related = ['property']
+    inlines = [ArchivedBookingServiceInline]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(BackgroundTask)
+class BackgroundTaskAdmin(admin.ModelAdmin):
+    list_display = ['id', 'name', 'status', 'attempts', 'max_attempts', 'run_at', 'locked_by', 'created_at']
+    list_filter = ['status', 'name']
+    readonly_fields = ['name', 'payload', 'attempts', 'locked_by', 'locked_at', 'last_error', 'created_at']
+    actions = ['retry']
+
+    @admin.action(description="Täzeden synanyşmak")
+    def retry(self, request, queryset):
+        count = queryset.exclude(status='running').update(
+            status='queued', attempts=0, run_at=timezone.now(), last_error=''
+        )
+        self.message_user(request, f"{count} iş nobata goýuldy")
+
+
 # Admin site customization
 admin.site.site_header = "Palatka Ulgamy"
 admin.site.site_title = "Admin Panel"
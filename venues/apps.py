@@ -5,3 +5,6 @@ class VenuesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'venues'
     verbose_name = 'Wedding Venues'
+
+    def ready(self):
+        from . import signals  # noqa: F401
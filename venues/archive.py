@@ -0,0 +1,64 @@
+"""
+Köne bronlary arhiw tablisalaryna (ArchivedBooking, ArchivedBookingService)
+geçirmek.
+
+Çykyş senesi BOOKING_ARCHIVE_AFTER_DAYS-dan köne we gutarnykly statusdaky
+(completed, cancelled, expired) bronlar bölek-bölek göçürilýär: her batch
+bir tranzaksiýada arhiwe ýazylýar we Booking-dan pozulýar. Şeýlelikde
+Booking tablisasy (çakyşma barlaglary, sanawlar) diňe işjeň we ýakyn
+bronlary saklaýar. Günlük jemler (rollups) arhiwi hem öz içine alýar,
+şonuň üçin pozmak suspend_rollups() içinde edilýär.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import ArchivedBooking, ArchivedBookingService, Booking, BookingService
+from .rollups import suspend_rollups
+
+ARCHIVE_STATUSES = ('completed', 'cancelled', 'expired')
+
+BOOKING_FIELDS = [field.attname for field in ArchivedBooking._meta.concrete_fields if field.name != 'archived_at']
+SERVICE_FIELDS = [field.attname for field in ArchivedBookingService._meta.concrete_fields]
+
+
+def archivable(days=None, today=None):
+    """Arhiwe geçirilmeli bronlar"""
+    if days is None:
+        days = settings.BOOKING_ARCHIVE_AFTER_DAYS
+    cutoff = (today or timezone.localdate()) - timedelta(days=days)
+    return Booking.objects.filter(status__in=ARCHIVE_STATUSES, check_out__lt=cutoff)
+
+
+def archive_batch(ids):
+    """Berlen bronlary (we hyzmatlaryny) arhiwe göçürýär, göçürilen sany gaýtarýar"""
+    with transaction.atomic(), suspend_rollups():
+        bookings = [
+            ArchivedBooking(**values)
+            for values in Booking.objects.filter(pk__in=ids, status__in=ARCHIVE_STATUSES).values(*BOOKING_FIELDS)
+        ]
+        ids = [booking.pk for booking in bookings]
+        services = [
+            ArchivedBookingService(**values)
+            for values in BookingService.objects.filter(booking_id__in=ids).values(*SERVICE_FIELDS)
+        ]
+        ArchivedBooking.objects.bulk_create(bookings)
+        ArchivedBookingService.objects.bulk_create(services)
+        Booking.objects.filter(pk__in=ids).delete()
+    return len(bookings)
+
+
+def archive(days=None, batch_size=1000, log=None):
+    """Ähli arhiwlenmeli bronlary batch_size-dan göçürýär"""
+    queryset = archivable(days)
+    total = 0
+    while True:
+        ids = list(queryset.order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return total
+        total += archive_batch(ids)
+        if log:
+            log(f'{total} bron arhiwlendi')
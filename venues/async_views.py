@@ -0,0 +1,149 @@
+"""
+Köp ulanylýan okamak ýollarynyň async (ASGI) görnüşleri.
+
+Jogaplar PropertyViewSet-iň jogaplary bilen deň; ähli baglanyşykly
+maglumatlar öňünden ýüklenýär, şonuň üçin serializer-ler goşmaça sorag
+ibermeýär we event loop petiklenmeýär.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
+
+from venue.async_api import json_response, not_found, paginate
+from . import events
+from .models import Property, PropertyService, Booking
+from .serializers import PropertyListSerializer, PropertyDetailSerializer
+from .views import CustomPageNumberPagination, filter_properties
+
+
+def available_properties():
+    return Property.objects.filter(is_available=True)
+
+
+async def property_list(request):
+    queryset = filter_properties(available_properties(), request.GET)
+    queryset = queryset.select_related('category').prefetch_related('images')
+    return await paginate(
+        request,
+        queryset,
+        PropertyListSerializer,
+        page_size=CustomPageNumberPagination.page_size,
+        size_param=CustomPageNumberPagination.page_size_query_param,
+        max_page_size=CustomPageNumberPagination.max_page_size,
+    )
+
+
+async def property_detail(request, pk):
+    queryset = available_properties().select_related('category').prefetch_related(
+        'images',
+        Prefetch('property_services', queryset=PropertyService.objects.select_related('service')),
+    )
+    try:
+        property_obj = await queryset.aget(pk=pk)
+    except Property.DoesNotExist:
+        return not_found(Property)
+
+    return json_response(
+        PropertyDetailSerializer(property_obj, context={'request': request}).data
+    )
+
+
+async def property_availability(request, pk):
+    if not await available_properties().filter(pk=pk).aexists():
+        return not_found(Property)
+
+    check_in = request.GET.get('check_in')
+    check_out = request.GET.get('check_out')
+
+    if not check_in or not check_out:
+        return json_response({'error': 'check_in we check_out gerek'}, status=400)
+
+    try:
+        check_in_date = datetime.strptime(check_in, '%Y-%m-%d').date()
+        check_out_date = datetime.strptime(check_out, '%Y-%m-%d').date()
+    except ValueError:
+        return json_response({'error': 'Sene formaty nädogry (YYYY-MM-DD)'}, status=400)
+
+    is_available = not await Booking.objects.filter(
+        property_id=pk,
+        status__in=['pending', 'confirmed'],
+        check_in__lt=check_out_date,
+        check_out__gt=check_in_date
+    ).aexists()
+
+    return json_response({
+        'available': is_available,
+        'message': 'Elýeterli' if is_available else 'Bu senelerde eýýäm bronlanan'
+    })
+
+
+async def property_booked_dates(request, pk):
+    if not await available_properties().filter(pk=pk).aexists():
+        return not_found(Property)
+
+    bookings = Booking.objects.filter(
+        property_id=pk,
+        status__in=['pending', 'confirmed']
+    ).values('check_in', 'check_out')
+
+    booked_ranges = [
+        {
+            'start': booking['check_in'].isoformat(),
+            'end': booking['check_out'].isoformat()
+        }
+        async for booking in bookings.aiterator()
+    ]
+
+    return json_response({'booked_dates': booked_ranges})
+
+
+def sse_message(event, data):
+    return f'event: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False)}\n\n'
+
+
+async def availability_stream(property_ids):
+    async with events.broker.subscribe([events.channel(pk) for pk in property_ids]) as queue:
+        yield 'retry: 3000\n\n'
+        # Ilki häzirki ýagdaý: müşderi booked_dates-i aýratyn soramaly däl
+        for pk in property_ids:
+            rows = [row async for row in events.blocking_bookings(pk)]
+            yield sse_message('availability', events.availability_event(pk, events.booked_ranges(rows)))
+
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=settings.SSE_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield ': ping\n\n'
+                continue
+            yield sse_message('availability', event)
+
+
+async def availability_events(request):
+    """
+    Server-Sent Events: jaýlaryň booked_dates üýtgeşmeleri.
+    Mysal: /api/async/availability/events/?properties=1,2,3
+    """
+    try:
+        property_ids = sorted({int(item) for item in request.GET.get('properties', '').split(',') if item.strip()})
+    except ValueError:
+        return json_response({'error': 'properties vergül bilen ID-ler bolmaly'}, status=400)
+    if not property_ids or len(property_ids) > settings.SSE_MAX_PROPERTIES:
+        return json_response(
+            {'error': f'properties gerek (iň köp {settings.SSE_MAX_PROPERTIES})'},
+            status=400
+        )
+
+    found = [pk async for pk in available_properties().filter(pk__in=property_ids).values_list('pk', flat=True)]
+    if len(found) != len(property_ids):
+        return not_found(Property)
+
+    response = StreamingHttpResponse(availability_stream(property_ids), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # nginx akymy buferlemesin
+    return response
@@ -0,0 +1,129 @@
+"""
+Jaýlaryň elýeterliligi üýtgände SSE wakalary (/api/async/availability/events/).
+
+Bron döredilende, statusy ýa-da seneleri üýtgände we pozulanda jaýyň
+kanalyna ('property:<id>') bir waka iberilýär. Waka jaýyň täze
+booked_dates sanawyny saklaýar, şonuň üçin müşderi kalendary göni
+çalyşýar we booked_dates-i soramak (polling) gerek däl: her üýtgeşme
+üçin bir sorag, açyk ekranlaryň sanyna bagly däl.
+
+PUBSUB_BACKEND:
+  'local'    - proses içinde (bir ASGI prosesi üçin). Başga proseslerde
+               edilen üýtgeşmeler (process_bookings, run_tasks) okyjylara
+               ýetmeýär
+  'database' - wakalar PubSubEvent tablisasyna ýazylýar, her proses bir
+               poller bilen PUBSUB_POLL_INTERVAL-da okaýar (birnäçe proses)
+"""
+
+import asyncio
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from venue.pubsub import LocalBroker
+from .models import Booking, PubSubEvent
+
+BLOCKING_STATUSES = ('pending', 'confirmed')
+
+
+class DatabaseBroker(LocalBroker):
+    """Wakalar tablisa arkaly prosesleriň arasynda paýlanýar"""
+
+    def __init__(self):
+        super().__init__()
+        self.poller = None
+
+    def has_subscribers(self, channel):
+        return True  # beýleki prosesleriň okyjylary görünmeýär
+
+    def publish(self, channel, event):
+        PubSubEvent.objects.create(channel=channel, payload=event)
+
+    async def poll(self):
+        last = await PubSubEvent.objects.order_by('-pk').values_list('pk', flat=True).afirst() or 0
+        while self.subscribers:
+            await asyncio.sleep(settings.PUBSUB_POLL_INTERVAL)
+            async for pk, channel, payload in PubSubEvent.objects.filter(pk__gt=last).order_by('pk').values_list(
+                'pk', 'channel', 'payload'
+            ):
+                self.deliver(channel, payload)
+                last = pk
+        self.poller = None
+
+    def subscribe(self, channels):
+        if self.poller is None or self.poller.done():
+            self.poller = asyncio.get_running_loop().create_task(self.poll())
+        return super().subscribe(channels)
+
+
+def get_broker():
+    return DatabaseBroker() if settings.PUBSUB_BACKEND == 'database' else LocalBroker()
+
+
+broker = get_broker()
+
+
+def channel(property_id):
+    return f'property:{property_id}'
+
+
+def booked_ranges(rows):
+    return [{'start': check_in.isoformat(), 'end': check_out.isoformat()} for check_in, check_out in rows]
+
+
+def blocking_bookings(property_id):
+    return Booking.objects.filter(
+        property_id=property_id, status__in=BLOCKING_STATUSES
+    ).values_list('check_in', 'check_out')
+
+
+def availability_event(property_id, booked_dates, changes=()):
+    return {
+        'property': property_id,
+        'changes': list(changes),
+        'booked_dates': booked_dates,
+    }
+
+
+def publish_availability(property_id, changes):
+    """Jaýyň täze booked_dates-i bilen waka (okyjy ýok bolsa sorag edilmeýär)"""
+    name = channel(property_id)
+    if broker.has_subscribers(name):
+        booked_dates = booked_ranges(blocking_bookings(property_id))
+        broker.publish(name, availability_event(property_id, booked_dates, changes))
+
+
+def booking_changed(booking, action, previous_property_id=None):
+    """
+    Signal-lardan: tranzaksiýa tamamlanandan soň waka iberilýär.
+    Bron başga jaýa geçirilen bolsa, köne jaýyň kanalyna hem (seneler boşady).
+    """
+    change = {'booking': booking.pk, 'action': action, 'status': booking.status}
+    property_ids = {booking.property_id}
+    if previous_property_id is not None:
+        property_ids.add(previous_property_id)
+
+    def publish():
+        for property_id in property_ids:
+            publish_availability(property_id, [change])
+    transaction.on_commit(publish)
+
+
+def bookings_updated(ids, status):
+    """QuerySet.update bilen statusy üýtgedilen bronlar (process_bookings)"""
+    def publish():
+        changes = {}
+        for pk, property_id in Booking.objects.filter(pk__in=ids).values_list('pk', 'property_id'):
+            changes.setdefault(property_id, []).append({'booking': pk, 'action': 'status', 'status': status})
+        for property_id, items in changes.items():
+            publish_availability(property_id, items)
+    transaction.on_commit(publish)
+
+
+def purge_events(now=None):
+    """Köne PubSubEvent setirlerini pozýar (poller-ler olary eýýäm okady)"""
+    cutoff = (now or timezone.now()) - timedelta(seconds=settings.PUBSUB_EVENT_RETENTION)
+    deleted, _ = PubSubEvent.objects.filter(created_at__lt=cutoff).delete()
+    return deleted
@@ -0,0 +1,130 @@
+"""
+Bronlary CSV ýa-da NDJSON görnüşinde akym (stream) bilen eksport etmek.
+
+Bronlar iterator(chunk_size=...) bilen bölekleýin okalýar, hyzmatlar her
+bölek üçin bir prefetch soragy bilen alynýar, şonuň üçin ýat ulanylyşy
+bronlaryň sanyna bagly däl.
+"""
+
+import csv
+import json
+from datetime import datetime
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Prefetch
+
+from .models import ArchivedBooking, ArchivedBookingService, Booking, BookingService
+
+FORMATS = ('csv', 'ndjson')
+CHUNK_SIZE = 2000
+
+CSV_COLUMNS = [
+    'id', 'property_id', 'property_title', 'customer_name', 'customer_phone',
+    'customer_email', 'check_in', 'check_out', 'guests_count', 'total_price',
+    'status', 'catering_menu_id', 'catering_menu_name', 'services', 'notes',
+    'created_at',
+]
+
+
+def parse_date(value):
+    """'YYYY-MM-DD' ýa-da boş; nädogry format üçin ValueError"""
+    return datetime.strptime(value, '%Y-%m-%d').date() if value else None
+
+
+def export_queryset(date_from=None, date_to=None, statuses=None, archived=False):
+    """Giriş senesi we status boýunça filterlenen bronlar (archived=True - arhiwden)"""
+    model, service_model = (ArchivedBooking, ArchivedBookingService) if archived else (Booking, BookingService)
+    queryset = model.objects.select_related('property', 'catering_menu').only(
+        *(field.name for field in model._meta.concrete_fields),
+        'property__title',
+        'catering_menu__name',
+    ).prefetch_related(
+        Prefetch(
+            'booking_services',
+            queryset=service_model.objects.select_related('service').only(
+                'booking_id', 'quantity', 'price', 'service__name'
+            )
+        )
+    ).order_by('pk')
+
+    if date_from:
+        queryset = queryset.filter(check_in__gte=date_from)
+    if date_to:
+        queryset = queryset.filter(check_in__lte=date_to)
+    if statuses:
+        queryset = queryset.filter(status__in=statuses)
+    return queryset
+
+
+def booking_rows(queryset, chunk_size=CHUNK_SIZE):
+    for booking in queryset.iterator(chunk_size=chunk_size):
+        menu = booking.catering_menu
+        yield {
+            'id': booking.pk,
+            'property_id': booking.property_id,
+            'property_title': booking.property.title,
+            'customer_name': booking.customer_name,
+            'customer_phone': booking.customer_phone,
+            'customer_email': booking.customer_email,
+            'check_in': booking.check_in,
+            'check_out': booking.check_out,
+            'guests_count': booking.guests_count,
+            'total_price': booking.total_price,
+            'status': booking.status,
+            'catering_menu_id': booking.catering_menu_id,
+            'catering_menu_name': menu.name if menu else None,
+            'services': [
+                {
+                    'service_id': item.service_id,
+                    'name': item.service.name,
+                    'quantity': item.quantity,
+                    'price': item.price,
+                }
+                for item in booking.booking_services.all()
+            ],
+            'notes': booking.notes,
+            'created_at': booking.created_at,
+        }
+
+
+class Echo:
+    """csv.writer üçin: ýazylan setiri gaýtarýar"""
+
+    def write(self, value):
+        return value
+
+
+# Elektron tablisalar bu belgiler bilen başlanýan öýjügi formula hökmünde
+# ýerine ýetirýär (CSV injection), şonuň üçin tekstiň öňüne ' goşulýar
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def escape_cell(value):
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def csv_lines(rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow(CSV_COLUMNS)
+    for row in rows:
+        row['services'] = '; '.join(
+            f"{item['name']} x{item['quantity']} ({item['price']})" for item in row['services']
+        )
+        row['check_in'] = row['check_in'].isoformat()
+        row['check_out'] = row['check_out'].isoformat()
+        row['created_at'] = row['created_at'].isoformat()
+        yield writer.writerow([escape_cell(row[column]) for column in CSV_COLUMNS])
+
+
+def ndjson_lines(rows):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+
+
+def export_lines(export_format, queryset, chunk_size=CHUNK_SIZE):
+    rows = booking_rows(queryset, chunk_size=chunk_size)
+    if export_format == 'csv':
+        return csv_lines(rows)
+    return ndjson_lines(rows)
@@ -0,0 +1,108 @@
+"""
+Jaýlaryň gözleg ekrany üçin facet sanlary (/api/properties/?facets=true).
+
+Ähli facet-ler (kategoriýa, baha, myhman sany, meýdan) filterlenen
+queryset boýunça bir aggregate soragy bilen hasaplanýar: her topar
+üçin Count('pk', filter=Q(...)). Üýtgemeýän bölekler keşlenýär:
+kategoriýalaryň sanawy we filtersiz katalogyň sanlary (iň köp açylýan
+ekran). Category/Property üýtgände keş arassalanýar (signals.py,
+imports.py).
+"""
+
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from .models import Category
+
+# [aşaky, ýokarky] aralyklar (iki çäk hem goşulýar, filter_properties-daky
+# min_/max_ parametrleri ýaly); None - çäksiz. Her topar filter hökmünde
+# ?min_price=100&max_price=199.99 bilen şol bir netijäni berýär.
+PRICE_BUCKETS = [
+    (None, Decimal('99.99')),
+    (Decimal('100'), Decimal('199.99')),
+    (Decimal('200'), Decimal('299.99')),
+    (Decimal('300'), Decimal('499.99')),
+    (Decimal('500'), None),
+]
+AREA_BUCKETS = [(None, 49), (50, 99), (100, 199), (200, None)]
+# guests filteri ýaly: max_guests >= n
+GUEST_THRESHOLDS = [2, 4, 6, 10, 50, 100]
+
+CATEGORIES_KEY = 'venues:facets:categories'
+CATALOG_KEY = 'venues:facets:catalog'
+
+
+def invalidate():
+    cache.delete_many([CATEGORIES_KEY, CATALOG_KEY])
+
+
+def categories():
+    """[(id, ady), ...] - keşden"""
+    items = cache.get(CATEGORIES_KEY)
+    if items is None:
+        items = list(Category.objects.order_by('name').values_list('pk', 'name'))
+        cache.set(CATEGORIES_KEY, items, settings.PROPERTY_FACETS_CACHE_TIMEOUT)
+    return items
+
+
+def range_filter(field, low, high):
+    condition = Q()
+    if low is not None:
+        condition &= Q(**{f'{field}__gte': low})
+    if high is not None:
+        condition &= Q(**{f'{field}__lte': high})
+    return condition
+
+
+def range_facet(counts, prefix, buckets):
+    return [
+        {'min': low, 'max': high, 'count': counts[f'{prefix}_{index}']}
+        for index, (low, high) in enumerate(buckets)
+    ]
+
+
+def compute(queryset):
+    category_items = categories()
+    aggregates = {'total': Count('pk'), 'category_none': Count('pk', filter=Q(category__isnull=True))}
+    for pk, _ in category_items:
+        aggregates[f'category_{pk}'] = Count('pk', filter=Q(category_id=pk))
+    for index, (low, high) in enumerate(PRICE_BUCKETS):
+        aggregates[f'price_{index}'] = Count('pk', filter=range_filter('price_per_night', low, high))
+    for index, (low, high) in enumerate(AREA_BUCKETS):
+        aggregates[f'area_{index}'] = Count('pk', filter=range_filter('area', low, high))
+    for threshold in GUEST_THRESHOLDS:
+        aggregates[f'guests_{threshold}'] = Count('pk', filter=Q(max_guests__gte=threshold))
+
+    counts = queryset.order_by().aggregate(**aggregates)
+
+    category_facet = [
+        {'id': pk, 'name': name, 'count': counts[f'category_{pk}']}
+        for pk, name in category_items
+    ]
+    if counts['category_none']:
+        category_facet.append({'id': None, 'name': '', 'count': counts['category_none']})
+
+    return {
+        'total': counts['total'],
+        'category': category_facet,
+        'price': range_facet(counts, 'price', PRICE_BUCKETS),
+        'guests': [
+            {'min': threshold, 'count': counts[f'guests_{threshold}']}
+            for threshold in GUEST_THRESHOLDS
+        ],
+        'area': range_facet(counts, 'area', AREA_BUCKETS),
+    }
+
+
+def property_facets(queryset, base_queryset):
+    """queryset filterlenmedik bolsa (SQL base_queryset bilen deň), netije keşden"""
+    if str(queryset.order_by().query) != str(base_queryset.order_by().query):
+        return compute(queryset)
+    facets = cache.get(CATALOG_KEY)
+    if facets is None:
+        facets = compute(queryset)
+        cache.set(CATALOG_KEY, facets, settings.PROPERTY_FACETS_CACHE_TIMEOUT)
+    return facets
@@ -0,0 +1,110 @@
+"""Jaýlar we bronlar sanawlary üçin ýeňil serializer-ler (venue/fast_serializers.py)"""
+
+from catering.fast_serializers import WeddingMenuFastSerializer
+from catering.models import WeddingMenu
+from venue.fast_serializers import FastSerializer
+from venue.media import media_url
+from .models import Category, PropertyImage
+from .serializers import (
+    CategorySerializer, PropertyListSerializer, BookingSerializer, BookingServiceSerializer,
+    ArchivedBookingSerializer, ArchivedBookingServiceSerializer,
+)
+
+IMAGE_META_FIELDS = ('width', 'height', 'size', 'dominant_color', 'placeholder')
+
+
+def row_image_meta(row, prefix=''):
+    """serializers.image_meta bilen deň, values() setiri üçin"""
+    return {
+        'width': row[f'{prefix}width'],
+        'height': row[f'{prefix}height'],
+        'size': row[f'{prefix}size'],
+        'dominant_color': row[f'{prefix}dominant_color'] or None,
+        'placeholder': row[f'{prefix}placeholder'] or None,
+    }
+
+
+class CategoryFastSerializer(FastSerializer):
+    serializer_class = CategorySerializer
+    extra_values = ('icon', *(f'icon_{name}' for name in IMAGE_META_FIELDS))
+
+    def field_icon(self, row):
+        return media_url(row['icon'], self.request)
+
+    def field_icon_meta(self, row):
+        return row_image_meta(row, 'icon_') if row['icon'] else None
+
+
+class PropertyListFastSerializer(FastSerializer):
+    serializer_class = PropertyListSerializer
+    extra_values = ('category_id',)
+
+    def prefetch(self, rows):
+        category_ids = {row['category_id'] for row in rows} - {None}
+        categories = CategoryFastSerializer(self.context)
+        self.categories = {
+            row['pk']: categories.to_representation(row)
+            for row in categories.values(Category.objects.filter(pk__in=category_ids))
+        }
+
+        # Her jaýyň esasy suraty (PropertyImage.Meta.ordering boýunça birinjisi)
+        self.main_images = {}
+        images = PropertyImage.objects.filter(
+            property_id__in=[row['pk'] for row in rows], is_main=True
+        ).order_by('order', '-is_main', 'pk').values('property_id', 'image', *IMAGE_META_FIELDS)
+        for image in images:
+            self.main_images.setdefault(image['property_id'], image)
+
+    def field_category(self, row):
+        return self.categories.get(row['category_id'])
+
+    def field_main_image(self, row):
+        image = self.main_images.get(row['pk'])
+        if image and self.request:
+            return media_url(image['image'], self.request)
+        return None
+
+    def field_main_image_meta(self, row):
+        image = self.main_images.get(row['pk'])
+        return row_image_meta(image) if image else None
+
+
+class BookingServiceFastSerializer(FastSerializer):
+    serializer_class = BookingServiceSerializer
+    extra_values = ('booking_id',)
+
+
+class ArchivedBookingServiceFastSerializer(BookingServiceFastSerializer):
+    serializer_class = ArchivedBookingServiceSerializer
+
+
+class BookingFastSerializer(FastSerializer):
+    serializer_class = BookingSerializer
+    services_serializer_class = BookingServiceFastSerializer
+
+    def prefetch(self, rows):
+        services = self.services_serializer_class(self.context)
+        service_model = services.serializer_class.Meta.model
+        self.services = {}
+        for row in services.values(
+            service_model.objects.filter(booking_id__in=[row['pk'] for row in rows]).order_by('pk')
+        ):
+            self.services.setdefault(row['booking_id'], []).append(services.to_representation(row))
+
+        menus = WeddingMenuFastSerializer(self.context)
+        menu_ids = {row['catering_menu_id'] for row in rows} - {None}
+        self.menus = {
+            row['pk']: menus.to_representation(row)
+            for row in menus.values(WeddingMenu.objects.filter(pk__in=menu_ids))
+        }
+
+    def field_booking_services(self, row):
+        return self.services.get(row['pk'], [])
+
+    def field_catering_menu_detail(self, row):
+        return self.menus.get(row['catering_menu_id'])
+
+
+class ArchivedBookingFastSerializer(BookingFastSerializer):
+    serializer_class = ArchivedBookingSerializer
+    services_serializer_class = ArchivedBookingServiceFastSerializer
@@ -0,0 +1,162 @@
+"""
+Idempotency-Key sözbaşysy (header) boýunça gaýtalanýan soraglar.
+
+Mobil programma POST soragyny gaýtalasa (tor kesilende), şol bir açar
+bilen gelen sorag täzeden işlenmeýär: ilkinji jogap IdempotencyKey
+tablisasyndan (unique indeks boýunça bir sorag) gaýtarylýar. Şonuň üçin
+gaýtalanan bron döredilmeýär we çakyşma barlaglary täzeden işlemeýär.
+
+  - açarlar eýesiniň çäginde: giren ulanyjy, sessiýa ýa-da (anonim müşderi
+    üçin) IP salgysy we User-Agent; başga müşderi şol açar bilen ilkinji
+    jogaby alyp bilmeýär
+  - açar başga mazmunly sorag bilen ulanylsa: 422
+  - ilkinji sorag heniz işlenýän bolsa: 409 (Retry-After)
+  - IDEMPOTENCY_LOCK_TIMEOUT sekuntdan köp "işlenýän" açar taşlanan hasaplanýar
+    (işçi öldi ýa-da wagty gutardy) we täze sorag ony eýeläp bilýär
+  - 5xx jogaplar we garaşylmadyk ýalňyşlyklar saklanmaýar (gaýtadan synanyşyp bolýar)
+  - açarlar IDEMPOTENCY_KEY_TTL_HOURS sagat saklanýar
+"""
+
+import hashlib
+import json
+from datetime import timedelta
+from functools import wraps
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.response import Response
+
+from .models import IdempotencyKey
+
+HEADER = 'Idempotency-Key'
+MAX_KEY_LENGTH = 255
+
+
+def fingerprint(request):
+    """Usul, ýol we mazmun boýunça hash: açar diňe şol bir sorag üçin ulanylyp bilner"""
+    body = json.dumps(request.data, sort_keys=True, cls=DjangoJSONEncoder, default=str)
+    return hashlib.sha256(f'{request.method} {request.path}\n{body}'.encode()).hexdigest()
+
+
+def request_scope(request):
+    """Açaryň eýesi: 'user:<id>' ýa-da sessiýanyň/müşderiniň hash-y"""
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return f'user:{user.pk}'
+    session_key = getattr(getattr(request, 'session', None), 'session_key', None)
+    if session_key:
+        identity = f'session:{session_key}'
+    else:
+        identity = f"client:{request.META.get('REMOTE_ADDR', '')}:{request.headers.get('User-Agent', '')}"
+    return 'anon:' + hashlib.sha256(identity.encode()).hexdigest()
+
+
+def expiry_cutoff(now=None):
+    return (now or timezone.now()) - timedelta(hours=settings.IDEMPOTENCY_KEY_TTL_HOURS)
+
+
+def is_abandoned(record, now=None):
+    """Möhleti geçen açar ýa-da jogapsyz galan (taşlanan) eýeleme"""
+    now = now or timezone.now()
+    if record.created_at < expiry_cutoff(now):
+        return True
+    lock_cutoff = now - timedelta(seconds=settings.IDEMPOTENCY_LOCK_TIMEOUT)
+    return record.status_code is None and record.created_at < lock_cutoff
+
+
+def purge_expired(now=None):
+    """Möhleti geçen açarlary pozýar, pozulan sany gaýtarýar"""
+    deleted, _ = IdempotencyKey.objects.filter(created_at__lt=expiry_cutoff(now)).delete()
+    return deleted
+
+
+def claim(scope, key, digest):
+    """
+    Eýesiniň açaryny eýeleýär: (täze ýazgy, True) - bu sorag işlemeli,
+    (ýazgy, False) - açar eýýäm bar (jogap ýa-da işlenýär).
+    """
+    for _ in range(2):
+        try:
+            with transaction.atomic():
+                return IdempotencyKey.objects.create(scope=scope, key=key, fingerprint=digest), True
+        except IntegrityError:
+            record = IdempotencyKey.objects.filter(scope=scope, key=key).first()
+            if record is None or not is_abandoned(record):
+                return record, False
+            # Möhleti geçen ýa-da taşlanan açar: pozup täzeden synanyşmak
+            IdempotencyKey.objects.filter(
+                pk=record.pk, created_at=record.created_at, status_code=record.status_code
+            ).delete()
+    return None, False
+
+
+def replay(record, digest):
+    if record is None:
+        # Açar arada pozuldy (ilkinji sorag şowsuz boldy) - müşderi gaýtadan synanyşsyn
+        return conflict()
+    if record.fingerprint != digest:
+        return Response(
+            {'error': f'{HEADER} başga sorag üçin ulanyldy'},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY
+        )
+    if record.status_code is None:
+        return conflict()
+    response = Response(json.loads(record.response), status=record.status_code)
+    response['Idempotent-Replayed'] = 'true'
+    return response
+
+
+def conflict():
+    response = Response(
+        {'error': 'Şol açar bilen sorag heniz işlenýär'},
+        status=status.HTTP_409_CONFLICT
+    )
+    response['Retry-After'] = '1'
+    return response
+
+
+def idempotent(view):
+    """ViewSet usuly üçin dekorator: Idempotency-Key bar bolsa jogaby saklaýar/gaýtarýar"""
+
+    @wraps(view)
+    def wrapper(self, request, *args, **kwargs):
+        key = request.headers.get(HEADER)
+        if not key:
+            return view(self, request, *args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return Response(
+                {'error': f'{HEADER} {MAX_KEY_LENGTH} simwoldan uzyn bolup bilmez'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        digest = fingerprint(request)
+        record, claimed = claim(request_scope(request), key, digest)
+        if not claimed:
+            return replay(record, digest)
+        # Diňe öz eýelemämiz: taşlanan hasaplanyp başga sorag eýelän bolsa üýtgedilmeýär
+        own = IdempotencyKey.objects.filter(pk=record.pk)
+
+        try:
+            try:
+                response = view(self, request, *args, **kwargs)
+            except APIException as exc:
+                # Validasiýa ýalňyşlyklary hem gaýtalananda şol bir jogaby bermeli
+                response = self.handle_exception(exc)
+        except BaseException:
+            own.delete()
+            raise
+
+        if response.status_code >= 500:
+            own.delete()
+        else:
+            own.update(
+                status_code=response.status_code,
+                response=json.dumps(response.data, cls=DjangoJSONEncoder, ensure_ascii=False),
+            )
+        return response
+
+    return wrapper
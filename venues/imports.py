@@ -0,0 +1,412 @@
+"""
+Katalogy CSV ýa-da NDJSON faýldan köpçülikleýin import etmek.
+
+Faýl akym bilen okalýar we --batch-size setirlik böleklere bölünýär. Her
+setir bar bolan serializer-leriň düzgünleri bilen barlanýar; Category,
+Service, Dish we Salad salgylanmalary öňünden ýüklenen sözlükler arkaly
+çözülýär (her setir üçin sorag ýok). Dogry setirler bölek-bölek aýratyn
+tranzaksiýada bulk_create/bulk_update bilen ýazylýar, ýalňyş setirler
+hasabatda görkezilýär we faýlyň galan bölegine päsgel bermeýär. Bölegi
+ýazanda maglumat bazasy ýalňyşlyk berse, setirler aýratyn ýazylýar we
+diňe ýazyp bolmadyk setirler hasabata goşulýar.
+
+bulk_create/bulk_update signal ibermeýär, şonuň üçin signal-laryň işi
+(search_key, FTS indeksi, düzümler, menýu wagty, offline surat) şu ýerde
+köpçülikleýin edilýär.
+
+Sütünler (CSV-de boş öýjük - meýdan berilmedik hasaplanýar):
+  services:   name, description, icon, is_active
+  properties: title, address, description, category (slug ýa-da ady),
+              price_per_night, max_guests, area, is_available,
+              services ("Wi-Fi:0:included; Ertirlik:25")
+  dishes:     name, description, category, price, weight, is_vegetarian, is_active
+  salads:     name, description, ingredients, price, weight, is_vegetarian, is_active
+  menus:      name, description, price_per_person, min_guests, is_active,
+              dishes ("Dograma x2; Palaw"), salads ("Sezar")
+
+NDJSON-da services/dishes/salads sanaw hem bolup biler:
+  {"services": [{"service": "Wi-Fi", "price": "0", "is_included": true}]}
+  {"dishes": [{"dish": "Dograma", "quantity": 2}]}
+
+Bar bolan ýazgy açar boýunça tapylsa täzelenýär: jaýlar (title, address),
+beýlekiler name boýunça.
+"""
+
+import csv
+import json
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from catering import search as catalog_search
+from catering.models import Dish, Salad, WeddingMenu, MenuDish, MenuSalad
+from catering.serializers import DishSerializer, SaladSerializer, WeddingMenuSerializer
+from catering.signals import touch_menus
+from venue.search import normalize_search_text
+from .models import Category, Service, Property, PropertyService
+from .serializers import ServiceSerializer, PropertyCreateSerializer
+from . import facets
+from .snapshot import mark_dirty
+
+FORMATS = ('csv', 'ndjson')
+BATCH_SIZE = 500
+
+
+class ServiceImportSerializer(ServiceSerializer):
+    class Meta(ServiceSerializer.Meta):
+        fields = ServiceSerializer.Meta.fields + ['is_active']
+
+
+class PropertyImportSerializer(PropertyCreateSerializer):
+    images = None  # suratlar import edilmeýär
+
+    class Meta(PropertyCreateSerializer.Meta):
+        fields = [
+            'title', 'description', 'address', 'price_per_night',
+            'max_guests', 'area', 'is_available'
+        ]
+
+
+def read_rows(stream, file_format):
+    """(setir belgisi, maglumat, ýalňyşlyk) üçlüklerini akym bilen okaýar"""
+    if file_format == 'csv':
+        # 1-nji setir sözbaşy
+        for number, row in enumerate(csv.DictReader(stream), start=2):
+            yield number, {
+                key.strip(): value.strip()
+                for key, value in row.items()
+                if key and value and value.strip()
+            }, None
+        return
+
+    for number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError:
+            yield number, None, {'non_field_errors': ['JSON nädogry']}
+            continue
+        if not isinstance(data, dict):
+            yield number, None, {'non_field_errors': ['Setir JSON obýekt bolmaly']}
+            continue
+        yield number, data, None
+
+
+def chunks(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def split_items(value):
+    """'A x2; B' ýa-da sanaw -> elementleriň sanawy"""
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(';') if item.strip()]
+    if isinstance(value, list):
+        return value
+    raise ValueError('Sanaw ýa-da ";" bilen bölünen tekst bolmaly')
+
+
+def name_map(queryset, *fields):
+    """{normalizasiýa edilen at: pk} - salgylanmalary sorag etmezden çözmek üçin"""
+    lookup = {}
+    for pk, *names in queryset.values_list('pk', *fields):
+        for name in names:
+            lookup.setdefault(normalize_search_text(name), pk)
+    return lookup
+
+
+class Importer:
+    """Bir modeliň importy: barlamak, salgylanmalary çözmek, bölekleýin ýazmak"""
+    model = None
+    serializer_class = None
+    key_fields = ('name',)
+    relation_fields = ()
+    snapshot_sections = ()
+
+    def __init__(self):
+        self.existing = {
+            tuple(values[:-1]): values[-1]
+            for values in self.model.objects.values_list(*self.key_fields, 'pk')
+        }
+        self.update_fields = [
+            field.name for field in self.model._meta.concrete_fields
+            if not field.primary_key and field.name != 'created_at'
+        ]
+
+    def key(self, obj):
+        get = obj.get if isinstance(obj, dict) else lambda field: getattr(obj, field)
+        return tuple(get(field) for field in self.key_fields)
+
+    def resolve(self, relations, errors):
+        """Salgylanmalary çözýär; modeliň goşmaça meýdanlaryny gaýtarýar (meselem category_id)"""
+        return {}
+
+    def write_relations(self, items):
+        """Baglanyşyk tablisalaryny ýazýar: items = [(obj, relations), ...]"""
+
+    def after_write(self, created, updated):
+        """Signal-laryň işini köpçülikleýin ýerine ýetirýär"""
+
+    def run(self, rows, batch_size=BATCH_SIZE):
+        report = {'created': 0, 'updated': 0, 'errors': []}
+        validator = self.serializer_class()
+        # Gaýtalanmalar bölekleriň arasynda hem barlanýar
+        seen = set()
+
+        for chunk in chunks(rows, batch_size):
+            valid = []
+            for number, raw, error in chunk:
+                if error:
+                    report['errors'].append({'row': number, 'errors': error})
+                    continue
+
+                raw, relations, errors = dict(raw), {}, {}
+                for field in self.relation_fields:
+                    if field in raw:
+                        relations[field] = raw.pop(field)
+                resolved = self.resolve(relations, errors)
+                try:
+                    data = {**validator.run_validation(raw), **resolved}
+                except ValidationError as exc:
+                    errors.update(exc.detail)
+                    data = None
+
+                if data is not None:
+                    key = self.key(data)
+                    if key in seen:
+                        errors.setdefault('non_field_errors', []).append('Faýlda gaýtalanýar')
+                    seen.add(key)
+
+                if errors:
+                    report['errors'].append({'row': number, 'errors': errors})
+                else:
+                    valid.append((number, data, relations))
+
+            self.write(valid, report)
+
+        report['errors'].sort(key=lambda item: item['row'])
+        return report
+
+    def write(self, valid, report):
+        if not valid:
+            return
+        try:
+            self.write_chunk([(data, relations) for _, data, relations in valid], report)
+        except DatabaseError as exc:
+            if len(valid) == 1:
+                report['errors'].append({
+                    'row': valid[0][0],
+                    'errors': {'non_field_errors': [f'Ýazyp bolmady: {exc}']},
+                })
+                return
+            # Haýsy setiriň ýalňyşdygyny tapmak üçin setirler aýratyn ýazylýar
+            for item in valid:
+                self.write([item], report)
+
+    def write_chunk(self, valid, report):
+        now = timezone.now()
+        created, updated = [], []
+
+        with transaction.atomic():
+            instances = self.model.objects.in_bulk(
+                [self.existing[key] for key in map(self.key, (data for data, _ in valid)) if key in self.existing]
+            )
+            for data, relations in valid:
+                obj = instances.get(self.existing.get(self.key(data)))
+                if obj is None:
+                    obj = self.model(**data)
+                    created.append((obj, relations))
+                else:
+                    for field, value in data.items():
+                        setattr(obj, field, value)
+                    obj.updated_at = now
+                    updated.append((obj, relations))
+                if hasattr(obj, 'refresh_search_key'):
+                    obj.refresh_search_key()
+
+            self.model.objects.bulk_create([obj for obj, _ in created])
+            self.model.objects.bulk_update([obj for obj, _ in updated], self.update_fields)
+            self.write_relations(created + updated)
+            self.after_write([obj for obj, _ in created], [obj for obj, _ in updated])
+
+        for obj, _ in created:
+            self.existing[self.key(obj)] = obj.pk
+        mark_dirty(*self.snapshot_sections)
+        report['created'] += len(created)
+        report['updated'] += len(updated)
+
+
+class ServiceImporter(Importer):
+    model = Service
+    serializer_class = ServiceImportSerializer
+    snapshot_sections = ('services',)
+
+
+class PropertyImporter(Importer):
+    model = Property
+    serializer_class = PropertyImportSerializer
+    key_fields = ('title', 'address')
+    relation_fields = ('category', 'services')
+    snapshot_sections = ('properties',)
+
+    def __init__(self):
+        super().__init__()
+        self.categories = name_map(Category.objects.all(), 'slug', 'name')
+        self.services = name_map(Service.objects.all(), 'name')
+
+    def resolve(self, relations, errors):
+        resolved = {}
+        if 'category' in relations:
+            category = relations.pop('category')
+            resolved['category_id'] = self.categories.get(normalize_search_text(category)) if category else None
+            if category and resolved['category_id'] is None:
+                errors['category'] = [f'Kategoriýa tapylmady: {category}']
+
+        if 'services' in relations:
+            try:
+                relations['services'] = [self.parse_service(item) for item in split_items(relations['services'])]
+            except ValueError as exc:
+                errors['services'] = [str(exc)]
+        return resolved
+
+    def parse_service(self, item):
+        if isinstance(item, str):
+            # "Ady:baha" ýa-da "Ady:baha:included"
+            name, _, rest = item.partition(':')
+            price, _, flag = rest.partition(':')
+            item = {'service': name, 'price': price or '0', 'is_included': flag.strip() == 'included'}
+        if not isinstance(item, dict):
+            raise ValueError('Hyzmat nädogry')
+
+        name = str(item.get('service', '')).strip()
+        service_id = self.services.get(normalize_search_text(name))
+        if service_id is None:
+            raise ValueError(f'Hyzmat tapylmady: {name}')
+        try:
+            price = Decimal(str(item.get('price', '0')).strip())
+        except InvalidOperation:
+            raise ValueError(f'Baha nädogry: {name}')
+        if not price.is_finite() or price < 0:
+            raise ValueError(f'Baha nädogry: {name}')
+        return service_id, price, bool(item.get('is_included', False))
+
+    def write_relations(self, items):
+        items = [(obj, relations['services']) for obj, relations in items if 'services' in relations]
+        if not items:
+            return
+        PropertyService.objects.filter(property__in=[obj for obj, _ in items]).delete()
+        PropertyService.objects.bulk_create([
+            PropertyService(property=obj, service_id=service_id, price=price, is_included=is_included)
+            for obj, services in items
+            for service_id, price, is_included in {service[0]: service for service in services}.values()
+        ])
+
+    def after_write(self, created, updated):
+        facets.invalidate()
+
+
+class CatalogImporter(Importer):
+    """Tagamlar, salatlar we menýular: FTS indeksi hem täzelenýär"""
+
+    def after_write(self, created, updated):
+        catalog_search.index_objects(created + updated)
+
+
+class DishImporter(CatalogImporter):
+    model = Dish
+    serializer_class = DishSerializer
+    snapshot_sections = ('dishes', 'menus')
+
+    def after_write(self, created, updated):
+        super().after_write(created, updated)
+        touch_menus(WeddingMenu.objects.filter(menudish__dish__in=updated))
+
+
+class SaladImporter(CatalogImporter):
+    model = Salad
+    serializer_class = SaladSerializer
+    snapshot_sections = ('salads', 'menus')
+
+    def after_write(self, created, updated):
+        super().after_write(created, updated)
+        Salad.sync_ingredients_bulk(created + updated)
+        touch_menus(WeddingMenu.objects.filter(menusalad__salad__in=updated))
+
+
+class MenuImporter(CatalogImporter):
+    model = WeddingMenu
+    serializer_class = WeddingMenuSerializer
+    relation_fields = ('dishes', 'salads')
+    item_keys = {'dishes': 'dish', 'salads': 'salad'}
+    snapshot_sections = ('menus',)
+
+    def __init__(self):
+        super().__init__()
+        self.lookups = {
+            'dishes': name_map(Dish.objects.all(), 'name'),
+            'salads': name_map(Salad.objects.all(), 'name'),
+        }
+
+    def resolve(self, relations, errors):
+        for field, lookup in self.lookups.items():
+            if field not in relations:
+                continue
+            try:
+                relations[field] = [self.parse_item(item, field, lookup) for item in split_items(relations[field])]
+            except ValueError as exc:
+                errors[field] = [str(exc)]
+        return {}
+
+    @staticmethod
+    def parse_item(item, field, lookup):
+        """'Dograma x2' ýa-da {'dish': 'Dograma', 'quantity': 2} -> (pk, mukdar)"""
+        if isinstance(item, str):
+            name, separator, quantity = item.rpartition(' x')
+            if not separator or not quantity.strip().isdigit():
+                name, quantity = item, '1'
+            item = {'name': name, 'quantity': quantity}
+        if not isinstance(item, dict):
+            raise ValueError('Element nädogry')
+
+        name = str(item.get('name') or item.get(MenuImporter.item_keys[field]) or '').strip()
+        pk = lookup.get(normalize_search_text(name))
+        if pk is None:
+            raise ValueError(f'Tapylmady: {name}')
+        try:
+            quantity = int(item.get('quantity', 1))
+        except (TypeError, ValueError):
+            raise ValueError(f'Mukdar nädogry: {name}')
+        if quantity < 1:
+            raise ValueError(f'Mukdar nädogry: {name}')
+        return pk, quantity
+
+    def write_relations(self, items):
+        for field, through, target in (('dishes', MenuDish, 'dish_id'), ('salads', MenuSalad, 'salad_id')):
+            rows = [(obj, relations[field]) for obj, relations in items if field in relations]
+            if not rows:
+                continue
+            through.objects.filter(menu__in=[obj for obj, _ in rows]).delete()
+            through.objects.bulk_create([
+                through(menu=obj, quantity=quantity, order=order, **{target: pk})
+                for obj, entries in rows
+                for order, (pk, quantity) in enumerate(dict(entries).items())
+            ])
+
+
+IMPORTERS = {
+    'services': ServiceImporter,
+    'properties': PropertyImporter,
+    'dishes': DishImporter,
+    'salads': SaladImporter,
+    'menus': MenuImporter,
+}
+
+
+def import_stream(kind, stream, file_format, batch_size=BATCH_SIZE):
+    """Faýly import edýär we hasabat gaýtarýar: {'created', 'updated', 'errors'}"""
+    return IMPORTERS[kind]().run(read_rows(stream, file_format), batch_size=batch_size)
@@ -0,0 +1,60 @@
+"""
+Bronlaryň ýaşaýyş tapgyry: statuslaryň awtomatik geçişleri.
+
+  pending   -> expired    BOOKING_PENDING_TTL_HOURS-dan köp tassyklanmadyk
+  confirmed -> completed  çykyş senesi geçen
+
+Geçişler QuerySet.update bilen bölek-bölek (batch) edilýär: signal-lar
+işlemeýär, şonuň üçin updated_at el bilen bellenýär. Günlük jemlere
+(rollups) täsiri ýok: pending/expired hasaba alynmaýar, confirmed we
+completed ikisi hem hasaba alynýar.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from . import events
+from .models import Booking
+
+
+def update_in_batches(queryset, batch_size, **changes):
+    """
+    Şerte gabat gelýän bronlary batch_size-dan täzeleýär, täzelenen sany gaýtarýar.
+    Her batch öz tranzaksiýasynda, şonuň üçin uzyn gulplar (lock) ýok.
+    Elýeterlilik wakalary (SSE) her batch tamamlanandan soň iberilýär.
+    """
+    total = 0
+    while True:
+        with transaction.atomic():
+            ids = list(queryset.order_by('pk').values_list('pk', flat=True)[:batch_size])
+            if not ids:
+                return total
+            # Şert täzeden barlanýar: arada admin statusy üýtgeden bolsa degilmeýär
+            total += queryset.filter(pk__in=ids).update(**changes)
+            events.bookings_updated(ids, changes['status'])
+
+
+def expire_pending(now=None, ttl_hours=None, batch_size=1000):
+    now = now or timezone.now()
+    if ttl_hours is None:
+        ttl_hours = settings.BOOKING_PENDING_TTL_HOURS
+    stale = Booking.objects.filter(status='pending', created_at__lt=now - timedelta(hours=ttl_hours))
+    return update_in_batches(stale, batch_size, status='expired', updated_at=now)
+
+
+def complete_past(now=None, batch_size=1000):
+    now = now or timezone.now()
+    past = Booking.objects.filter(status='confirmed', check_out__lte=timezone.localdate(now))
+    return update_in_batches(past, batch_size, status='completed', updated_at=now)
+
+
+def process(now=None, ttl_hours=None, batch_size=1000):
+    """Ähli geçişler: {'expired': n, 'completed': n}"""
+    now = now or timezone.now()
+    return {
+        'expired': expire_pending(now, ttl_hours, batch_size),
+        'completed': complete_past(now, batch_size),
+    }
@@ -0,0 +1,36 @@
+"""
+Management command: venues/management/commands/archive_bookings.py
+
+Köne gutarnykly bronlary (completed, cancelled, expired) arhiw
+tablisalaryna geçirýär (venues/archive.py). Yzygiderli işledilmeli
+(cron, meselem her gije).
+
+Ulanylyşy:
+python manage.py archive_bookings
+python manage.py archive_bookings --days 180 --batch-size 500 -v 2
+python manage.py archive_bookings --dry-run
+"""
+
+from django.core.management.base import BaseCommand
+
+from venues import archive
+
+
+class Command(BaseCommand):
+    help = 'Köne tamamlanan/ýatyrylan bronlary arhiwe geçirýär'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=None,
+                            help='Çykyş senesinden soň näçe gün (default: BOOKING_ARCHIVE_AFTER_DAYS)')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Bir tranzaksiýadaky bronlar')
+        parser.add_argument('--dry-run', action='store_true', help='Diňe sanyny görkezmek')
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            count = archive.archivable(options['days']).count()
+            self.stdout.write(f'{count} bron arhiwlenip bilner')
+            return
+
+        log = self.stdout.write if options['verbosity'] > 1 else None
+        total = archive.archive(options['days'], batch_size=options['batch_size'], log=log)
+        self.stdout.write(self.style.SUCCESS(f'✓ {total} bron arhiwe geçirildi'))
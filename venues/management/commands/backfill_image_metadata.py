@@ -0,0 +1,100 @@
+"""
+Management command: venues/management/commands/backfill_image_metadata.py
+
+Öň ýüklenen suratlar üçin metadata-ny (ölçeg, ululyk, esasy reňk, LQIP)
+hasaplaýar. Pillow işi CPU-a bagly, şonuň üçin suratlar prosess howzunda
+parallel işlenýär, netijeler bulk_update bilen ýazylýar. Faýly tapylmadyk
+ýa-da açylmadyk suratlar metadata_failed bilen bellenýär we diňe --all
+bilen gaýtadan synanyşylýar.
+
+Ulanylyşy:
+python manage.py backfill_image_metadata
+python manage.py backfill_image_metadata --all --workers 8
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from venue.images import EMPTY, image_metadata
+from venue.storage import media_storage
+from venues.models import Category, Property, PropertyImage
+from venues.snapshot import mark_dirty
+
+
+def compute(job):
+    """Prosess howzunda işleýär: (pk, ýol) -> (pk, metadata ýa-da None)"""
+    pk, path = job
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return pk, None
+    return pk, image_metadata(path, size=size)
+
+
+class Command(BaseCommand):
+    help = 'Suratlaryň metadata-syny we LQIP suratlaryny prosess howzunda hasaplaýar'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help='Metadata-sy bar suratlary hem täzeden hasaplamak')
+        parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Prosesleriň sany (default: CPU sany)')
+        parser.add_argument('--batch-size', type=int, default=200, help='Bir bulk_update-däki ýazgylar')
+
+    def handle(self, *args, **options):
+        targets = [
+            (PropertyImage, 'image', ''),
+            (Category, 'icon', 'icon_'),
+        ]
+        with ProcessPoolExecutor(max_workers=options['workers']) as pool:
+            for model, field, prefix in targets:
+                queryset = model.objects.exclude(**{field: ''}).exclude(**{f'{field}__isnull': True})
+                if not options['all']:
+                    queryset = queryset.filter(**{f'{prefix}width__isnull': True, f'{prefix}metadata_failed': False})
+                jobs = [
+                    (pk, media_storage.path(name))
+                    for pk, name in queryset.values_list('pk', field).iterator()
+                ]
+                done, missing = self.process(pool, jobs, model, prefix, options['batch_size'])
+                self.stdout.write(
+                    f'{model._meta.verbose_name_plural}: {done} täzelendi, {missing} faýl tapylmady'
+                )
+
+        # bulk_update signal ibermeýär: delta sinhronizasiýa we offline surat üçin
+        mark_dirty('categories', 'properties')
+        self.stdout.write(self.style.SUCCESS('✓ Metadata taýýar'))
+
+    def process(self, pool, jobs, model, prefix, batch_size):
+        fields = [
+            prefix + name
+            for name in ('width', 'height', 'size', 'dominant_color', 'placeholder', 'metadata_failed')
+        ]
+        if model is Category:
+            fields.append('updated_at')
+        done = missing = 0
+        batch = []
+
+        for pk, metadata in pool.map(compute, jobs, chunksize=16):
+            if metadata is None:
+                missing += 1
+                metadata = EMPTY
+            metadata = dict(metadata, metadata_failed=metadata['width'] is None)
+            obj = model(pk=pk, **{prefix + name: value for name, value in metadata.items()})
+            if model is Category:
+                obj.updated_at = timezone.now()
+            batch.append(obj)
+            if len(batch) >= batch_size:
+                done += self.write(model, batch, fields)
+                batch = []
+        done += self.write(model, batch, fields)
+        return done, missing
+
+    @staticmethod
+    def write(model, objects, fields):
+        if not objects:
+            return 0
+        model.objects.bulk_update(objects, fields)
+        if model is PropertyImage:
+            Property.objects.filter(images__in=objects).update(updated_at=timezone.now())
+        return len(objects)
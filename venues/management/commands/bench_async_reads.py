@@ -0,0 +1,85 @@
+"""
+Management command: venues/management/commands/bench_async_reads.py
+
+Köp ulanylýan okamak ýollarynyň sync (DRF) we async (/api/async/) görnüşlerini
+deň işçi býujeti bilen deňeşdirýär: sync ýol --concurrency sany sapakda,
+async ýol bir event loop-da --concurrency sany bir wagtdaky sorag bilen.
+
+Ulanylyşy:
+python manage.py bench_async_reads
+python manage.py bench_async_reads --concurrency 32 --requests 2000
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from django.test import AsyncClient, Client
+
+from catering.models import WeddingMenu
+from venues.models import Property
+
+
+class Command(BaseCommand):
+    help = 'Sync we async okamak ýollarynyň bir wagtdaky öndürijiligini deňeşdirýär'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=16, help='Bir wagtdaky soraglar (default: 16)')
+        parser.add_argument('--requests', type=int, default=500, help='Her ýol üçin soraglaryň sany (default: 500)')
+
+    def handle(self, *args, **options):
+        property_obj = Property.objects.filter(is_available=True).first()
+        menu = WeddingMenu.objects.filter(is_active=True).first()
+        if property_obj is None or menu is None:
+            raise CommandError('Öňünden populate_sample_data we seed_catering işlediň')
+
+        paths = [
+            '/properties/',
+            f'/properties/{property_obj.pk}/',
+            f'/properties/{property_obj.pk}/availability/?check_in=2030-01-01&check_out=2030-01-05',
+            f'/properties/{property_obj.pk}/booked_dates/',
+            '/catering/menus/',
+            f'/catering/menus/{menu.pk}/',
+        ]
+        concurrency = options['concurrency']
+        total = options['requests']
+
+        self.stdout.write(f"{'ýol':70}{'sync req/s':>12}{'async req/s':>13}")
+        for path in paths:
+            sync_rate = self.run_sync('/api' + path, total, concurrency)
+            async_rate = asyncio.run(self.run_async('/api/async' + path, total, concurrency))
+            self.stdout.write(f'{path:70}{sync_rate:>12.0f}{async_rate:>13.0f}')
+
+    def run_sync(self, path, total, concurrency):
+        def worker(count):
+            client = Client()
+            for _ in range(count):
+                response = client.get(path)
+                assert response.status_code == 200, response.status_code
+            close_old_connections()
+
+        counts = self.split(total, concurrency)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(worker, counts))
+        return total / (time.perf_counter() - started)
+
+    async def run_async(self, path, total, concurrency):
+        client = AsyncClient()
+
+        async def worker(count):
+            for _ in range(count):
+                response = await client.get(path)
+                assert response.status_code == 200, response.status_code
+
+        counts = self.split(total, concurrency)
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(count) for count in counts))
+        return total / (time.perf_counter() - started)
+
+    @staticmethod
+    def split(total, parts):
+        """total soragy parts işçä deň paýlaýar"""
+        return [total // parts + (1 if index < total % parts else 0) for index in range(parts)]
@@ -0,0 +1,60 @@
+"""
+Management command: venues/management/commands/bench_fast_serializers.py
+
+Sanaw jogaplaryny adaty ModelSerializer we FastSerializer (values()
+setirlerinden) bilen deňeşdirýär: ilki jogaplaryň baýtma-baýt deňdigini
+barlaýar, soňra sekuntdaky soraglaryň sanyny ölçeýär.
+
+Ulanylyşy:
+python manage.py bench_fast_serializers
+python manage.py bench_fast_serializers --requests 300
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client, override_settings
+
+PATHS = [
+    '/api/properties/?size=100',
+    '/api/properties/?size=10&page=2',
+    '/api/properties/?search=a&min_price=1',
+    '/api/catering/dishes/',
+    '/api/catering/dishes/?ordering=-price&page=2',
+    '/api/catering/dishes/?search=chorba',
+    '/api/bookings/',
+    '/api/bookings/?status=pending',
+]
+
+
+class Command(BaseCommand):
+    help = 'Ýeňil sanaw serializer-leriniň çykyşyny we tizligini barlaýar'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=100, help='Her ýol üçin soraglar (default: 100)')
+
+    def handle(self, *args, **options):
+        client = Client()
+        mismatches = []
+        for path in PATHS:
+            with override_settings(FAST_LIST_SERIALIZERS=False):
+                expected = client.get(path)
+            with override_settings(FAST_LIST_SERIALIZERS=True):
+                actual = client.get(path)
+            if expected.status_code != 200 or expected.content != actual.content:
+                mismatches.append(path)
+        if mismatches:
+            raise CommandError(f"Çykyşlar tapawutlanýar: {', '.join(mismatches)}")
+        self.stdout.write(self.style.SUCCESS(f'✓ {len(PATHS)} ýolda çykyşlar baýtma-baýt deň'))
+
+        total = options['requests']
+        self.stdout.write(f"{'ýol':50}{'adaty req/s':>13}{'fast req/s':>12}{'x':>7}")
+        for path in PATHS:
+            rates = []
+            for fast in (False, True):
+                with override_settings(FAST_LIST_SERIALIZERS=fast):
+                    started = time.perf_counter()
+                    for _ in range(total):
+                        client.get(path)
+                    rates.append(total / (time.perf_counter() - started))
+            self.stdout.write(f'{path:50}{rates[0]:>13.0f}{rates[1]:>12.0f}{rates[1] / rates[0]:>7.2f}')
@@ -0,0 +1,82 @@
+"""
+Management command: venues/management/commands/bench_media_urls.py
+
+100 jaýlyk sahypa üçin surat URL-lerini gurmagyň iki usulyny deňeşdirýär:
+  legacy - her obýekt üçin FieldFile.url + request.build_absolute_uri()
+  media  - venue.media.media_url(): prefiks her sorag üçin bir gezek
+Çykyşlaryň birmeňzeşdigi hem barlanýar.
+
+Ulanylyşy:
+python manage.py bench_media_urls
+python manage.py bench_media_urls --page-size 100 --rounds 200
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from rest_framework import serializers
+
+from venues.models import Property
+from venues.serializers import CategorySerializer, PropertyListSerializer
+
+
+class LegacyCategorySerializer(CategorySerializer):
+    icon = serializers.ImageField(required=False, allow_null=True)
+
+    def to_representation(self, instance):
+        representation = super().to_representation(instance)
+        if instance.icon and hasattr(instance.icon, 'url'):
+            representation['icon'] = self.context['request'].build_absolute_uri(instance.icon.url)
+        else:
+            representation['icon'] = None
+        return representation
+
+
+class LegacyPropertyListSerializer(PropertyListSerializer):
+    category = LegacyCategorySerializer(read_only=True)
+
+    def get_main_image(self, obj):
+        main_img = self.main_image_of(obj)
+        if main_img:
+            return self.context['request'].build_absolute_uri(main_img.image.url)
+        return None
+
+
+class Command(BaseCommand):
+    help = 'Surat URL-lerini gurmagyň tizligini ölçeýär (legacy we media_url)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--page-size', type=int, default=100, help='Sahypadaky jaýlar (default: 100)')
+        parser.add_argument('--rounds', type=int, default=100, help='Gaýtalamalar (default: 100)')
+
+    def handle(self, *args, **options):
+        properties = list(
+            Property.objects.select_related('category').prefetch_related('images')[:options['page_size']]
+        )
+        if not properties:
+            raise CommandError('Öňünden populate_sample_data işlediň')
+        # Az maglumat bolsa sahypa gaýtalanýar
+        page = (properties * options['page_size'])[:options['page_size']]
+        factory = RequestFactory()
+
+        def render(serializer_class):
+            request = factory.get('/api/properties/')  # her sahypa täze sorag
+            return serializer_class(page, many=True, context={'request': request}).data
+
+        if render(LegacyPropertyListSerializer) != render(PropertyListSerializer):
+            raise CommandError('Çykyşlar tapawutlanýar')
+
+        rounds = options['rounds']
+        self.stdout.write(f'{len(page)} jaýlyk sahypa, {rounds} gezek')
+        results = {}
+        for name, serializer_class in (('legacy', LegacyPropertyListSerializer), ('media', PropertyListSerializer)):
+            started = time.perf_counter()
+            for _ in range(rounds):
+                render(serializer_class)
+            results[name] = (time.perf_counter() - started) / rounds * 1000
+            self.stdout.write(f'{name:8}{results[name]:>10.2f} ms/sahypa')
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✓ Çykyşlar birmeňzeş, tizlenme: x{results['legacy'] / results['media']:.2f}"
+        ))
@@ -0,0 +1,150 @@
+"""
+Management command: venues/management/commands/bench_sqlite_writes.py
+
+SQLite-yň ýazgy bäsleşigini ölçeýär: birnäçe ýazyjy (bron döredýän) we
+okaýjy (elýeterlilik barlaýan) sapak wagtlaýyn maglumat bazasynda işleýär.
+
+  baseline - Django-nyň adaty sazlamalary: journal DELETE, 5 s garaşmak,
+             her amal üçin täze birikme (CONN_MAX_AGE=0)
+  tuned    - settings.SQLITE_PRAGMAS, her sapak üçin hemişelik birikme
+
+Ulanylyşy:
+python manage.py bench_sqlite_writes
+python manage.py bench_sqlite_writes --writers 8 --readers 16 --seconds 5
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+SCHEMA = """
+    CREATE TABLE booking (
+        id INTEGER PRIMARY KEY,
+        property_id INTEGER NOT NULL,
+        check_in TEXT NOT NULL,
+        check_out TEXT NOT NULL,
+        status TEXT NOT NULL
+    );
+    CREATE INDEX booking_property ON booking (property_id, status);
+"""
+
+INSERT_SQL = (
+    "INSERT INTO booking (property_id, check_in, check_out, status) "
+    "VALUES (?, '2030-01-01', '2030-01-03', 'pending')"
+)
+OVERLAP_SQL = (
+    "SELECT 1 FROM booking WHERE property_id = ? AND status IN ('pending', 'confirmed') "
+    "AND check_in < '2030-01-03' AND check_out > '2030-01-01' LIMIT 1"
+)
+
+
+class Command(BaseCommand):
+    help = 'SQLite sazlamalarynyň ýazgy/okamak öndürijiligine täsirini ölçeýär'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--writers', type=int, default=4, help='Ýazyjy sapaklar (default: 4)')
+        parser.add_argument('--readers', type=int, default=8, help='Okaýjy sapaklar (default: 8)')
+        parser.add_argument('--seconds', type=float, default=3, help='Her ölçeg üçin wagt (default: 3)')
+
+    def handle(self, *args, **options):
+        baseline = self.run(
+            pragmas={'journal_mode': 'DELETE', 'synchronous': 'FULL'},
+            timeout=5,
+            persistent=False,
+            **options
+        )
+        tuned = self.run(
+            pragmas=settings.SQLITE_PRAGMAS,
+            timeout=0,
+            persistent=True,
+            **options
+        )
+
+        self.stdout.write(f"{'':10}{'ýazgy/s':>12}{'okamak/s':>12}{'gulp ýalňyşlygy':>18}")
+        for name, result in (('baseline', baseline), ('tuned', tuned)):
+            self.stdout.write(
+                f"{name:10}{result['writes']:>12.0f}{result['reads']:>12.0f}{result['errors']:>18}"
+            )
+
+        if baseline['writes']:
+            self.stdout.write(self.style.SUCCESS(
+                f"Ýazgy tizligi: x{tuned['writes'] / baseline['writes']:.1f}, "
+                f"okamak tizligi: x{tuned['reads'] / max(baseline['reads'], 1):.1f}"
+            ))
+
+    def run(self, pragmas, timeout, persistent, writers, readers, seconds, **options):
+        handle, path = tempfile.mkstemp(suffix='.sqlite3')
+        os.close(handle)
+        try:
+            setup = sqlite3.connect(path)
+            # journal_mode faýlda saklanýar, şonuň üçin bir gezek bellenýär
+            setup.execute(f"PRAGMA journal_mode={pragmas.get('journal_mode', 'DELETE')}")
+            setup.executescript(SCHEMA)
+            setup.close()
+            return self.measure(path, pragmas, timeout, persistent, writers, readers, seconds)
+        finally:
+            for suffix in ('', '-wal', '-shm', '-journal'):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+
+    def measure(self, path, pragmas, timeout, persistent, writers, readers, seconds):
+        counts = {'writes': 0, 'reads': 0, 'errors': 0}
+        lock = threading.Lock()
+        stop = threading.Event()
+
+        def connect():
+            conn = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+            for name, value in pragmas.items():
+                if name != 'journal_mode':
+                    conn.execute(f'PRAGMA {name}={value}')
+            return conn
+
+        def worker(kind, property_id):
+            done = errors = 0
+            conn = connect() if persistent else None
+            while not stop.is_set():
+                current = conn
+                try:
+                    current = current or connect()
+                    if kind == 'writes':
+                        current.execute('BEGIN IMMEDIATE')
+                        current.execute(INSERT_SQL, [property_id])
+                        current.execute('COMMIT')
+                    else:
+                        current.execute(OVERLAP_SQL, [property_id]).fetchone()
+                    done += 1
+                except sqlite3.OperationalError:
+                    errors += 1
+                    if current is not None and current.in_transaction:
+                        current.execute('ROLLBACK')
+                finally:
+                    if conn is None and current is not None:
+                        current.close()
+            if conn is not None:
+                conn.close()
+            with lock:
+                counts[kind] += done
+                counts['errors'] += errors
+
+        threads = [
+            threading.Thread(target=worker, args=('writes', index)) for index in range(writers)
+        ] + [
+            threading.Thread(target=worker, args=('reads', index)) for index in range(readers)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        return {
+            'writes': counts['writes'] / seconds,
+            'reads': counts['reads'] / seconds,
+            'errors': counts['errors'],
+        }
@@ -0,0 +1,30 @@
+"""
+Management command: venues/management/commands/build_catalog_snapshot.py
+
+Ulanylyşy:
+python manage.py build_catalog_snapshot          # diňe üýtgän bölümler
+python manage.py build_catalog_snapshot --full   # ähli bölümler täzeden
+"""
+
+from django.core.management.base import BaseCommand
+
+from venues.snapshot import ensure_snapshot, snapshot_dir
+
+
+class Command(BaseCommand):
+    help = 'Offline katalog suratyny (gzip/brotli) gurýar'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='Ähli bölümleri täzeden gurmak'
+        )
+
+    def handle(self, *args, **options):
+        manifest = ensure_snapshot(full=options['full'])
+
+        self.stdout.write(self.style.SUCCESS(f"✓ Wersiýa: {manifest['version']} ({manifest['size']} baýt)"))
+        for encoding, name in manifest['files'].items():
+            size = (snapshot_dir() / name).stat().st_size
+            self.stdout.write(f'  {encoding}: {name} ({size} baýt)')
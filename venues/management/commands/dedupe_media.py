@@ -0,0 +1,62 @@
+"""
+Management command: venues/management/commands/dedupe_media.py
+
+Öňki uuid atly suratlary mazmun boýunça salgylanýan ammara (images/cas/...)
+geçirýär: birmeňzeş faýllar bir gezek saklanýar we hemişelik URL alýar.
+
+Ulanylyşy:
+python manage.py dedupe_media
+python manage.py dedupe_media --delete-old
+"""
+
+from django.core.management.base import BaseCommand
+
+from venue.storage import is_immutable, media_storage
+from venues.models import Category, PropertyImage
+
+
+class Command(BaseCommand):
+    help = 'Köne suratlary mazmun hash-y boýunça saklanýan ýollara geçirýär'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--delete-old', action='store_true', help='Geçirilen köne faýllary pozmak')
+
+    def handle(self, *args, **options):
+        targets = [
+            (PropertyImage.objects.exclude(image=''), 'image', ['image']),
+            (Category.objects.exclude(icon='').exclude(icon__isnull=True), 'icon', ['icon', 'updated_at']),
+        ]
+        moved = missing = 0
+        old_names = set()
+        new_names = set()
+
+        for queryset, field, update_fields in targets:
+            for obj in queryset.iterator(chunk_size=500):
+                file = getattr(obj, field)
+                old_name = file.name
+                if is_immutable(old_name):
+                    new_names.add(old_name)
+                    continue
+                if not media_storage.exists(old_name):
+                    missing += 1
+                    continue
+
+                with media_storage.open(old_name) as content:
+                    file.name = media_storage.save(old_name, content)
+                # save() signal-lary jaýyň updated_at-yny we offline suraty täzeleýär
+                obj.save(update_fields=update_fields)
+                old_names.add(old_name)
+                new_names.add(file.name)
+                moved += 1
+
+        saved = 0
+        if options['delete_old']:
+            for name in old_names:
+                saved += media_storage.size(name)
+                media_storage.delete(name)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ Geçirildi: {moved}, tapylmady: {missing}, '
+            f'üýtgeşik faýllar: {len(new_names)}'
+            + (f', boşadylan ýer: {saved / 1024 / 1024:.1f} MB' if options['delete_old'] else '')
+        ))
@@ -0,0 +1,48 @@
+"""
+Management command: venues/management/commands/export_bookings.py
+
+Ulanylyşy:
+python manage.py export_bookings --output bookings.csv
+python manage.py export_bookings --format ndjson --date-from 2025-01-01 --status confirmed,completed
+python manage.py export_bookings --archived --date-to 2023-12-31 --output archive.csv
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from venues import exports
+
+
+class Command(BaseCommand):
+    help = 'Bronlary CSV ýa-da NDJSON görnüşinde akym bilen eksport edýär'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', choices=exports.FORMATS, default='csv', help='Faýl formaty (default: csv)')
+        parser.add_argument('--output', help='Faýlyň ady (berilmese stdout)')
+        parser.add_argument('--date-from', help='Giriş senesi şundan (YYYY-MM-DD)')
+        parser.add_argument('--date-to', help='Giriş senesi şu güne çenli (YYYY-MM-DD)')
+        parser.add_argument('--status', help='Statuslar vergül bilen (meselem: confirmed,completed)')
+        parser.add_argument('--archived', action='store_true', help='Arhiwlenen bronlary eksport etmek')
+        parser.add_argument('--chunk-size', type=int, default=exports.CHUNK_SIZE, help='Bir gezekde okalýan bronlar')
+
+    def handle(self, *args, **options):
+        try:
+            date_from = exports.parse_date(options['date_from'])
+            date_to = exports.parse_date(options['date_to'])
+        except ValueError:
+            raise CommandError('Sene formaty nädogry (YYYY-MM-DD)')
+
+        statuses = options['status'].split(',') if options['status'] else None
+        queryset = exports.export_queryset(date_from, date_to, statuses, archived=options['archived'])
+        lines = exports.export_lines(options['format'], queryset, chunk_size=options['chunk_size'])
+
+        if not options['output']:
+            for line in lines:
+                self.stdout.write(line, ending='')
+            return
+
+        count = -1 if options['format'] == 'csv' else 0
+        with open(options['output'], 'w', encoding='utf-8', newline='') as file:
+            for line in lines:
+                file.write(line)
+                count += 1
+        self.stderr.write(self.style.SUCCESS(f"✓ {count} bron eksport edildi: {options['output']}"))
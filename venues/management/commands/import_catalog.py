@@ -0,0 +1,46 @@
+"""
+Management command: venues/management/commands/import_catalog.py
+
+Sütünler we format üçin venues/imports.py-a serediň.
+
+Ulanylyşy:
+python manage.py import_catalog services services.csv
+python manage.py import_catalog properties properties.csv
+python manage.py import_catalog menus menus.ndjson --batch-size 200
+"""
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from venues import imports
+
+
+class Command(BaseCommand):
+    help = 'Jaýlary, hyzmatlary we katering katalogyny CSV/NDJSON faýldan import edýär'
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=list(imports.IMPORTERS), help='Näme import edilýär')
+        parser.add_argument('path', help='Faýlyň ýoly')
+        parser.add_argument('--format', choices=imports.FORMATS, help='Faýl formaty (default: giňeltmeden)')
+        parser.add_argument('--batch-size', type=int, default=imports.BATCH_SIZE, help='Bir tranzaksiýadaky setirler')
+
+    def handle(self, *args, **options):
+        file_format = options['format'] or options['path'].rsplit('.', 1)[-1].lower()
+        if file_format not in imports.FORMATS:
+            raise CommandError(f"Format näbelli: {file_format} (--format {'/'.join(imports.FORMATS)})")
+
+        try:
+            with open(options['path'], encoding='utf-8-sig', newline='') as stream:
+                report = imports.import_stream(
+                    options['kind'], stream, file_format, batch_size=options['batch_size']
+                )
+        except OSError as exc:
+            raise CommandError(str(exc))
+
+        for error in report['errors']:
+            self.stdout.write(self.style.ERROR(f"Setir {error['row']}: {json.dumps(error['errors'], ensure_ascii=False)}"))
+        self.stdout.write(self.style.SUCCESS(
+            f"✓ Döredildi: {report['created']}, täzelendi: {report['updated']}, "
+            f"ýalňyş: {len(report['errors'])}"
+        ))
@@ -0,0 +1,47 @@
+"""
+Management command: venues/management/commands/process_bookings.py
+
+Bronlaryň statuslaryny awtomatik täzeleýär (venues/lifecycle.py):
+möhleti geçen pending bronlar 'expired', çykyş senesi geçen confirmed
+bronlar 'completed' bolýar. Möhleti geçen Idempotency-Key ýazgylary,
+köne PubSubEvent wakalary we SYNC_TOMBSTONE_DAYS-dan köne SyncTombstone
+ýazgylary hem arassalanýar. Yzygiderli işledilmeli
+(cron, meselem her 15 minut).
+
+Status üýtgeşmeleriniň SSE wakalary SSE serwerine diňe
+PUBSUB_BACKEND='database' bilen ýetýär ('local' diňe bir prosesiň içinde).
+
+Ulanylyşy:
+python manage.py process_bookings
+python manage.py process_bookings --ttl-hours 24 --batch-size 500
+*/15 * * * * cd /srv/venue && python manage.py process_bookings -v 0
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from venues import events, idempotency, lifecycle, sync
+
+
+class Command(BaseCommand):
+    help = 'Möhleti geçen bronlary ýapýar we geçen bronlary tamamlaýar'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ttl-hours', type=int, default=None,
+                            help='Pending bronyň möhleti (default: BOOKING_PENDING_TTL_HOURS)')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Bir UPDATE-de täzelenýän bronlar')
+
+    def handle(self, *args, **options):
+        result = lifecycle.process(ttl_hours=options['ttl_hours'], batch_size=options['batch_size'])
+        keys = idempotency.purge_expired()
+        events.purge_events()
+        tombstones = sync.purge_tombstones()
+        if options['verbosity'] > 0:
+            self.stdout.write(self.style.SUCCESS(
+                f"✓ {result['expired']} bronyň möhleti geçdi, {result['completed']} bron tamamlandy, "
+                f"{keys} idempotency açary we {tombstones} köne tombstone pozuldy"
+            ))
+            if settings.PUBSUB_BACKEND == 'local' and (result['expired'] or result['completed']):
+                self.stdout.write(self.style.WARNING(
+                    "PUBSUB_BACKEND='local': status üýtgeşmeleriniň SSE wakalary okyjylara ýetmeýär"
+                ))
@@ -0,0 +1,29 @@
+"""
+Management command: venues/management/commands/rebuild_booking_stats.py
+
+Günlük bron jemlerini (BookingDailyStat) ähli taryhdan täzeden gurýar.
+Bronlar aý-aýdan okalýar, şonuň üçin ýat ulanylyşy taryhyň uzynlygyna
+bagly däl. Adatça gerek däl (jemler signal-lar arkaly täzelenýär), diňe
+ilkinji gurnamada ýa-da maglumatlar göni SQL bilen üýtgedilende.
+
+Ulanylyşy:
+python manage.py rebuild_booking_stats
+python manage.py rebuild_booking_stats --batch-size 5000 -v 2
+"""
+
+from django.core.management.base import BaseCommand
+
+from venues import rollups
+
+
+class Command(BaseCommand):
+    help = 'Günlük bron jemlerini taryhdan täzeden gurýar'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=2000, help='Bir gezekde okalýan bronlar')
+
+    def handle(self, *args, **options):
+        log = self.stdout.write if options['verbosity'] > 1 else None
+        with rollups.suspend_rollups():
+            total = rollups.rebuild(batch_size=options['batch_size'], log=log)
+        self.stdout.write(self.style.SUCCESS(f'✓ {total} günlük setir ýazyldy'))
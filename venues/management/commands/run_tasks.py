@@ -0,0 +1,75 @@
+"""
+Management command: venues/management/commands/run_tasks.py
+
+Fon işleriniň işçisi (venues/tasks.py): nobatdaky işleri eýeleýär we
+thread ýa-da process pool-da ýerine ýetirýär. Birnäçe işçi (birnäçe
+serwerde hem) bir wagtda işledilip bilner.
+
+Ulanylyşy:
+python manage.py run_tasks
+python manage.py run_tasks --concurrency 8 --pool process
+python manage.py run_tasks --once   # nobatdaky işleri gutaryp çykmak
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from venues import tasks
+
+POOLS = {'thread': ThreadPoolExecutor, 'process': ProcessPoolExecutor}
+
+
+class Command(BaseCommand):
+    help = 'Fon işleriniň nobatyny işledýär'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=settings.TASK_WORKER_CONCURRENCY,
+                            help='Bir wagtda işleýän işler (default: TASK_WORKER_CONCURRENCY)')
+        parser.add_argument('--pool', choices=POOLS, default='thread', help='thread (I/O) ýa-da process (CPU)')
+        parser.add_argument('--poll-interval', type=float, default=1.0, help='Nobat boş bolanda garaşmak (sekunt)')
+        parser.add_argument('--once', action='store_true', help='Wagty gelen işleri gutaryp çykmak')
+
+    def handle(self, *args, **options):
+        worker = tasks.worker_name()
+        concurrency = options['concurrency']
+        if options['pool'] == 'process':
+            # Çaga prosesler ene prosesiň DB birikmelerini ulanmaly däl
+            connections.close_all()
+
+        done = failed = 0
+        running = set()
+        self.stdout.write(f'Işçi {worker}: {options["pool"]} x{concurrency}')
+        with POOLS[options['pool']](max_workers=concurrency) as pool:
+            try:
+                while True:
+                    if not running:
+                        tasks.release_stale()
+                    free = concurrency - len(running)
+                    claimed = tasks.claim(worker, free) if free else []
+                    running.update(pool.submit(tasks.execute, *item) for item in claimed)
+
+                    if not running:
+                        if options['once']:
+                            break
+                        time.sleep(options['poll_interval'])
+                        continue
+
+                    # Boş ýer bar bolsa, täze işler üçin poll_interval-dan soň nobat barlanýar
+                    finished, running = wait(
+                        running,
+                        timeout=None if len(running) >= concurrency else options['poll_interval'],
+                        return_when=FIRST_COMPLETED
+                    )
+                    for future in finished:
+                        if future.result():
+                            done += 1
+                        else:
+                            failed += 1
+            except KeyboardInterrupt:
+                self.stdout.write('Duruzylýar, işlenýän işlere garaşylýar...')
+
+        self.stdout.write(self.style.SUCCESS(f'✓ {done} iş ýerine ýetirildi, {failed} şowsuz'))
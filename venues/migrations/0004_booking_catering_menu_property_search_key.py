@@ -0,0 +1,70 @@
+# Generated by Django 5.2.6 on 2026-10-19 19:27
+
+import re
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Migrasiýa häzirki venue.search moduluna bagly bolmaly däl: transliterasiýa
+# şu ýerde şol wagtky görnüşinde saklanýar
+CYRILLIC = {
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'e',
+    'ж': 'zh', 'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm',
+    'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u',
+    'ф': 'f', 'х': 'h', 'ц': 'ts', 'ч': 'ch', 'ш': 'sh', 'щ': 'sch', 'ъ': '',
+    'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya',
+    'ә': 'a', 'ө': 'o', 'ү': 'u', 'җ': 'j', 'ң': 'n',
+}
+TURKMEN_LATIN = {
+    'ç': 'ch', 'ş': 'sh', 'ž': 'zh', 'ý': 'y', 'ň': 'n',
+    'ä': 'a', 'ö': 'o', 'ü': 'u',
+}
+TRANSLITERATION = str.maketrans({**CYRILLIC, **TURKMEN_LATIN})
+NON_WORD = re.compile(r'[\W_]+')
+
+
+def normalize_search_text(value):
+    if not value:
+        return ''
+    value = unicodedata.normalize('NFC', str(value)).casefold()
+    value = value.translate(TRANSLITERATION)
+    value = ''.join(
+        char for char in unicodedata.normalize('NFKD', value)
+        if not unicodedata.combining(char)
+    )
+    return NON_WORD.sub(' ', value).strip()
+
+
+def build_search_key(*values):
+    return ' '.join(filter(None, (normalize_search_text(value) for value in values)))
+
+
+def fill_search_keys(apps, schema_editor):
+    Property = apps.get_model('venues', 'Property')
+    properties = list(Property.objects.all())
+    for obj in properties:
+        obj.search_key = build_search_key(obj.title, obj.address, obj.description)
+    Property.objects.bulk_update(properties, ['search_key'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catering', '0003_search_key'),
+        ('venues', '0003_category_alter_property_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='catering_menu',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='bookings', to='catering.weddingmenu', verbose_name='Saýlanan toý menýusy'),
+        ),
+        migrations.AddField(
+            model_name='property',
+            name='search_key',
+            field=models.TextField(blank=True, db_index=True, editable=False, verbose_name='Gözleg açary'),
+        ),
+        migrations.RunPython(fill_search_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.6 on 2026-10-19 19:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('venues', '0004_booking_catering_menu_property_search_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(max_length=50, verbose_name='Model')),
+                ('object_id', models.BigIntegerField(verbose_name='Obýektiň ID-si')),
+                ('deleted_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'verbose_name': 'Pozulan ýazgy',
+                'verbose_name_plural': 'Pozulan ýazgylar',
+                'ordering': ['deleted_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='property',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.6 on 2026-10-19 19:41
+
+import venue.storage
+import venues.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('venues', '0005_sync'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='category',
+            name='icon',
+            field=models.ImageField(blank=True, null=True, storage=venue.storage.ContentAddressedStorage(), upload_to=venues.models.category_icon_path, verbose_name='Ikonka suraty'),
+        ),
+        migrations.AlterField(
+            model_name='propertyimage',
+            name='image',
+            field=models.ImageField(storage=venue.storage.ContentAddressedStorage(), upload_to=venues.models.property_image_path, verbose_name='Surat'),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.2.6 on 2026-10-19 19:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('venues', '0006_media_storage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='icon_dominant_color',
+            field=models.CharField(blank=True, editable=False, max_length=7),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='icon_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='icon_placeholder',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='icon_size',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='icon_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='propertyimage',
+            name='dominant_color',
+            field=models.CharField(blank=True, editable=False, max_length=7, verbose_name='Esasy reňk'),
+        ),
+        migrations.AddField(
+            model_name='propertyimage',
+            name='height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Beýikligi (px)'),
+        ),
+        migrations.AddField(
+            model_name='propertyimage',
+            name='placeholder',
+            field=models.TextField(blank=True, editable=False, verbose_name='LQIP suraty'),
+        ),
+        migrations.AddField(
+            model_name='propertyimage',
+            name='size',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Ululygy (baýt)'),
+        ),
+        migrations.AddField(
+            model_name='propertyimage',
+            name='width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Ini (px)'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.6 on 2026-10-19 19:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('venues', '0007_image_metadata'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookingDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='Sene')),
+                ('occupied', models.IntegerField(default=0, verbose_name='Eýelenen gijeler')),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='Girdeji')),
+                ('check_ins', models.IntegerField(default=0, verbose_name='Girişler')),
+                ('stay_nights', models.IntegerField(default=0, help_text='Ortaça galmak wagty = stay_nights / check_ins', verbose_name='Şu gün girenleriň gijeleri')),
+                ('property', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='venues.property')),
+            ],
+            options={
+                'verbose_name': 'Günlük statistika',
+                'verbose_name_plural': 'Günlük statistikalar',
+                'indexes': [models.Index(fields=['date'], name='venues_book_date_bf9ddd_idx')],
+                'unique_together': {('property', 'date')},
+            },
+        ),
+    ]
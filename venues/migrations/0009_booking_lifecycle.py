@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-19 19:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catering', '0005_updated_at_index'),
+        ('venues', '0008_booking_daily_stat'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='booking',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Garaşylýar'), ('confirmed', 'Tassyklandy'), ('cancelled', 'Ýatyryldy'), ('completed', 'Tamamlandy'), ('expired', 'Möhleti geçdi')], default='pending', max_length=20, verbose_name='Status'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['status', 'created_at'], name='venues_book_status_71f566_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['status', 'check_out'], name='venues_book_status_4285e6_idx'),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.6 on 2026-10-19 19:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catering', '0005_updated_at_index'),
+        ('venues', '0009_booking_lifecycle'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedBooking',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('customer_name', models.CharField(max_length=255, verbose_name='Müşderiniň ady')),
+                ('customer_phone', models.CharField(db_index=True, max_length=20, verbose_name='Telefon belgisi')),
+                ('customer_email', models.EmailField(blank=True, max_length=254, verbose_name='Email')),
+                ('check_in', models.DateField(verbose_name='Giriş senesi')),
+                ('check_out', models.DateField(verbose_name='Çykyş senesi')),
+                ('guests_count', models.IntegerField(verbose_name='Myhmanlaryň sany')),
+                ('total_price', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='Jemi baha')),
+                ('status', models.CharField(choices=[('pending', 'Garaşylýar'), ('confirmed', 'Tassyklandy'), ('cancelled', 'Ýatyryldy'), ('completed', 'Tamamlandy'), ('expired', 'Möhleti geçdi')], max_length=20, verbose_name='Status')),
+                ('notes', models.TextField(blank=True, verbose_name='Bellikler')),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('catering_menu', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='archived_bookings', to='catering.weddingmenu', verbose_name='Saýlanan toý menýusy')),
+                ('property', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_bookings', to='venues.property')),
+            ],
+            options={
+                'verbose_name': 'Arhiwlenen bron',
+                'verbose_name_plural': 'Arhiwlenen bronlar',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedBookingService',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('quantity', models.IntegerField(default=1, verbose_name='Mukdary')),
+                ('price', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='Baha')),
+                ('booking', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='booking_services', to='venues.archivedbooking')),
+                ('service', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='venues.service')),
+            ],
+            options={
+                'verbose_name': 'Arhiwlenen bronuň hyzmaty',
+                'verbose_name_plural': 'Arhiwlenen bronlaryň hyzmatlary',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='archivedbooking',
+            index=models.Index(fields=['check_in'], name='venues_arch_check_i_3e24b0_idx'),
+        ),
+    ]
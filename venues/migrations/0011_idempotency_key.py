@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-19 19:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('venues', '0010_booking_archive'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdempotencyKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=255, unique=True, verbose_name='Açar')),
+                ('fingerprint', models.CharField(max_length=64, verbose_name='Soragyň hash-y')),
+                ('status_code', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('response', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'verbose_name': 'Idempotency açary',
+                'verbose_name_plural': 'Idempotency açarlary',
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.6 on 2026-10-19 19:57
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('venues', '0011_idempotency_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BackgroundTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, verbose_name='Işiň ady')),
+                ('payload', models.JSONField(blank=True, default=dict, verbose_name='Parametrler')),
+                ('status', models.CharField(choices=[('queued', 'Nobatda'), ('running', 'Işlenýär'), ('failed', 'Şowsuz')], default='queued', max_length=10, verbose_name='Status')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Synanyşyklar')),
+                ('max_attempts', models.PositiveIntegerField(default=5, verbose_name='Iň köp synanyşyk')),
+                ('run_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Işlemeli wagty')),
+                ('locked_by', models.CharField(blank=True, max_length=100, verbose_name='Işçi')),
+                ('locked_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True, verbose_name='Soňky ýalňyşlyk')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Fon işi',
+                'verbose_name_plural': 'Fon işleri',
+                'ordering': ['run_at'],
+                'indexes': [models.Index(fields=['status', 'run_at'], name='venues_back_status_c18a60_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-19 20:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('venues', '0012_background_task'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PubSubEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('channel', models.CharField(max_length=100, verbose_name='Kanal')),
+                ('payload', models.JSONField(default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'verbose_name': 'Waka',
+                'verbose_name_plural': 'Wakalar',
+            },
+        ),
+    ]
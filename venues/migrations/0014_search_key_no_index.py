@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-19 20:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('venues', '0013_pubsub_event'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='property',
+            name='search_key',
+            field=models.TextField(blank=True, editable=False, verbose_name='Gözleg açary'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-19 20:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('venues', '0014_search_key_no_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='icon_metadata_failed',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name='propertyimage',
+            name='metadata_failed',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Metadata okalmady'),
+        ),
+    ]
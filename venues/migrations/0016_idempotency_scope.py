@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-19 20:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('venues', '0015_image_metadata_failed'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='idempotencykey',
+            name='scope',
+            field=models.CharField(default='', max_length=80, verbose_name='Eýesi'),
+        ),
+        migrations.AlterField(
+            model_name='idempotencykey',
+            name='key',
+            field=models.CharField(max_length=255, verbose_name='Açar'),
+        ),
+        migrations.AddConstraint(
+            model_name='idempotencykey',
+            constraint=models.UniqueConstraint(fields=('scope', 'key'), name='idempotency_scope_key_unique'),
+        ),
+    ]
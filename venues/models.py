@@ -1,14 +1,23 @@
-from django.db import models
+from django.db import models, transaction
 from django.core.validators import MinValueValidator
+from django.utils import timezone
 import uuid
 from datetime import date
+import logging
 import os
 
+from venue.images import EMPTY as EMPTY_IMAGE_METADATA, image_metadata
+from venue.search import SearchKeyMixin
+from venue.storage import media_storage
+
+logger = logging.getLogger(__name__)
+
 
 def property_image_path(instance, filename):
     """
     Generates file path for uploaded property images:
     images/properties/<year>/<month>/<day>/<uuid>.<ext>
+    (media_storage bu ýoly mazmun hash-y bilen çalyşýar, diňe giňeltme saklanýar)
     """
     ext = filename.split('.')[-1]
     unique_name = f'{uuid.uuid4()}.{ext}'
@@ -43,8 +52,76 @@ def category_icon_path(instance, filename):
     )
 
 
-class Category(models.Model):
+def stored_image_metadata(file):
+    """Ammardaky faýlyň metadata-sy; faýl ýok ýa-da okalmasa boş"""
+    try:
+        size = file.size
+        with file.open('rb'):
+            metadata = image_metadata(file, size=size)
+    except OSError as exc:
+        logger.warning('Suratyň metadata-sy okalmady: %s (%s)', file.name, exc)
+        metadata = dict(EMPTY_IMAGE_METADATA)
+    metadata['metadata_failed'] = metadata['width'] is None
+    return metadata
+
+
+class ImageMetadataMixin:
+    """
+    save() wagtynda suratyň metadata-syny (venue/images.py) doldurýar.
+    Täze ýüklenen suratyň metadata-sy fon işinde hasaplanýar (venues/tasks.py).
+    image_metadata_fields = {'surat meýdany': 'metadata meýdanlarynyň prefiksi'}
+
+    Faýl ýok ýa-da surat açylmasa metadata boş galýar, <prefiks>metadata_failed
+    bellenýär we indiki save()-lerde faýl täzeden okalmaýar (force=True okaýar).
+    save() metadata sebäpli hiç wagt şowsuz bolmaýar.
+    """
+    image_metadata_fields = {}
+
+    def refresh_image_metadata(self, force=False, defer_uploads=False):
+        """
+        Metadata-ny täzeleýär, üýtgän meýdanlaryň atlaryny gaýtarýar.
+        defer_uploads=True: täze ýüklenen surat okalmaýar, metadata boşadylýar
+        we self._image_metadata_pending bellenýär (signals.py fon işini goýýar).
+        """
+        changed = []
+        for field, prefix in self.image_metadata_fields.items():
+            file = getattr(self, field)
+            if not file:
+                metadata = EMPTY_IMAGE_METADATA
+            elif not file._committed and defer_uploads:
+                metadata = dict(EMPTY_IMAGE_METADATA, size=file.size)
+                self._image_metadata_pending = True
+            elif not file._committed:
+                # Ýüklenen faýl entek ammarda ýok: göni ýatdan/wagtlaýyn faýldan okalýar
+                file.file.seek(0)
+                metadata = image_metadata(file.file, size=file.size)
+                file.file.seek(0)
+                metadata['metadata_failed'] = metadata['width'] is None
+            elif force or (
+                getattr(self, f'{prefix}width') is None
+                and not getattr(self, f'{prefix}metadata_failed')
+            ):
+                metadata = stored_image_metadata(file)
+            else:
+                continue
+            metadata.setdefault('metadata_failed', False)
+            for name, value in metadata.items():
+                setattr(self, prefix + name, value)
+                changed.append(prefix + name)
+        return changed
+
+    def save(self, *args, **kwargs):
+        changed = self.refresh_image_metadata(defer_uploads=True)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, *changed}
+        super().save(*args, **kwargs)
+
+
+class Category(ImageMetadataMixin, models.Model):
     """Jaý Kategoriýasy modeli"""
+    image_metadata_fields = {'icon': 'icon_'}
+
     name = models.CharField(max_length=100, unique=True, verbose_name="Ady")
     slug = models.SlugField(max_length=100, unique=True, verbose_name="Slug")
     description = models.TextField(blank=True, verbose_name="Düşündiriş")
@@ -52,10 +129,19 @@ class Category(models.Model):
     # CHARFIELD ýerine IMAGEFIELD hökmünde üýtgedildi
     icon = models.ImageField(
         upload_to=category_icon_path,  # Kustom faýl ýoly
+        storage=media_storage,  # faýl mazmuny boýunça saklanýar (images/cas/...)
         blank=True,
         null=True,  # Surat hökmünde goşulmazlygy mümkin
         verbose_name="Ikonka suraty"
     )
+    # Ikonkanyň metadata-sy (ImageMetadataMixin doldurýar)
+    icon_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    icon_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    icon_size = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    icon_dominant_color = models.CharField(max_length=7, blank=True, editable=False)
+    icon_placeholder = models.TextField(blank=True, editable=False)
+    icon_metadata_failed = models.BooleanField(default=False, editable=False)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         verbose_name = "Kategoriýa"
@@ -66,8 +152,10 @@ class Category(models.Model):
         return self.name
 
 
-class Property(models.Model):
+class Property(SearchKeyMixin, models.Model):
     """Jaý/Otag modeli"""
+    search_key_fields = ('title', 'address', 'description')
+
     category = models.ForeignKey(
         Category,
         on_delete=models.SET_NULL,  # Kategoriýa ýatyrylsa, jaý NULL bolýar
@@ -98,8 +186,13 @@ class Property(models.Model):
         default=True,
         verbose_name="Elýeterli"
     )
+    search_key = models.TextField(
+        blank=True,
+        editable=False,
+        verbose_name="Gözleg açary"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         verbose_name = "Palata"
@@ -110,8 +203,10 @@ class Property(models.Model):
         return self.title
 
 
-class PropertyImage(models.Model):
+class PropertyImage(ImageMetadataMixin, models.Model):
     """Jaýyň suratlary"""
+    image_metadata_fields = {'image': ''}
+
     property = models.ForeignKey(
         Property,
         related_name='images',
@@ -119,6 +214,7 @@ class PropertyImage(models.Model):
     )
     image = models.ImageField(
         upload_to=property_image_path,
+        storage=media_storage,
         verbose_name="Surat"
     )
     is_main = models.BooleanField(
@@ -129,6 +225,14 @@ class PropertyImage(models.Model):
         default=0,
         verbose_name="Tertip"
     )
+    # Metadata: müşderi suraty ýüklemezden öň kartoçkany çyzyp bilýär
+    width = models.PositiveIntegerField(null=True, blank=True, editable=False, verbose_name="Ini (px)")
+    height = models.PositiveIntegerField(null=True, blank=True, editable=False, verbose_name="Beýikligi (px)")
+    size = models.PositiveIntegerField(null=True, blank=True, editable=False, verbose_name="Ululygy (baýt)")
+    dominant_color = models.CharField(max_length=7, blank=True, editable=False, verbose_name="Esasy reňk")
+    placeholder = models.TextField(blank=True, editable=False, verbose_name="LQIP suraty")
+    # Faýl ýok ýa-da surat açylmady: metadata her save()-de täzeden okalmaýar
+    metadata_failed = models.BooleanField(default=False, editable=False, verbose_name="Metadata okalmady")
     uploaded_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -158,6 +262,7 @@ class Service(models.Model):
         verbose_name="Işjeň"
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         verbose_name = "Hyzmat"
@@ -208,6 +313,7 @@ class Booking(models.Model):
         ('confirmed', 'Tassyklandy'),
         ('cancelled', 'Ýatyryldy'),
         ('completed', 'Tamamlandy'),
+        ('expired', 'Möhleti geçdi'),
     ]
 
     property = models.ForeignKey(
@@ -263,10 +369,24 @@ class Booking(models.Model):
         verbose_name = "Bron"
         verbose_name_plural = "Bronlar"
         ordering = ['-created_at']
+        indexes = [
+            # process_bookings: möhleti geçen pending we geçen confirmed bronlar
+            models.Index(fields=['status', 'created_at']),
+            models.Index(fields=['status', 'check_out']),
+        ]
 
     def __str__(self):
         return f"{self.property.title} - {self.customer_name} ({self.check_in})"
 
+    def save(self, *args, **kwargs):
+        # Günlük jemleriň fon işi (signals.py) bron bilen bir tranzaksiýada ýazylýar
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic(using=kwargs.get('using')):
+            return super().delete(*args, **kwargs)
+
 
 class BookingService(models.Model):
     """Bronda saýlanan goşmaça hyzmatlar"""
@@ -296,3 +416,192 @@ class BookingService(models.Model):
 
     def __str__(self):
         return f"{self.booking} - {self.service.name}"
+
+
+class ArchivedBooking(models.Model):
+    """
+    Arhiwlenen (köne, tamamlanan/ýatyrylan/möhleti geçen) bronlar.
+    Booking bilen şol bir meýdanlar we ID; archive_bookings buýrugy doldurýar.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    property = models.ForeignKey(
+        Property,
+        related_name='archived_bookings',
+        on_delete=models.CASCADE
+    )
+    customer_name = models.CharField(max_length=255, verbose_name="Müşderiniň ady")
+    customer_phone = models.CharField(max_length=20, db_index=True, verbose_name="Telefon belgisi")
+    customer_email = models.EmailField(blank=True, verbose_name="Email")
+    check_in = models.DateField(verbose_name="Giriş senesi")
+    check_out = models.DateField(verbose_name="Çykyş senesi")
+    guests_count = models.IntegerField(verbose_name="Myhmanlaryň sany")
+    total_price = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Jemi baha")
+    status = models.CharField(max_length=20, choices=Booking.STATUS_CHOICES, verbose_name="Status")
+    notes = models.TextField(blank=True, verbose_name="Bellikler")
+    catering_menu = models.ForeignKey(
+        'catering.WeddingMenu',
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='archived_bookings',
+        verbose_name='Saýlanan toý menýusy'
+    )
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Arhiwlenen bron"
+        verbose_name_plural = "Arhiwlenen bronlar"
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['check_in']),
+        ]
+
+    def __str__(self):
+        return f"{self.property.title} - {self.customer_name} ({self.check_in})"
+
+
+class ArchivedBookingService(models.Model):
+    """Arhiwlenen bronuň hyzmatlary (BookingService bilen şol bir ID)"""
+    id = models.BigIntegerField(primary_key=True)
+    booking = models.ForeignKey(
+        ArchivedBooking,
+        related_name='booking_services',
+        on_delete=models.CASCADE
+    )
+    service = models.ForeignKey(
+        Service,
+        on_delete=models.CASCADE
+    )
+    quantity = models.IntegerField(default=1, verbose_name="Mukdary")
+    price = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="Baha")
+
+    class Meta:
+        verbose_name = "Arhiwlenen bronuň hyzmaty"
+        verbose_name_plural = "Arhiwlenen bronlaryň hyzmatlary"
+
+    def __str__(self):
+        return f"{self.booking} - {self.service.name}"
+
+
+class IdempotencyKey(models.Model):
+    """
+    Idempotency-Key sözbaşyly soraglaryň ilkinji jogaby (venues/idempotency.py).
+    Açar eýesiniň (scope) çäginde täk; status_code boş bolsa sorag heniz işlenýär.
+    """
+    scope = models.CharField(max_length=80, default='', verbose_name="Eýesi")
+    key = models.CharField(max_length=255, verbose_name="Açar")
+    fingerprint = models.CharField(max_length=64, verbose_name="Soragyň hash-y")
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    response = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        verbose_name = "Idempotency açary"
+        verbose_name_plural = "Idempotency açarlary"
+        constraints = [
+            models.UniqueConstraint(fields=['scope', 'key'], name='idempotency_scope_key_unique'),
+        ]
+
+    def __str__(self):
+        return self.key
+
+
+class BackgroundTask(models.Model):
+    """
+    Fon işleriniň nobaty (venues/tasks.py). Üstünlikli ýerine ýetirilen iş
+    pozulýar, diňe garaşýan, işlenýän we şowsuz işler saklanýar.
+    """
+    STATUS_CHOICES = [
+        ('queued', 'Nobatda'),
+        ('running', 'Işlenýär'),
+        ('failed', 'Şowsuz'),
+    ]
+
+    name = models.CharField(max_length=100, verbose_name="Işiň ady")
+    payload = models.JSONField(default=dict, blank=True, verbose_name="Parametrler")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued', verbose_name="Status")
+    attempts = models.PositiveIntegerField(default=0, verbose_name="Synanyşyklar")
+    max_attempts = models.PositiveIntegerField(default=5, verbose_name="Iň köp synanyşyk")
+    run_at = models.DateTimeField(default=timezone.now, verbose_name="Işlemeli wagty")
+    locked_by = models.CharField(max_length=100, blank=True, verbose_name="Işçi")
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, verbose_name="Soňky ýalňyşlyk")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Fon işi"
+        verbose_name_plural = "Fon işleri"
+        ordering = ['run_at']
+        indexes = [
+            models.Index(fields=['status', 'run_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
+
+
+class PubSubEvent(models.Model):
+    """Prosesleriň arasynda paýlanýan wakalar (PUBSUB_BACKEND='database', venues/events.py)"""
+    channel = models.CharField(max_length=100, verbose_name="Kanal")
+    payload = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        verbose_name = "Waka"
+        verbose_name_plural = "Wakalar"
+
+    def __str__(self):
+        return f"{self.channel} #{self.pk}"
+
+
+class SyncTombstone(models.Model):
+    """Pozulan ýazgylaryň yzy (mobil programmanyň delta sinhronizasiýasy üçin)"""
+    model = models.CharField(max_length=50, verbose_name="Model")
+    object_id = models.BigIntegerField(verbose_name="Obýektiň ID-si")
+    deleted_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        verbose_name = "Pozulan ýazgy"
+        verbose_name_plural = "Pozulan ýazgylar"
+        ordering = ['deleted_at']
+
+    def __str__(self):
+        return f"{self.model} #{self.object_id}"
+
+
+class BookingDailyStat(models.Model):
+    """
+    Jaý we gün boýunça bronlaryň jemi (analitika üçin).
+    Booking signal-lary arkaly täzelenýär, doly täzeden gurmak:
+    python manage.py rebuild_booking_stats
+    """
+    property = models.ForeignKey(
+        Property,
+        related_name='daily_stats',
+        on_delete=models.CASCADE
+    )
+    date = models.DateField(verbose_name="Sene")
+    occupied = models.IntegerField(default=0, verbose_name="Eýelenen gijeler")
+    revenue = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        verbose_name="Girdeji"
+    )
+    check_ins = models.IntegerField(default=0, verbose_name="Girişler")
+    stay_nights = models.IntegerField(
+        default=0,
+        verbose_name="Şu gün girenleriň gijeleri",
+        help_text="Ortaça galmak wagty = stay_nights / check_ins"
+    )
+
+    class Meta:
+        verbose_name = "Günlük statistika"
+        verbose_name_plural = "Günlük statistikalar"
+        unique_together = ['property', 'date']
+        indexes = [models.Index(fields=['date'])]
+
+    def __str__(self):
+        return f"{self.property_id} - {self.date}"
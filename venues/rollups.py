@@ -0,0 +1,262 @@
+"""
+Bronlaryň günlük jemleri (BookingDailyStat) we analitika.
+
+Her tassyklanan ýa-da tamamlanan bron (COUNTED_STATUSES) öz gijeleri
+üçin jemlere goşant goşýar:
+  occupied    - her gije üçin 1
+  revenue     - total_price gijelere deň bölünýär (galyndy giriş gününe)
+  check_ins   - giriş güni üçin 1
+  stay_nights - giriş güni üçin gijeleriň sany (ortaça galmak wagty üçin)
+
+Bron üýtgände (status, seneler, baha, jaý) köne goşant aýrylýar we täzesi
+goşulýar (signals.py, apply_booking_rollup fon işi). Fon işi bron bilen bir
+tranzaksiýada nobata goýulýar; rebuild() öz tranzaksiýasynda nobatdaky we
+işlenýän jem işlerini pozýar (olaryň üýtgeşmeleri bronlarda eýýäm bar).
+QuerySet.update bilen edilýän status geçişleri (pending -> expired,
+confirmed -> completed) jemlere täsir etmeýär.
+Köpçülikleýin amallar (arhiw, rebuild) üçin suspend_rollups() signal-lary
+wagtlaýyn öçürýär.
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, timedelta
+from decimal import Decimal, ROUND_DOWN
+
+from django.db import transaction
+from django.db.models import Count, F, Max, Min, Sum
+from django.db.models.functions import TruncMonth
+
+from .models import ArchivedBooking, BackgroundTask, Booking, BookingDailyStat, Property
+
+COUNTED_STATUSES = ('confirmed', 'completed')
+# Jem üýtgeşmeleriniň fon işi (tasks.py)
+ROLLUP_TASK = 'apply_booking_rollup'
+CENT = Decimal('0.01')
+
+_suspended = ContextVar('rollups_suspended', default=False)
+
+
+@contextmanager
+def suspend_rollups():
+    """Bu blokda Booking signal-lary jemleri üýtgetmeýär"""
+    token = _suspended.set(True)
+    try:
+        yield
+    finally:
+        _suspended.reset(token)
+
+
+def is_suspended():
+    return _suspended.get()
+
+
+STATE_FIELDS = ('status', 'property_id', 'check_in', 'check_out', 'total_price')
+
+
+def booking_state(status, property_id, check_in, check_out, total_price):
+    """Jemlere täsir edýän meýdanlar; hasaba alynmaýan bron üçin None"""
+    if status not in COUNTED_STATUSES or check_out <= check_in:
+        return None
+    return (property_id, check_in, check_out, total_price)
+
+
+def instance_state(booking):
+    return booking_state(*(getattr(booking, field) for field in STATE_FIELDS))
+
+
+def stored_values(booking):
+    """Bronyň maglumat bazasyndaky (save-den öňki) STATE_FIELDS bahalary ýa-da None"""
+    if booking._state.adding or booking.pk is None:
+        return None
+    return Booking.objects.filter(pk=booking.pk).values_list(*STATE_FIELDS).first()
+
+
+def stored_state(booking):
+    """Bronyň maglumat bazasyndaky (save-den öňki) ýagdaýy"""
+    values = stored_values(booking)
+    return booking_state(*values) if values else None
+
+
+def split_revenue(total_price, nights):
+    """(her gije üçin, giriş gününe goşulýan galyndy)"""
+    per_night = (Decimal(total_price) / nights).quantize(CENT, rounding=ROUND_DOWN)
+    return per_night, Decimal(total_price) - per_night * nights
+
+
+def apply_state(state, sign):
+    """Bir bronyň goşandyny jemlere goşýar (sign=1) ýa-da aýyrýar (sign=-1)"""
+    property_id, check_in, check_out, total_price = state
+    nights = (check_out - check_in).days
+    per_night, remainder = split_revenue(total_price, nights)
+
+    with transaction.atomic():
+        BookingDailyStat.objects.bulk_create(
+            [
+                BookingDailyStat(property_id=property_id, date=check_in + timedelta(days=offset))
+                for offset in range(nights)
+            ],
+            ignore_conflicts=True
+        )
+        BookingDailyStat.objects.filter(
+            property_id=property_id, date__gte=check_in, date__lt=check_out
+        ).update(
+            occupied=F('occupied') + sign,
+            revenue=F('revenue') + sign * per_night,
+        )
+        BookingDailyStat.objects.filter(property_id=property_id, date=check_in).update(
+            revenue=F('revenue') + sign * remainder,
+            check_ins=F('check_ins') + sign,
+            stay_nights=F('stay_nights') + sign * nights,
+        )
+
+
+def booking_changed(old_state, new_state):
+    """Köne goşandy aýyrýar we täzesini goşýar (ikisi bile ýa-da hiç biri)"""
+    if old_state == new_state:
+        return
+    with transaction.atomic():
+        if old_state is not None:
+            apply_state(old_state, -1)
+        if new_state is not None:
+            apply_state(new_state, 1)
+
+
+def month_windows(start, end):
+    """[start, end) aralygyny aýlara bölýär"""
+    current = date(start.year, start.month, 1)
+    while current < end:
+        following = (current.replace(day=28) + timedelta(days=4)).replace(day=1)
+        yield max(current, start), min(following, end)
+        current = following
+
+
+def window_rows(bookings, window_start, window_end):
+    """Bir aýyň bronlaryndan jem setirlerini ýatda hasaplaýar"""
+    totals = defaultdict(lambda: [0, Decimal(0), 0, 0])
+    for property_id, check_in, check_out, total_price in bookings:
+        nights = (check_out - check_in).days
+        per_night, remainder = split_revenue(total_price, nights)
+        day = max(check_in, window_start)
+        while day < min(check_out, window_end):
+            row = totals[property_id, day]
+            row[0] += 1
+            row[1] += per_night
+            day += timedelta(days=1)
+        if window_start <= check_in < window_end:
+            row = totals[property_id, check_in]
+            row[1] += remainder
+            row[2] += 1
+            row[3] += nights
+
+    return [
+        BookingDailyStat(
+            property_id=property_id, date=day,
+            occupied=occupied, revenue=revenue, check_ins=check_ins, stay_nights=stay_nights
+        )
+        for (property_id, day), (occupied, revenue, check_ins, stay_nights) in totals.items()
+    ]
+
+
+def booking_sources():
+    """Jemlere girýän bron tablisalary: işjeň we arhiwlenen bronlar"""
+    return [
+        model.objects.filter(status__in=COUNTED_STATUSES, check_out__gt=F('check_in'))
+        for model in (Booking, ArchivedBooking)
+    ]
+
+
+def rebuild(batch_size=2000, log=None):
+    """
+    Jemleri ähli taryhdan aý-aýdan täzeden gurýar, ýazylan setirleriň sanyny
+    gaýtarýar. Hemmesi bir tranzaksiýada: okyjylar tamamlanýança köne jemleri
+    görýär, gurluşyk wagtynda jem üýtgeşmeleri ýazylyp bilmeýär.
+    """
+    with transaction.atomic():
+        # Ähli jem işleri (işlenýänler hem): olar öz setirini pozup bilmän yza gaýdýar (tasks.execute)
+        BackgroundTask.objects.filter(name=ROLLUP_TASK).delete()
+        BookingDailyStat.objects.all().delete()
+
+        sources = booking_sources()
+        bounds = [
+            queryset.aggregate(start=Min('check_in'), end=Max('check_out'))
+            for queryset in sources
+        ]
+        starts = [item['start'] for item in bounds if item['start']]
+        ends = [item['end'] for item in bounds if item['end']]
+        if not starts:
+            return 0
+
+        total = 0
+        for window_start, window_end in month_windows(min(starts), max(ends)):
+            bookings = []
+            for queryset in sources:
+                bookings.extend(
+                    queryset.filter(check_in__lt=window_end, check_out__gt=window_start).values_list(
+                        'property_id', 'check_in', 'check_out', 'total_price'
+                    ).iterator(chunk_size=batch_size)
+                )
+            rows = window_rows(bookings, window_start, window_end)
+            BookingDailyStat.objects.bulk_create(rows, batch_size=batch_size)
+            total += len(rows)
+            if log:
+                log(f'{window_start:%Y-%m}: {len(bookings)} bron, {len(rows)} setir')
+        return total
+
+
+GROUPS = {
+    'property': ('property_id', 'property__title'),
+    'category': ('property__category_id', 'property__category__name'),
+    'month': ('month', None),
+}
+
+
+def analytics(date_from, date_to, group_by='property'):
+    """
+    [date_from, date_to] aralygy üçin eýelenme, girdeji we ortaça galmak wagty.
+    Diňe BookingDailyStat-dan okaýar (Booking tablisasy gözden geçirilmeýär).
+    """
+    key, label = GROUPS[group_by]
+    days = (date_to - date_from).days + 1
+    stats = BookingDailyStat.objects.filter(date__gte=date_from, date__lte=date_to)
+    if group_by == 'month':
+        stats = stats.annotate(month=TruncMonth('date'))
+    values = [key] + ([label] if label else [])
+    rows = stats.values(*values).annotate(
+        occupied=Sum('occupied'),
+        revenue=Sum('revenue'),
+        check_ins=Sum('check_ins'),
+        stay_nights=Sum('stay_nights'),
+    ).order_by(key)
+
+    # Elýeterli gijeler: jaýlaryň sany * günler
+    if group_by == 'property':
+        capacity = defaultdict(lambda: days)
+    elif group_by == 'category':
+        capacity = defaultdict(int, {
+            item['category_id']: item['count'] * days
+            for item in Property.objects.values('category_id').annotate(count=Count('pk'))
+        })
+    else:
+        properties = Property.objects.count()
+        capacity = defaultdict(int, {
+            window_start.replace(day=1): properties * (window_end - window_start).days
+            for window_start, window_end in month_windows(date_from, date_to + timedelta(days=1))
+        })
+
+    results = []
+    for row in rows:
+        group = row[key]
+        available = capacity[group]
+        results.append({
+            group_by: group.isoformat() if group_by == 'month' else group,
+            'name': row[label] if label else group.strftime('%Y-%m'),
+            'occupied_nights': row['occupied'],
+            'available_nights': available,
+            'occupancy_rate': round(row['occupied'] / available, 4) if available else None,
+            'revenue': row['revenue'].quantize(CENT),
+            'check_ins': row['check_ins'],
+            'average_stay': round(row['stay_nights'] / row['check_ins'], 2) if row['check_ins'] else None,
+        })
+    return results
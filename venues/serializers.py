@@ -1,41 +1,55 @@
 from rest_framework import serializers
-from .models import Property, PropertyImage, Service, PropertyService, Booking, BookingService, Category
+from .models import (
+    Property, PropertyImage, Service, PropertyService, Booking, BookingService, Category,
+    ArchivedBooking, ArchivedBookingService,
+)
 from catering.models import WeddingMenu
 from catering.serializers import WeddingMenuSerializer
 from datetime import date
+from venue.media import media_url
+
+
+class MediaImageField(serializers.ImageField):
+    """ImageField, URL media_url() bilen gurulýar (her obýekt üçin storage.url() çagyrylmaýar)"""
+
+    def to_representation(self, value):
+        if not value:
+            return None
+        return media_url(value.name, self.context.get('request'))
+
+
+def image_meta(obj, prefix=''):
+    """Suratyň metadata-sy: müşderi suraty ýüklemezden öň ýerini çyzyp bilýär"""
+    return {
+        'width': getattr(obj, f'{prefix}width'),
+        'height': getattr(obj, f'{prefix}height'),
+        'size': getattr(obj, f'{prefix}size'),
+        'dominant_color': getattr(obj, f'{prefix}dominant_color') or None,
+        'placeholder': getattr(obj, f'{prefix}placeholder') or None,
+    }
 
 
 class CategorySerializer(serializers.ModelSerializer):
     """Kategoriýa maglumatlary üçin"""
+    # Çykyşda 'icon' doly URL ýa-da null (Kotlin data class üçin)
+    icon = MediaImageField(required=False, allow_null=True)
+    icon_meta = serializers.SerializerMethodField()
 
     class Meta:
         model = Category
         # 'description' we 'slug' goşdum, sebäbi olar modelde bar
-        fields = ['id', 'name', 'slug', 'description', 'icon']
-
-    def to_representation(self, instance):
-        """Çykyşda 'icon' üçin doly URL berýär (Kotlin data class üçin)"""
-        representation = super().to_representation(instance)
-
-        # Icon meýdanyny doly URL bilen çalyş
-        if instance.icon and hasattr(instance.icon, 'url'):
-            request = self.context.get('request')
-            if request:
-                representation['icon'] = request.build_absolute_uri(instance.icon.url)
-            else:
-                # Request bolmasa (mysal üçin testde) diňe faýl ýoluny görkez
-                representation['icon'] = instance.icon.url
-        elif 'icon' in representation:
-            # Eger ikonka ýok bolsa, null gaýdýar
-            representation['icon'] = None
+        fields = ['id', 'name', 'slug', 'description', 'icon', 'icon_meta']
 
-        return representation
+    def get_icon_meta(self, obj):
+        return image_meta(obj, 'icon_') if obj.icon else None
 
 
 class PropertyImageSerializer(serializers.ModelSerializer):
+    image = MediaImageField()
+
     class Meta:
         model = PropertyImage
-        fields = ['id', 'image', 'is_main', 'order']
+        fields = ['id', 'image', 'is_main', 'order', 'width', 'height', 'size', 'dominant_color', 'placeholder']
 
 
 class PropertyImageUploadSerializer(serializers.ModelSerializer):
@@ -94,21 +108,34 @@ class PropertyServiceSerializer(serializers.ModelSerializer):
 class PropertyListSerializer(serializers.ModelSerializer):
     """Jaýlaryň sanawy üçin - ýönekeý maglumat"""
     main_image = serializers.SerializerMethodField()
+    main_image_meta = serializers.SerializerMethodField()
     category = CategorySerializer(read_only=True)
 
     class Meta:
         model = Property
         fields = [
             'id', 'title', 'address', 'price_per_night', 'category',
-            'max_guests', 'area', 'main_image', 'is_available'
+            'max_guests', 'area', 'main_image', 'main_image_meta', 'is_available'
         ]
 
+    def main_image_of(self, obj):
+        if 'images' in getattr(obj, '_prefetched_objects_cache', {}):
+            # prefetch_related('images') edilen bolsa goşmaça sorag ýok
+            return next((image for image in obj.images.all() if image.is_main), None)
+        # Bir obýekt üçin iki gezek sorag etmezlik
+        if not hasattr(obj, '_main_image'):
+            obj._main_image = obj.images.filter(is_main=True).first()
+        return obj._main_image
+
+    def get_main_image_meta(self, obj):
+        main_img = self.main_image_of(obj)
+        return image_meta(main_img) if main_img else None
+
     def get_main_image(self, obj):
-        main_img = obj.images.filter(is_main=True).first()
-        if main_img:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(main_img.image.url)
+        main_img = self.main_image_of(obj)
+        request = self.context.get('request')
+        if main_img and request:
+            return media_url(main_img.image.name, request)
         return None
 
 
@@ -130,10 +157,16 @@ class PropertyDetailSerializer(serializers.ModelSerializer):
 
     def get_available_services(self, obj):
         """Saýlanyp bilinjek goşmaça hyzmatlar"""
-        services = obj.property_services.filter(
-            service__is_active=True,
-            is_included=False
-        )
+        if 'property_services' in getattr(obj, '_prefetched_objects_cache', {}):
+            services = [
+                item for item in obj.property_services.all()
+                if item.service.is_active and not item.is_included
+            ]
+        else:
+            services = obj.property_services.filter(
+                service__is_active=True,
+                is_included=False
+            )
         return PropertyServiceSerializer(services, many=True).data
 
 
@@ -231,6 +264,30 @@ class BookingSerializer(serializers.ModelSerializer):
         return booking
 
 
+class ArchivedBookingServiceSerializer(BookingServiceSerializer):
+
+    class Meta(BookingServiceSerializer.Meta):
+        model = ArchivedBookingService
+
+
+class ArchivedBookingSerializer(serializers.ModelSerializer):
+    """Arhiwlenen bron (diňe okamak), BookingSerializer bilen şol bir görnüşde"""
+    booking_services = ArchivedBookingServiceSerializer(many=True, read_only=True)
+    property_title = serializers.CharField(source='property.title', read_only=True)
+    catering_menu_detail = WeddingMenuSerializer(source='catering_menu', read_only=True)
+
+    class Meta:
+        model = ArchivedBooking
+        fields = [
+            'id', 'property', 'property_title', 'customer_name',
+            'customer_phone', 'customer_email', 'check_in',
+            'check_out', 'guests_count', 'total_price',
+            'status', 'notes', 'booking_services',
+            'catering_menu', 'catering_menu_detail', 'created_at', 'archived_at'
+        ]
+        read_only_fields = fields
+
+
 class AvailabilitySerializer(serializers.Serializer):
     """Elýeterlilik barlamak üçin"""
     property_id = serializers.IntegerField()
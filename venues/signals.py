@@ -0,0 +1,124 @@
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from catering.models import Dish, Salad, WeddingMenu, MenuDish, MenuSalad
+from . import events, facets, rollups, tasks
+from .models import Category, Service, Property, PropertyImage, Booking
+from .snapshot import mark_dirty
+from .sync import record_deletion
+
+# Model üýtgände offline katalog suratynyň haýsy bölümleri täzelenmeli
+SNAPSHOT_SECTIONS = {
+    Category: ('categories', 'properties'),
+    Service: ('services',),
+    Property: ('properties',),
+    PropertyImage: ('properties',),
+    Dish: ('dishes', 'menus'),
+    Salad: ('salads', 'menus'),
+    WeddingMenu: ('menus',),
+    MenuDish: ('menus',),
+    MenuSalad: ('menus',),
+}
+
+
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Service)
+@receiver(post_delete, sender=Property)
+@receiver(post_delete, sender=Dish)
+@receiver(post_delete, sender=Salad)
+@receiver(post_delete, sender=WeddingMenu)
+def catalog_item_deleted(sender, instance, **kwargs):
+    record_deletion(instance)
+
+
+@receiver(pre_delete, sender=Category)
+def category_deleting(sender, instance, **kwargs):
+    # SET_NULL QuerySet.update bilen edilýär (updated_at üýtgemeýär),
+    # şonuň üçin jaýlar delta sinhronizasiýa üçin şu ýerde bellenýär
+    Property.objects.filter(category=instance).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Category)
+def category_saved(sender, instance, created, **kwargs):
+    # Jaýlaryň sinhronizasiýa jogaby kategoriýany öz içinde saklaýar (ady,
+    # slug, ikonka), şonuň üçin kategoriýa üýtgände jaýlar hem täzelenmeli
+    if not created:
+        Property.objects.filter(category=instance).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Property)
+@receiver(post_delete, sender=Property)
+def property_facets_changed(sender, **kwargs):
+    facets.invalidate()
+
+
+@receiver(post_save, sender=PropertyImage)
+@receiver(post_delete, sender=PropertyImage)
+def property_image_changed(sender, instance, **kwargs):
+    # Esasy surat üýtgese, jaý delta sinhronizasiýada täzeden iberilmeli
+    Property.objects.filter(pk=instance.property_id).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=PropertyImage)
+def image_uploaded(sender, instance, raw=False, **kwargs):
+    # Täze suratyň metadata-sy fon işinde hasaplanýar (ImageMetadataMixin)
+    if not raw and getattr(instance, '_image_metadata_pending', False):
+        instance._image_metadata_pending = False
+        tasks.enqueue('refresh_image_metadata', model=sender._meta.label, pk=instance.pk)
+
+
+@receiver(pre_save, sender=Booking)
+def remember_booking_state(sender, instance, raw=False, **kwargs):
+    if not raw and not rollups.is_suspended():
+        instance._stored_values = rollups.stored_values(instance)
+        instance._rollup_state = (
+            rollups.booking_state(*instance._stored_values) if instance._stored_values else None
+        )
+
+
+@receiver(post_save, sender=Booking)
+def booking_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    if kwargs.get('created') and instance.customer_email:
+        tasks.enqueue('send_booking_email', booking_id=instance.pk)
+    # Elýeterlilik wakasy (SSE): döredilende ýa-da status/seneler üýtgände
+    stored = getattr(instance, '_stored_values', None)
+    if kwargs.get('created'):
+        events.booking_changed(instance, 'created')
+    elif stored and stored[:4] != tuple(getattr(instance, field) for field in rollups.STATE_FIELDS[:4]):
+        # status, property_id, check_in ýa-da check_out üýtgedi
+        events.booking_changed(instance, 'updated', previous_property_id=stored[1])
+    instance._stored_values = None
+    # Günlük jemlerden köne goşant aýrylýar, täzesi goşulýar (fon işinde)
+    if not rollups.is_suspended():
+        old_state = getattr(instance, '_rollup_state', None)
+        new_state = rollups.instance_state(instance)
+        if old_state != new_state:
+            tasks.enqueue(
+                rollups.ROLLUP_TASK,
+                old=tasks.state_payload(old_state), new=tasks.state_payload(new_state)
+            )
+        instance._rollup_state = new_state
+
+
+@receiver(post_delete, sender=Booking)
+def booking_deleted(sender, instance, **kwargs):
+    if instance.status in events.BLOCKING_STATUSES:
+        events.booking_changed(instance, 'deleted')
+    state = rollups.instance_state(instance)
+    if not rollups.is_suspended() and state is not None:
+        tasks.enqueue(rollups.ROLLUP_TASK, old=tasks.state_payload(state), new=None)
+
+
+def snapshot_source_changed(sender, **kwargs):
+    mark_dirty(*SNAPSHOT_SECTIONS[sender])
+
+
+for model in SNAPSHOT_SECTIONS:
+    post_save.connect(snapshot_source_changed, sender=model, dispatch_uid=f'snapshot-save-{model.__name__}')
+    post_delete.connect(snapshot_source_changed, sender=model, dispatch_uid=f'snapshot-delete-{model.__name__}')
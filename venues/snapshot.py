@@ -0,0 +1,207 @@
+"""
+Offline katalog suraty (snapshot).
+
+Kategoriýalar, hyzmatlar, jaýlar (esasy surat URL-i bilen), tagamlar, salatlar
+we menýular (jemi bahasy öňünden hasaplanan) bir JSON faýla ýygnalýar we
+gzip (brotli gurnalan bolsa, brotli hem) görnüşinde diskde saklanýar.
+
+Her bölüm (section) aýratyn faýlda saklanýar. Model signallary diňe
+üýtgän bölümi "hapa" diýip belleýär we fon işini (build_catalog_snapshot,
+CATALOG_SNAPSHOT_REBUILD_DELAY sekunt soň) nobata goýýar; diňe hapa bölümler
+täzeden gurulýar. Surat sorag wagtynda gurulmaýar. Suratyň wersiýasy
+mazmunyň hash-y, ol güýçli ETag hökmünde ulanylýar. Öňki wersiýanyň
+faýllary indiki gurluşyga çenli saklanýar: köne manifest-i okan sorag
+faýly açyp bilýär.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Prefetch
+from django.utils import timezone
+from rest_framework.utils.encoders import JSONEncoder
+
+from catering.models import Dish, Salad, WeddingMenu, MenuDish, MenuSalad
+from catering.serializers import DishSerializer, SaladSerializer, WeddingMenuSerializer
+from .models import Category, Service, Property
+from .serializers import CategorySerializer, ServiceSerializer, PropertyListSerializer
+from .tasks import enqueue, task
+
+try:
+    import brotli
+except ImportError:  # brotli hökmany däl
+    brotli = None
+
+SECTIONS = ['categories', 'services', 'properties', 'dishes', 'salads', 'menus']
+MANIFEST = 'manifest.json'
+# Fon işi nobatda: täze üýtgeşmeler üçin ikinji iş goýulmaýar
+SCHEDULED = '.scheduled'
+
+
+class SiteRequest:
+    """Sorag bolmadyk ýerde serializer-ler üçin doly URL gurýar (SITE_URL boýunça)"""
+
+    def build_absolute_uri(self, location):
+        return urljoin(settings.SITE_URL, location)
+
+
+def snapshot_dir():
+    return Path(settings.CATALOG_SNAPSHOT_DIR)
+
+
+def write_atomic(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle, tmp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+    with os.fdopen(handle, 'wb') as file:
+        file.write(content)
+    os.replace(tmp, path)
+
+
+def mark_dirty(*sections):
+    """Signal-lar üçin: bölümleri täzeden gurmaly diýip belleýär"""
+    dirty = snapshot_dir() / 'dirty'
+    dirty.mkdir(parents=True, exist_ok=True)
+    for section in sections:
+        (dirty / section).touch()
+    transaction.on_commit(schedule_build)
+
+
+def schedule_build():
+    """Gurluşyk işini bir gezek nobata goýýar (köp üýtgeşme bir gurluşyk)"""
+    flag = snapshot_dir() / 'dirty' / SCHEDULED
+    # Iş ýitse (işçi öldi, iş 'failed'), köne bellik päsgel bermeýär
+    expires = settings.CATALOG_SNAPSHOT_REBUILD_DELAY + settings.TASK_LOCK_TIMEOUT
+    try:
+        if time.time() - flag.stat().st_mtime < expires:
+            return
+    except FileNotFoundError:
+        pass
+    flag.parent.mkdir(parents=True, exist_ok=True)
+    flag.touch()
+    enqueue('build_catalog_snapshot', delay=settings.CATALOG_SNAPSHOT_REBUILD_DELAY)
+
+
+@task()
+def build_catalog_snapshot():
+    """Hapa bölümleri täzeden gurýar (mark_dirty-den soň)"""
+    # Bellik gurmazdan öň aýrylýar: gurluşyk wagtyndaky üýtgeşme täze iş goýýar
+    (snapshot_dir() / 'dirty' / SCHEDULED).unlink(missing_ok=True)
+    ensure_snapshot()
+
+
+def menu_rows(context):
+    menus = WeddingMenu.objects.filter(is_active=True).annotate(
+        menu_dishes_count=Count('menudish', distinct=True),
+        menu_salads_count=Count('menusalad', distinct=True),
+    ).prefetch_related(
+        Prefetch('menudish_set', queryset=MenuDish.objects.select_related('dish')),
+        Prefetch('menusalad_set', queryset=MenuSalad.objects.select_related('salad')),
+    )
+    rows = []
+    for menu in menus:
+        row = WeddingMenuSerializer(menu, context=context).data
+        row['total_price'] = menu.calculate_total_price()
+        row['dishes'] = [
+            {'dish': item.dish_id, 'quantity': item.quantity, 'order': item.order}
+            for item in menu.menudish_set.all()
+        ]
+        row['salads'] = [
+            {'salad': item.salad_id, 'quantity': item.quantity, 'order': item.order}
+            for item in menu.menusalad_set.all()
+        ]
+        rows.append(row)
+    return rows
+
+
+def section_rows(section):
+    context = {'request': SiteRequest()}
+    if section == 'categories':
+        return CategorySerializer(Category.objects.all(), many=True, context=context).data
+    if section == 'services':
+        return ServiceSerializer(Service.objects.filter(is_active=True), many=True, context=context).data
+    if section == 'properties':
+        properties = Property.objects.filter(is_available=True).select_related(
+            'category'
+        ).prefetch_related('images')
+        return PropertyListSerializer(properties, many=True, context=context).data
+    if section == 'dishes':
+        return DishSerializer(Dish.objects.filter(is_active=True), many=True, context=context).data
+    if section == 'salads':
+        return SaladSerializer(Salad.objects.filter(is_active=True), many=True, context=context).data
+    if section == 'menus':
+        return menu_rows(context)
+    raise ValueError(f'Näbelli bölüm: {section}')
+
+
+def build_section(section):
+    content = json.dumps(section_rows(section), cls=JSONEncoder, ensure_ascii=False)
+    write_atomic(snapshot_dir() / 'sections' / f'{section}.json', content.encode('utf-8'))
+
+
+def read_manifest():
+    try:
+        return json.loads((snapshot_dir() / MANIFEST).read_text())
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def assemble():
+    """Bölümleri bir faýla ýygnaýar, gysýar we manifest-i täzeleýär"""
+    base = snapshot_dir()
+    parts = [(base / 'sections' / f'{section}.json').read_bytes() for section in SECTIONS]
+    version = hashlib.sha256(b'\0'.join(parts)).hexdigest()[:16]
+
+    previous = read_manifest()
+    if previous and previous['version'] == version:
+        return previous
+
+    body = b'{"version": "%s", "generated_at": "%s", ' % (
+        version.encode(), timezone.now().isoformat().encode()
+    )
+    body += b', '.join(b'"%s": %s' % (section.encode(), part) for section, part in zip(SECTIONS, parts))
+    body += b'}'
+
+    files = {'gzip': f'catalog-{version}.json.gz'}
+    write_atomic(base / files['gzip'], gzip.compress(body, compresslevel=9, mtime=0))
+    if brotli is not None:
+        files['br'] = f'catalog-{version}.json.br'
+        write_atomic(base / files['br'], brotli.compress(body))
+
+    manifest = {'version': version, 'size': len(body), 'files': files}
+    write_atomic(base / MANIFEST, json.dumps(manifest).encode())
+
+    # Köne suratlary pozmak (öňki wersiýa henizem okalýan bolup biler)
+    keep = set(files.values()) | set(previous['files'].values() if previous else ())
+    for path in base.glob('catalog-*'):
+        if path.name not in keep:
+            path.unlink(missing_ok=True)
+    return manifest
+
+
+def ensure_snapshot(full=False):
+    """Hapa bölümleri täzeden gurýar we häzirki manifest-i gaýtarýar (fon işi, buýruk)"""
+    base = snapshot_dir()
+    dirty = base / 'dirty'
+    stale = []
+    for section in SECTIONS:
+        marker = dirty / section
+        if full or marker.exists() or not (base / 'sections' / f'{section}.json').exists():
+            # Belligi gurmazdan öň aýyrmak: gurluşyk wagtyndaky üýtgeşme ýitmeýär
+            marker.unlink(missing_ok=True)
+            stale.append(section)
+
+    for section in stale:
+        build_section(section)
+
+    manifest = read_manifest()
+    if stale or manifest is None:
+        manifest = assemble()
+    return manifest
@@ -0,0 +1,102 @@
+"""
+Mobil programma üçin delta sinhronizasiýa.
+
+/api/sync/?since=<ISO wagt> diňe şol wagtdan soň döredilen, üýtgedilen ýa-da
+pozulan ýazgylary gaýtarýar. Üýtgeşmeler updated_at indeksleri boýunça,
+pozulanlar SyncTombstone tablisasyndan alynýar. Işjeň däl edilen ýazgylar
+(is_active/is_available=False) hem pozulan hökmünde iberilýär.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Count
+from django.utils import timezone
+
+from catering.models import Dish, Salad, WeddingMenu
+from catering.serializers import DishSerializer, SaladSerializer, WeddingMenuSerializer
+from .models import Category, Service, Property, SyncTombstone
+from .serializers import CategorySerializer, ServiceSerializer, PropertyListSerializer
+
+
+def property_queryset():
+    return Property.objects.select_related('category').prefetch_related('images')
+
+
+def menu_queryset():
+    return WeddingMenu.objects.annotate(
+        menu_dishes_count=Count('menudish', distinct=True),
+        menu_salads_count=Count('menusalad', distinct=True),
+    )
+
+
+# açar: (model, queryset, serializer, işjeňlik meýdany)
+SYNC_MODELS = {
+    'categories': (Category, Category.objects.all, CategorySerializer, None),
+    'services': (Service, Service.objects.all, ServiceSerializer, 'is_active'),
+    'properties': (Property, property_queryset, PropertyListSerializer, 'is_available'),
+    'dishes': (Dish, Dish.objects.all, DishSerializer, 'is_active'),
+    'salads': (Salad, Salad.objects.all, SaladSerializer, 'is_active'),
+    'menus': (WeddingMenu, menu_queryset, WeddingMenuSerializer, 'is_active'),
+}
+MODEL_KEYS = {model: key for key, (model, _, _, _) in SYNC_MODELS.items()}
+
+
+def record_deletion(instance):
+    """post_delete signaly üçin: pozulan ýazgynyň yzyny saklaýar"""
+    SyncTombstone.objects.create(model=MODEL_KEYS[type(instance)], object_id=instance.pk)
+
+
+def purge_tombstones(now=None):
+    """SYNC_TOMBSTONE_DAYS-dan köne tombstone-lary pozýar, pozulan sany gaýtarýar"""
+    cutoff = (now or timezone.now()) - timedelta(days=settings.SYNC_TOMBSTONE_DAYS)
+    deleted, _ = SyncTombstone.objects.filter(deleted_at__lt=cutoff).delete()
+    return deleted
+
+
+def build_changes(since, request=None):
+    """
+    since=None bolsa doly katalog gaýtarylýar. Tombstone-lar saklanýan
+    möhletden köne since hem doly sinhronizasiýa hasaplanýar.
+    """
+    started = timezone.now()
+    retention = timedelta(days=settings.SYNC_TOMBSTONE_DAYS)
+    full = since is None or since < started - retention
+
+    changes = {}
+    deleted = {key: [] for key in SYNC_MODELS}
+    context = {'request': request}
+
+    for key, (model, get_queryset, serializer_class, active_field) in SYNC_MODELS.items():
+        queryset = get_queryset()
+        if full:
+            if active_field:
+                queryset = queryset.filter(**{active_field: True})
+        else:
+            queryset = queryset.filter(updated_at__gt=since)
+
+        rows = []
+        for obj in queryset.order_by('pk'):
+            if active_field and not getattr(obj, active_field):
+                deleted[key].append(obj.pk)
+            else:
+                rows.append(obj)
+        changes[key] = serializer_class(rows, many=True, context=context).data
+
+    if not full:
+        tombstones = SyncTombstone.objects.filter(deleted_at__gt=since).values_list('model', 'object_id')
+        for key, object_id in tombstones:
+            if key in deleted:
+                deleted[key].append(object_id)
+
+    # Entek tamamlanmadyk tranzaksiýalaryň üýtgeşmelerini ýitirmezlik üçin
+    # indiki since birneme öňräk bellenýär (gaýtalanýan ýazgylar zyýansyz)
+    next_since = started - timedelta(seconds=settings.SYNC_OVERLAP_SECONDS)
+
+    return {
+        'full': full,
+        'since': since,
+        'next_since': next_since,
+        'changes': changes,
+        'deleted': deleted,
+    }
@@ -0,0 +1,219 @@
+"""
+Maglumat bazasyndaky fon işleriniň nobaty (daşky broker gerek däl).
+
+Haýal goşmaça işler (suratlaryň metadata-sy, email, günlük jemler)
+soragyň içinde ýerine ýetirilmeýär: enqueue() BackgroundTask setirini
+çagyryjynyň tranzaksiýasynyň içinde goşýar (tranzaksiýa rollback bolsa iş
+hem ýok, işçi setiri diňe commit-den soň görýär), run_tasks buýrugy olary
+thread ýa-da process pool-da işledýär.
+
+  - iş şertli UPDATE bilen eýelenýär (status='queued' bolsa), şonuň üçin
+    birnäçe işçi şol bir işi iki gezek almaýar
+  - şowsuz iş 2^n sekunt (TASK_RETRY_MAX_DELAY-a çenli) garaşyp gaýtalanýar,
+    max_attempts-dan soň 'failed' bolýar
+  - işçi ölse, TASK_LOCK_TIMEOUT-dan köne 'running' işler nobata gaýdýar
+  - iş diňe öz eýelemesi (locked_by, attempts) bilen tamamlanýar: köne diýip
+    nobata gaýdan işiň ilkinji ýerine ýetirilişi netijäni iki gezek ýazmaýar.
+    atomic=True işleriň bedeni we setiriň pozulmagy bir tranzaksiýada
+    (idempotent däl işler üçin, meselem jemleriň üýtgeşmesi)
+  - TASKS_EAGER=True: işler nobatsyz, on_commit-de şol bada ýerine ýetirilýär
+"""
+
+import logging
+import os
+import random
+import socket
+import traceback
+from contextlib import nullcontext
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.apps import apps
+from django.conf import settings
+from django.core.mail import send_mail
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from . import rollups
+from .models import BackgroundTask, Booking
+
+logger = logging.getLogger(__name__)
+
+# ady -> (funksiýa, max_attempts, atomic)
+TASKS = {}
+
+
+class ClaimLost(Exception):
+    """Iş ýerine ýetirilýärkä eýelemesi ýitdi (nobata gaýtaryldy ýa-da pozuldy)"""
+
+
+def task(name=None, max_attempts=5, atomic=False):
+    """
+    Funksiýany fon işi hökmünde hasaba alýar; parametrler JSON bolmaly.
+    atomic=True: netije diňe iş setiri şol tranzaksiýada pozulsa ýazylýar.
+    """
+    def register(func):
+        TASKS[name or func.__name__] = (func, max_attempts, atomic)
+        return func
+    return register
+
+
+def enqueue(name, delay=0, **payload):
+    """Işi häzirki tranzaksiýanyň içinde nobata goýýar (rollback bolsa goýulmaýar)"""
+    if name not in TASKS:
+        raise KeyError(f'Näbelli fon işi: {name}')
+    if settings.TASKS_EAGER:
+        transaction.on_commit(lambda: run_eager(name, payload), robust=True)
+    else:
+        # Işçi setiri diňe tranzaksiýa tamamlanandan soň görýär
+        insert(name, payload, delay)
+
+
+def insert(name, payload, delay=0):
+    return BackgroundTask.objects.create(
+        name=name,
+        payload=payload,
+        max_attempts=TASKS[name][1],
+        run_at=timezone.now() + timedelta(seconds=delay),
+    )
+
+
+def run_eager(name, payload):
+    TASKS[name][0](**payload)
+
+
+def worker_name():
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def claim(worker, limit):
+    """
+    Wagty gelen işleri eýeleýär (iň köp limit sany): [(ID, attempts), ...].
+    attempts her eýelemede artýar, şonuň üçin eýelemäni kesgitleýär.
+    """
+    now = timezone.now()
+    candidates = BackgroundTask.objects.filter(status='queued', run_at__lte=now).order_by('run_at')
+    claimed = []
+    for task_id, attempts in candidates.values_list('pk', 'attempts')[:limit]:
+        # Başga işçi öňürti alan bolsa, UPDATE 0 setir täzeleýär
+        if BackgroundTask.objects.filter(pk=task_id, status='queued', attempts=attempts).update(
+            status='running', locked_by=worker, locked_at=now, attempts=attempts + 1
+        ):
+            claimed.append((task_id, attempts + 1))
+    return claimed
+
+
+def release_stale(now=None):
+    """Ölen işçileriň 'running' işlerini nobata gaýtarýar"""
+    now = now or timezone.now()
+    return BackgroundTask.objects.filter(
+        status='running', locked_at__lt=now - timedelta(seconds=settings.TASK_LOCK_TIMEOUT)
+    ).update(status='queued', locked_by='', locked_at=None, run_at=now)
+
+
+def retry_delay(attempts):
+    """Eksponensial garaşmak + jitter (sekunt)"""
+    delay = min(2 ** attempts, settings.TASK_RETRY_MAX_DELAY)
+    return delay + random.uniform(0, delay / 4)
+
+
+def claimed(item):
+    """Işiň şu ýerine ýetirilişiniň eýelemesi (başga işçi alan bolsa boş)"""
+    return BackgroundTask.objects.filter(
+        pk=item.pk, status='running', locked_by=item.locked_by, attempts=item.attempts
+    )
+
+
+def execute(task_id, attempts):
+    """claim()-iň eýelän işini ýerine ýetirýär (pool-yň içinde), üstünlikli bolsa True"""
+    try:
+        item = BackgroundTask.objects.filter(pk=task_id, status='running', attempts=attempts).first()
+        if item is None:
+            return False
+        func, _, atomic = TASKS.get(item.name, (None, None, False))
+        try:
+            if func is None:
+                raise LookupError(f'Näbelli fon işi: {item.name}')
+            with transaction.atomic() if atomic else nullcontext():
+                func(**item.payload)
+                finished = claimed(item).delete()[0]
+                if atomic and not finished:
+                    raise ClaimLost
+        except ClaimLost:
+            logger.warning('Fon işiniň eýelemesi ýitdi, netije ýazylmady: %s', item)
+            return False
+        except Exception:
+            fail(item, traceback.format_exc())
+            return False
+        if not finished:
+            logger.warning('Fon işi köne diýip nobata gaýdypdy, gaýtadan ýerine ýetiriler: %s', item)
+        return True
+    finally:
+        close_old_connections()
+
+
+def fail(item, error):
+    logger.warning('Fon işi şowsuz: %s (%s/%s)\n%s', item, item.attempts, item.max_attempts, error)
+    changes = {'locked_by': '', 'locked_at': None, 'last_error': error}
+    if item.attempts >= item.max_attempts or item.name not in TASKS:
+        changes['status'] = 'failed'
+    else:
+        changes['status'] = 'queued'
+        changes['run_at'] = timezone.now() + timedelta(seconds=retry_delay(item.attempts))
+    claimed(item).update(**changes)
+
+
+# --- Fon işleri ---
+
+@task()
+def refresh_image_metadata(model, pk):
+    """Täze ýüklenen suratyň metadata-sy (ImageMetadataMixin)"""
+    model = apps.get_model(model)
+    obj = model.objects.filter(pk=pk).first()
+    if obj is None:
+        return
+    changed = obj.refresh_image_metadata(force=True)
+    if any(field.name == 'updated_at' for field in model._meta.concrete_fields):
+        changed.append('updated_at')  # delta sinhronizasiýa üçin
+    obj.save(update_fields=changed)
+
+
+@task()
+def send_booking_email(booking_id):
+    """Müşderä bronuň kabul edilendigi barada email"""
+    booking = Booking.objects.select_related('property').filter(pk=booking_id).first()
+    if booking is None or not booking.customer_email:
+        return
+    send_mail(
+        subject=f'Bron #{booking.pk} kabul edildi',
+        message=(
+            f'Hormatly {booking.customer_name},\n\n'
+            f'"{booking.property.title}" üçin {booking.check_in:%d.%m.%Y} - '
+            f'{booking.check_out:%d.%m.%Y} senelerdäki bronuňyz kabul edildi.\n'
+            f'Jemi baha: {booking.total_price} TMT\n'
+            f'Status: {booking.get_status_display()}\n'
+        ),
+        from_email=None,
+        recipient_list=[booking.customer_email],
+    )
+
+
+def state_payload(state):
+    """rollups ýagdaýy -> JSON"""
+    if state is None:
+        return None
+    property_id, check_in, check_out, total_price = state
+    return [property_id, check_in.isoformat(), check_out.isoformat(), str(total_price)]
+
+
+def payload_state(payload):
+    if payload is None:
+        return None
+    property_id, check_in, check_out, total_price = payload
+    return (property_id, date.fromisoformat(check_in), date.fromisoformat(check_out), Decimal(total_price))
+
+
+@task(name=rollups.ROLLUP_TASK, atomic=True)
+def apply_booking_rollup(old, new):
+    """Günlük jemlerde bronuň köne goşandyny aýyrýar, täzesini goşýar (idempotent däl)"""
+    rollups.booking_changed(payload_state(old), payload_state(new))
@@ -1,3 +1,476 @@
-from django.test import TestCase
+import csv
+import io
+import os
+import tempfile
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.db import IntegrityError
+from django.db.models import Sum
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from catering.models import Dish, MenuDish, WeddingMenu
+from venue.media import parse_range
+from . import imports, rollups, tasks
+from .archive import archive_batch
+from .models import (
+    BackgroundTask, Booking, BookingDailyStat, BookingService, Category, IdempotencyKey, Property,
+    PropertyImage, Service, SyncTombstone,
+)
+from .sync import build_changes, purge_tombstones
+
+# Signallar offline katalog suratyny "hapa" diýip belleýär: synaglar hakyky katalogy üýtgetmesin
+TEST_SNAPSHOT_DIR = os.path.join(tempfile.gettempdir(), 'venue-test-snapshots')
+
+
+@override_settings(CATALOG_SNAPSHOT_DIR=TEST_SNAPSHOT_DIR)
+class FastListParityTests(TestCase):
+    """values() bilen gurlan sanaw jogaplary ModelSerializer bilen baýtma-baýt deň bolmaly"""
+
+    PATHS = [
+        '/api/properties/',
+        '/api/properties/?size=2&page=2',
+        '/api/properties/?search=toý&min_price=1',
+        '/api/properties/?category=1',
+        '/api/bookings/',
+        '/api/bookings/?status=pending',
+        '/api/bookings/?archived=true',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name='Toýhana', slug='toyhana', description='Uly zallar')
+        service = Service.objects.create(name='Sazanda', icon='music')
+        menu = WeddingMenu.objects.create(name='Adaty menýu', price_per_person=Decimal('120.50'), min_guests=50)
+        dish = Dish.objects.create(name='Palaw', category='main_course', price=Decimal('45.00'))
+        MenuDish.objects.create(menu=menu, dish=dish, quantity=2)
+
+        properties = []
+        for index in range(5):
+            properties.append(Property.objects.create(
+                category=category if index % 2 else None,
+                title=f'Toý zaly {index}',
+                description='Giň zal we awtoulag duralgasy',
+                address=f'Aşgabat, {index}-nji köçe',
+                price_per_night=Decimal('150.00') + index * 75,
+                max_guests=50 * (index + 1),
+                area=100 + index * 40 if index != 2 else None,
+            ))
+        # Metadata bilen suratlar (faýl okalmaz ýaly bulk_create)
+        PropertyImage.objects.bulk_create([
+            PropertyImage(
+                property=properties[0], image='images/cas/aa/main.jpg', is_main=True,
+                width=1200, height=800, size=154000, dominant_color='#aabbcc', placeholder='data:image/jpeg;base64,AA==',
+            ),
+            PropertyImage(property=properties[0], image='images/cas/bb/second.jpg', order=1),
+            PropertyImage(property=properties[1], image='images/cas/cc/only.jpg', order=2),
+        ])
+
+        today = date.today()
+        for index, property_obj in enumerate(properties):
+            booking = Booking.objects.create(
+                property=property_obj,
+                customer_name=f'Müşderi {index}',
+                customer_phone=f'+9936100000{index}',
+                customer_email='musderi@example.com' if index % 2 else '',
+                check_in=today + timedelta(days=10 + index),
+                check_out=today + timedelta(days=12 + index),
+                guests_count=20,
+                total_price=Decimal('300.00') + index,
+                status=['pending', 'confirmed', 'completed', 'cancelled', 'pending'][index],
+                catering_menu=menu if index % 2 == 0 else None,
+            )
+            BookingService.objects.create(booking=booking, service=service, quantity=index + 1, price=Decimal('25.00'))
+        archive_batch(list(Booking.objects.filter(status__in=['completed', 'cancelled']).values_list('pk', flat=True)))
+
+    def test_list_responses_match(self):
+        for path in self.PATHS:
+            with self.subTest(path=path):
+                with override_settings(FAST_LIST_SERIALIZERS=False):
+                    expected = self.client.get(path)
+                with override_settings(FAST_LIST_SERIALIZERS=True):
+                    actual = self.client.get(path)
+                self.assertEqual(expected.status_code, 200)
+                self.assertGreater(len(expected.json()['results']), 0)
+                self.assertEqual(actual.content, expected.content)
+
+
+@override_settings(CATALOG_SNAPSHOT_DIR=TEST_SNAPSHOT_DIR, IDEMPOTENCY_LOCK_TIMEOUT=60)
+class IdempotencyKeyTests(TestCase):
+    """POST /api/bookings/ Idempotency-Key bilen"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.property = Property.objects.create(
+            title='Toý zaly', description='Giň zal', address='Aşgabat',
+            price_per_night=Decimal('200.00'), max_guests=100,
+        )
+
+    def booking_data(self, **changes):
+        check_in = date.today() + timedelta(days=30)
+        return {
+            'property': self.property.pk,
+            'customer_name': 'Aman',
+            'customer_phone': '+99361000000',
+            'check_in': check_in.isoformat(),
+            'check_out': (check_in + timedelta(days=2)).isoformat(),
+            'guests_count': 40,
+            'total_price': '400.00',
+            **changes,
+        }
+
+    def post(self, data, key='booking-1'):
+        return self.client.post(
+            '/api/bookings/', data, content_type='application/json', headers={'Idempotency-Key': key}
+        )
+
+    def test_repeated_request_replays_first_response(self):
+        first = self.post(self.booking_data())
+        second = self.post(self.booking_data())
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(second.status_code, 201)
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(second['Idempotent-Replayed'], 'true')
+        self.assertEqual(Booking.objects.count(), 1)
+
+    def test_validation_error_is_replayed(self):
+        data = self.booking_data(guests_count=500)
+        first = self.post(data)
+        second = self.post(data)
+
+        self.assertEqual(first.status_code, 400)
+        self.assertEqual(second.status_code, 400)
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(second['Idempotent-Replayed'], 'true')
+
+    def test_key_reused_with_different_body_returns_422(self):
+        self.post(self.booking_data())
+        response = self.post(self.booking_data(customer_name='Başga'))
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(Booking.objects.count(), 1)
+
+    def test_key_is_scoped_to_the_client(self):
+        first = self.post(self.booking_data())
+        # Başga müşderi şol açar bilen ilkinji jogaby almaly däl
+        check_in = date.today() + timedelta(days=40)
+        data = self.booking_data(
+            check_in=check_in.isoformat(), check_out=(check_in + timedelta(days=1)).isoformat()
+        )
+        other = self.client.post(
+            '/api/bookings/', data, content_type='application/json',
+            headers={'Idempotency-Key': 'booking-1', 'User-Agent': 'another-device'},
+        )
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(other.status_code, 201)
+        self.assertNotIn('Idempotent-Replayed', other)
+        self.assertNotEqual(other.json(), first.json())
+        self.assertEqual(Booking.objects.count(), 2)
+        self.assertEqual(IdempotencyKey.objects.filter(key='booking-1').count(), 2)
+
+    def test_in_flight_key_returns_409(self):
+        self.post(self.booking_data())
+        # Ilkinji sorag heniz jogap ýazmadyk ýaly
+        IdempotencyKey.objects.update(status_code=None, response='')
+        response = self.post(self.booking_data())
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response['Retry-After'], '1')
+        self.assertEqual(Booking.objects.count(), 1)
+
+    def test_abandoned_key_can_be_claimed_again(self):
+        self.post(self.booking_data())
+        # Işçi jogap ýazmazdan öň öldi: eýeleme IDEMPOTENCY_LOCK_TIMEOUT-dan köne
+        Booking.objects.all().delete()
+        IdempotencyKey.objects.update(
+            status_code=None, response='', created_at=timezone.now() - timedelta(seconds=120)
+        )
+        response = self.post(self.booking_data())
+
+        self.assertEqual(response.status_code, 201)
+        self.assertNotIn('Idempotent-Replayed', response)
+        self.assertEqual(Booking.objects.count(), 1)
+        self.assertEqual(IdempotencyKey.objects.get().status_code, 201)
+
+
+@override_settings(CATALOG_SNAPSHOT_DIR=TEST_SNAPSHOT_DIR, TASKS_EAGER=False)
+class RollupTaskTests(TransactionTestCase):
+    """apply_booking_rollup idempotent däl: her üýtgeşme jemlere bir gezek düşmeli"""
+
+    def setUp(self):
+        property_obj = Property.objects.create(
+            title='Toý zaly', description='Giň zal', address='Aşgabat',
+            price_per_night=Decimal('200.00'), max_guests=100,
+        )
+        check_in = date.today() + timedelta(days=30)
+        self.booking = Booking.objects.create(
+            property=property_obj, customer_name='Aman', customer_phone='+99361000000',
+            check_in=check_in, check_out=check_in + timedelta(days=3), guests_count=40,
+            total_price=Decimal('600.00'), status='confirmed',
+        )
+        self.task = BackgroundTask.objects.get(name=rollups.ROLLUP_TASK)
+
+    def totals(self):
+        return BookingDailyStat.objects.aggregate(occupied=Sum('occupied'), revenue=Sum('revenue'))
+
+    def test_task_is_queued_with_the_booking(self):
+        self.assertEqual(self.task.payload['old'], None)
+        self.assertTrue(tasks.execute(*tasks.claim('worker', 10)[0]))
+        self.assertEqual(self.totals(), {'occupied': 3, 'revenue': Decimal('600.00')})
+        self.assertFalse(BackgroundTask.objects.filter(name=rollups.ROLLUP_TASK).exists())
+
+    def test_stale_claim_does_not_apply_twice(self):
+        [first] = tasks.claim('worker-a', 10)
+        # Ilkinji işçi haýal: iş köne diýip nobata gaýdýar we başga işçi alýar
+        BackgroundTask.objects.filter(pk=self.task.pk).update(locked_at=timezone.now() - timedelta(days=1))
+        tasks.release_stale()
+        [second] = tasks.claim('worker-b', 10)
+
+        self.assertTrue(tasks.execute(*second))
+        self.assertFalse(tasks.execute(*first))
+        self.assertEqual(self.totals(), {'occupied': 3, 'revenue': Decimal('600.00')})
+
+    def test_lost_claim_rolls_back_the_delta(self):
+        claim = tasks.claim('worker', 10)[0]
+        booking_changed = rollups.booking_changed
+
+        def claim_lost(*args):
+            booking_changed(*args)
+            # Iş ýerine ýetirilýärkä başga ýerde eýelendi (ýa-da rebuild pozdy)
+            BackgroundTask.objects.filter(pk=self.task.pk).update(locked_by='worker-b')
+
+        with mock.patch.object(rollups, 'booking_changed', side_effect=claim_lost), \
+                self.assertLogs('venues.tasks', 'WARNING'):
+            self.assertFalse(tasks.execute(*claim))
+        self.assertEqual(self.totals(), {'occupied': None, 'revenue': None})
+
+    def test_failed_delta_is_rolled_back_before_retry(self):
+        tasks.execute(*tasks.claim('worker', 10)[0])
+        self.booking.total_price = Decimal('900.00')
+        self.booking.save()
+
+        apply_state = rollups.apply_state
+
+        def fail_on_add(state, sign):
+            apply_state(state, sign)
+            if sign > 0:
+                raise RuntimeError('DB ýalňyşlygy')
+
+        with mock.patch.object(rollups, 'apply_state', side_effect=fail_on_add), \
+                self.assertLogs('venues.tasks', 'WARNING'):
+            self.assertFalse(tasks.execute(*tasks.claim('worker', 10)[0]))
+        self.assertEqual(self.totals(), {'occupied': 3, 'revenue': Decimal('600.00')})
+
+        BackgroundTask.objects.filter(name=rollups.ROLLUP_TASK).update(run_at=timezone.now())
+        self.assertTrue(tasks.execute(*tasks.claim('worker', 10)[0]))
+        self.assertEqual(self.totals(), {'occupied': 3, 'revenue': Decimal('900.00')})
+
+    def test_rebuild_discards_pending_deltas(self):
+        tasks.claim('worker', 10)  # işlenýän iş
+        self.booking.status = 'cancelled'
+        self.booking.save()  # nobatdaky iş
+
+        rollups.rebuild()
+
+        self.assertFalse(BackgroundTask.objects.filter(name=rollups.ROLLUP_TASK).exists())
+        self.assertEqual(self.totals(), {'occupied': None, 'revenue': None})
+
+
+@override_settings(CATALOG_SNAPSHOT_DIR=TEST_SNAPSHOT_DIR)
+class PropertyFacetTests(TestCase):
+    """Facet toparlary şol min_/max_ filterleri bilen deň netije bermeli"""
+
+    @classmethod
+    def setUpTestData(cls):
+        # Toparlaryň çäklerindäki bahalar we meýdanlar
+        for index, (price, area) in enumerate([
+            ('99.99', 49), ('100.00', 50), ('199.99', 99), ('200.00', 100), ('500.00', 200), ('350.00', None),
+        ]):
+            Property.objects.create(
+                title=f'Zal {index}', description='Zal', address='Aşgabat',
+                price_per_night=Decimal(price), max_guests=10 * (index + 1), area=area,
+            )
+
+    def test_bucket_counts_match_filters(self):
+        facets = self.client.get('/api/properties/?facets=true').json()['facets']
+        for name in ('price', 'area'):
+            for bucket in facets[name]:
+                query = '&'.join(
+                    f'{bound}_{name}={bucket[bound]}' for bound in ('min', 'max') if bucket[bound] is not None
+                )
+                with self.subTest(query=query):
+                    self.assertEqual(self.client.get(f'/api/properties/?{query}').json()['count'], bucket['count'])
+
+    def test_invalid_and_unknown_filters_are_ignored(self):
+        queries = ('min_area=abc', 'max_area=1.5', 'min_price=xx', 'max_price=NaN', 'guests=many', 'bedrooms=1')
+        for query in queries:
+            for prefix in ('/api/properties/', '/api/async/properties/'):
+                with self.subTest(query=query, prefix=prefix):
+                    response = self.client.get(f'{prefix}?{query}')
+                    self.assertEqual(response.status_code, 200)
+                    self.assertEqual(response.json()['count'], 6)
+
+
+@override_settings(CATALOG_SNAPSHOT_DIR=TEST_SNAPSHOT_DIR)
+class SyncTests(TestCase):
+    """Delta sinhronizasiýa"""
+
+    def test_category_rename_resends_properties(self):
+        category = Category.objects.create(name='Toýhana', slug='toyhana')
+        property_obj = Property.objects.create(
+            category=category, title='Zal', description='', address='Aşgabat',
+            price_per_night=Decimal('100.00'), max_guests=50,
+        )
+        since = timezone.now()
+
+        category.name = 'Toý zaly'
+        category.save()
+
+        changes = build_changes(since)['changes']
+        self.assertEqual([row['id'] for row in changes['properties']], [property_obj.pk])
+        self.assertEqual(changes['properties'][0]['category']['name'], 'Toý zaly')
+
+    @override_settings(SYNC_TOMBSTONE_DAYS=30)
+    def test_purge_tombstones(self):
+        old = SyncTombstone.objects.create(model='dishes', object_id=1)
+        recent = SyncTombstone.objects.create(model='dishes', object_id=2)
+        SyncTombstone.objects.filter(pk=old.pk).update(deleted_at=timezone.now() - timedelta(days=31))
+
+        self.assertEqual(purge_tombstones(), 1)
+        self.assertEqual(list(SyncTombstone.objects.values_list('pk', flat=True)), [recent.pk])
+
+
+@override_settings(CATALOG_SNAPSHOT_DIR=TEST_SNAPSHOT_DIR)
+class BookingExportTests(TestCase):
+    """Bronlaryň eksporty"""
+
+    @classmethod
+    def setUpTestData(cls):
+        property_obj = Property.objects.create(
+            title='Zal', description='', address='Aşgabat',
+            price_per_night=Decimal('100.00'), max_guests=50,
+        )
+        check_in = date.today() + timedelta(days=5)
+        Booking.objects.create(
+            property=property_obj, customer_name='=HYPERLINK("http://example.com")',
+            customer_phone='+99361000000', check_in=check_in, check_out=check_in + timedelta(days=1),
+            guests_count=10, total_price=Decimal('100.00'), notes='@SUM(A1:A2)',
+        )
+        cls.admin = User.objects.create_user('admin', password='secret', is_staff=True)
+        cls.user = User.objects.create_user('user', password='secret')
+
+    def test_requires_admin(self):
+        self.assertIn(self.client.get('/api/bookings/export/').status_code, (401, 403))
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get('/api/bookings/export/').status_code, 403)
+
+    def test_csv_escapes_formulas(self):
+        self.client.force_login(self.admin)
+        response = self.client.get('/api/bookings/export/?type=csv')
+        self.assertEqual(response.status_code, 200)
+        rows = list(csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode())))
+        self.assertEqual(rows[0]['customer_name'], '\'=HYPERLINK("http://example.com")')
+        self.assertEqual(rows[0]['customer_phone'], "'+99361000000")
+        self.assertEqual(rows[0]['notes'], "'@SUM(A1:A2)")
+        self.assertEqual(rows[0]['total_price'], '100.00')
+
+
+@override_settings(CATALOG_SNAPSHOT_DIR=TEST_SNAPSHOT_DIR)
+class ImportTests(TestCase):
+    """Katalogy faýldan import etmek"""
+
+    def run_import(self, kind, text, file_format='csv', batch_size=2):
+        return imports.import_stream(kind, io.StringIO(text), file_format, batch_size=batch_size)
+
+    def test_create_and_update(self):
+        Dish.objects.create(name='Palaw', category='main_course', price=Decimal('40.00'))
+        report = self.run_import('dishes', (
+            'name,category,price\n'
+            'Palaw,main_course,45.00\n'
+            'Dograma,main_course,30.00\n'
+            'Mäş,soup,12.00\n'
+            'Nädogry,soup,-1\n'
+        ))
+        self.assertEqual((report['created'], report['updated']), (2, 1))
+        self.assertEqual([error['row'] for error in report['errors']], [5])
+        self.assertEqual(Dish.objects.get(name='Palaw').price, Decimal('45.00'))
+        self.assertEqual(Dish.objects.get(name='Mäş').search_key, 'mash')
+
+    def test_duplicates_across_chunks(self):
+        report = self.run_import('dishes', (
+            '{"name": "Palaw", "category": "main_course", "price": "40"}\n'
+            '{"name": "Dograma", "category": "main_course", "price": "30"}\n'
+            '{"name": "Palaw", "category": "main_course", "price": "45"}\n'
+        ), file_format='ndjson')
+        self.assertEqual(report['created'], 2)
+        self.assertEqual(report['errors'], [
+            {'row': 3, 'errors': {'non_field_errors': ['Faýlda gaýtalanýar']}},
+        ])
+        self.assertEqual(Dish.objects.get(name='Palaw').price, Decimal('40.00'))
+
+    def test_database_error_is_reported_per_row(self):
+        original = imports.DishImporter.after_write
+
+        def after_write(importer, created, updated):
+            if any(obj.name == 'Dograma' for obj in created):
+                raise IntegrityError('constraint failed')
+            original(importer, created, updated)
+
+        with mock.patch.object(imports.DishImporter, 'after_write', after_write):
+            report = self.run_import('dishes', (
+                'name,category,price\n'
+                'Palaw,main_course,40\n'
+                'Dograma,main_course,30\n'
+                'Mäş,soup,12\n'
+            ))
+
+        self.assertEqual(report['created'], 2)
+        self.assertEqual(len(report['errors']), 1)
+        self.assertEqual(report['errors'][0]['row'], 3)
+        self.assertEqual(
+            sorted(Dish.objects.values_list('name', flat=True)), ['Mäş', 'Palaw']
+        )
+
+
+class MediaRangeTests(SimpleTestCase):
+    """Media faýllary üçin Range sözbaşysy"""
+
+    def test_parse_range(self):
+        cases = [
+            ('bytes=0-99', (0, 99)),
+            ('bytes=100-', (100, 999)),
+            ('bytes=-200', (800, 999)),
+            ('bytes=-5000', (0, 999)),
+            ('bytes=900-5000', (900, 999)),
+            ('bytes=0-1,5-6', None),
+            ('items=0-1', None),
+            ('bytes=-', None),
+        ]
+        for header, expected in cases:
+            with self.subTest(header=header):
+                self.assertEqual(parse_range(header, 1000), expected)
+
+    def test_unsatisfiable_range(self):
+        for header in ('bytes=1000-', 'bytes=1000-1200', 'bytes=50-10', 'bytes=-0'):
+            with self.subTest(header=header):
+                with self.assertRaises(ValueError):
+                    parse_range(header, 1000)
+
+
+@override_settings(CATALOG_SNAPSHOT_DIR=TEST_SNAPSHOT_DIR)
+class AnalyticsPermissionTests(TestCase):
+    """Bron analitikasy diňe administratorlar üçin"""
+
+    PATH = '/api/stats/analytics/?date_from=2025-01-01&date_to=2025-12-31'
+
+    def test_requires_admin(self):
+        self.assertIn(self.client.get(self.PATH).status_code, (401, 403))
+        self.client.force_login(User.objects.create_user('user', password='secret'))
+        self.assertEqual(self.client.get(self.PATH).status_code, 403)
+        self.client.force_login(User.objects.create_user('admin', password='secret', is_staff=True))
+        self.assertEqual(self.client.get(self.PATH).status_code, 200)
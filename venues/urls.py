@@ -1,6 +1,6 @@
 # API Router
 from rest_framework.routers import DefaultRouter
-from .views import PropertyViewSet, ServiceViewSet, BookingViewSet, StatsViewSet, CategoryViewSet
+from .views import PropertyViewSet, ServiceViewSet, BookingViewSet, StatsViewSet, CategoryViewSet, SyncViewSet, ImportViewSet
 
 router = DefaultRouter()
 router.register(r'properties', PropertyViewSet, basename='property')
@@ -8,3 +8,5 @@ router.register(r'categories', CategoryViewSet, basename='category')
 router.register(r'services', ServiceViewSet, basename='service')
 router.register(r'bookings', BookingViewSet, basename='booking')
 router.register(r'stats', StatsViewSet, basename='stats')
+router.register(r'sync', SyncViewSet, basename='sync')
+router.register(r'import', ImportViewSet, basename='import')
@@ -1,14 +1,29 @@
-from rest_framework import viewsets, status
+from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
-from django.db.models import Q
+from rest_framework.parsers import MultiPartParser
+import gzip
+import io
 from datetime import datetime
-from .models import Property, Service, Booking, Category
+from decimal import Decimal, InvalidOperation
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified, JsonResponse, StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from venue.batch import BatchObjectCacheMixin
+from venue.fast_serializers import FastListMixin
+from venue.search import normalize_search_text
+from .models import Property, Service, Booking, Category, ArchivedBooking
 from .serializers import (
     PropertyListSerializer, PropertyDetailSerializer, PropertyCreateSerializer,
-    ServiceSerializer, BookingSerializer, CategorySerializer
+    ServiceSerializer, BookingSerializer, CategorySerializer, ArchivedBookingSerializer
 )
+from . import exports, facets, imports, rollups
+from .idempotency import idempotent
+from .fast_serializers import PropertyListFastSerializer, BookingFastSerializer, ArchivedBookingFastSerializer
+from .snapshot import read_manifest, schedule_build, snapshot_dir
+from .sync import build_changes
 
 
 class CustomPageNumberPagination(PageNumberPagination):
@@ -21,10 +36,84 @@ class CustomPageNumberPagination(PageNumberPagination):
     page_size = 10
 
 
-class PropertyViewSet(viewsets.ModelViewSet):
+def number_param(params, name, cast=int):
+    """San parametri; ýok ýa-da nädogry bolsa None (filter geçilýär)"""
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        number = cast(value)
+    except (ValueError, InvalidOperation):
+        return None
+    if isinstance(number, Decimal) and not number.is_finite():
+        return None
+    return number
+
+
+def filter_properties(queryset, params):
+    """Jaýlar sanawy üçin query parametrleri boýunça filter (sync we async API üçin umumy)"""
+    category_id = params.get('category_id', None)
+    if category_id:
+        queryset = queryset.filter(category_id=category_id)
+
+        # Bron seneleri boýunça filter
+        check_in = params.get('check_in', None)
+        check_out = params.get('check_out', None)
+
+        if check_in and check_out:
+            try:
+                check_in_date = datetime.strptime(check_in, '%Y-%m-%d').date()
+                check_out_date = datetime.strptime(check_out, '%Y-%m-%d').date()
+
+                # Şu senelerde bronlanan jaýlary tap
+                overlapping_bookings = Booking.objects.filter(
+                    status__in=['confirmed'],
+                    check_in__lt=check_out_date,  # Bron başlangyç senesi soňra check_out-dan
+                    check_out__gt=check_in_date  # Bron gutarýan senesi öň check_in-dan
+                ).values_list('property_id', flat=True)
+
+                # Bronlanan jaýlary aýyr
+                queryset = queryset.exclude(id__in=overlapping_bookings)
+            except ValueError:
+                pass  # Sene formaty nädogry bolsa, skip et
+
+    # Gözleg (kiril/latyn harplary bir görnüşe getirilen search_key boýunça)
+    search = params.get('search', None)
+    if search:
+        for term in normalize_search_text(search).split():
+            queryset = queryset.filter(search_key__contains=term)
+
+    # Bahadan filter (iki çäk hem goşulýar, facets.PRICE_BUCKETS ýaly)
+    min_price = number_param(params, 'min_price', Decimal)
+    max_price = number_param(params, 'max_price', Decimal)
+
+    if min_price is not None:
+        queryset = queryset.filter(price_per_night__gte=min_price)
+    if max_price is not None:
+        queryset = queryset.filter(price_per_night__lte=max_price)
+
+    # Myhmanlaryň sany
+    guests = number_param(params, 'guests')
+    if guests is not None:
+        queryset = queryset.filter(max_guests__gte=guests)
+
+    # Meýdany (m²)
+    min_area = number_param(params, 'min_area')
+    max_area = number_param(params, 'max_area')
+
+    if min_area is not None:
+        queryset = queryset.filter(area__gte=min_area)
+    if max_area is not None:
+        queryset = queryset.filter(area__lte=max_area)
+
+    return queryset
+
+
+class PropertyViewSet(BatchObjectCacheMixin, FastListMixin, viewsets.ModelViewSet):
     """Jaýlar API - diňe okamak üçin (admin panel arkaly goşulýar)"""
     queryset = Property.objects.filter(is_available=True)
     pagination_class = CustomPageNumberPagination
+    fast_serializer_class = PropertyListFastSerializer
 
     def get_serializer_class(self):
         if self.action == 'create':
@@ -34,62 +123,16 @@ class PropertyViewSet(viewsets.ModelViewSet):
         return PropertyListSerializer
 
     def get_queryset(self):
-        queryset = super().get_queryset()
-
-        category_id = self.request.query_params.get('category_id', None)
-        if category_id:
-            queryset = queryset.filter(category_id=category_id)
-
-            # Bron seneleri boýunça filter
-            check_in = self.request.query_params.get('check_in', None)
-            check_out = self.request.query_params.get('check_out', None)
-
-            if check_in and check_out:
-                try:
-                    check_in_date = datetime.strptime(check_in, '%Y-%m-%d').date()
-                    check_out_date = datetime.strptime(check_out, '%Y-%m-%d').date()
-
-                    # Şu senelerde bronlanan jaýlary tap
-                    overlapping_bookings = Booking.objects.filter(
-                        status__in=['confirmed'],
-                        check_in__lt=check_out_date,  # Bron başlangyç senesi soňra check_out-dan
-                        check_out__gt=check_in_date  # Bron gutarýan senesi öň check_in-dan
-                    ).values_list('property_id', flat=True)
-
-                    # Bronlanan jaýlary aýyr
-                    queryset = queryset.exclude(id__in=overlapping_bookings)
-                except ValueError:
-                    pass  # Sene formaty nädogry bolsa, skip et
-
-        # Gözleg
-        search = self.request.query_params.get('search', None)
-        if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(description__icontains=search) |
-                Q(address__icontains=search)
+        return filter_properties(super().get_queryset(), self.request.query_params)
+
+    def list(self, request, *args, **kwargs):
+        """?facets=true - netijeler bilen bilelikde filter paneliniň sanlary"""
+        response = super().list(request, *args, **kwargs)
+        if request.query_params.get('facets', '').lower() in ('true', '1') and isinstance(response.data, dict):
+            response.data['facets'] = facets.property_facets(
+                self.filter_queryset(self.get_queryset()), self.queryset.all()
             )
-
-        # Bahadan filter
-        min_price = self.request.query_params.get('min_price', None)
-        max_price = self.request.query_params.get('max_price', None)
-
-        if min_price:
-            queryset = queryset.filter(price_per_night__gte=min_price)
-        if max_price:
-            queryset = queryset.filter(price_per_night__lte=max_price)
-
-        # Myhmanlaryň sany
-        guests = self.request.query_params.get('guests', None)
-        if guests:
-            queryset = queryset.filter(max_guests__gte=guests)
-
-        # Ýatylýan otaglar
-        bedrooms = self.request.query_params.get('bedrooms', None)
-        if bedrooms:
-            queryset = queryset.filter(bedrooms__gte=bedrooms)
-
-        return queryset
+        return response
 
     @action(detail=True, methods=['get'])
     def availability(self, request, pk=None):
@@ -162,13 +205,33 @@ class ServiceViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = ServiceSerializer
 
 
-class BookingViewSet(viewsets.ModelViewSet):
-    """Bronlar API - goşmak we okamak üçin"""
+class BookingViewSet(FastListMixin, viewsets.ModelViewSet):
+    """
+    Bronlar API - goşmak we okamak üçin.
+    ?archived=true - arhiwlenen köne bronlar (diňe list we retrieve)
+    """
     queryset = Booking.objects.all()
     serializer_class = BookingSerializer
+    fast_serializer_class = BookingFastSerializer
+
+    def is_archived(self):
+        return (
+            self.action in ('list', 'retrieve')
+            and self.request.query_params.get('archived', '').lower() in ('true', '1')
+        )
+
+    def get_serializer_class(self):
+        if self.is_archived():
+            return ArchivedBookingSerializer
+        return super().get_serializer_class()
+
+    def get_fast_serializer_class(self):
+        if self.is_archived():
+            return ArchivedBookingFastSerializer
+        return super().get_fast_serializer_class()
 
     def get_queryset(self):
-        queryset = super().get_queryset()
+        queryset = ArchivedBooking.objects.all() if self.is_archived() else super().get_queryset()
 
         ids = self.request.query_params.get('ids', None)
         if ids:
@@ -195,8 +258,9 @@ class BookingViewSet(viewsets.ModelViewSet):
 
         return queryset.order_by('-created_at')
 
+    @idempotent
     def create(self, request, *args, **kwargs):
-        """Täze bron döretmek"""
+        """Täze bron döretmek (Idempotency-Key sözbaşysy bilen gaýtalamak howpsuz)"""
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
@@ -209,9 +273,46 @@ class BookingViewSet(viewsets.ModelViewSet):
             status=status.HTTP_201_CREATED
         )
 
+    @action(detail=False, methods=['get'], permission_classes=[permissions.IsAdminUser])
+    def export(self, request):
+        """
+        Bronlary akym bilen eksport etmek (buhgalteriýa üçin).
+        Mysal: /bookings/export/?type=csv&date_from=2025-01-01&date_to=2025-12-31&status=confirmed,completed
+        ?archived=true - arhiwlenen bronlar
+        """
+        export_format = request.query_params.get('type', 'csv')
+        if export_format not in exports.FORMATS:
+            return Response(
+                {'error': f"type şulardan biri bolmaly: {', '.join(exports.FORMATS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            date_from = exports.parse_date(request.query_params.get('date_from'))
+            date_to = exports.parse_date(request.query_params.get('date_to'))
+        except ValueError:
+            return Response(
+                {'error': 'Sene formaty nädogry (YYYY-MM-DD)'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        statuses = request.query_params.get('status')
+        statuses = [item.strip() for item in statuses.split(',') if item.strip()] if statuses else None
+
+        archived = request.query_params.get('archived', '').lower() in ('true', '1')
+        queryset = exports.export_queryset(date_from, date_to, statuses, archived=archived)
+        content_type = 'text/csv' if export_format == 'csv' else 'application/x-ndjson'
+        response = StreamingHttpResponse(
+            exports.export_lines(export_format, queryset),
+            content_type=f'{content_type}; charset=utf-8'
+        )
+        response['Content-Disposition'] = f'attachment; filename="bookings.{export_format}"'
+        return response
+
     @action(detail=True, methods=['post'])
+    @idempotent
     def cancel(self, request, pk=None):
-        """Brony ýatirmak"""
+        """Brony ýatirmak (Idempotency-Key sözbaşysy bilen gaýtalamak howpsuz)"""
         booking = self.get_object()
 
         if booking.status == 'cancelled':
@@ -226,6 +327,12 @@ class BookingViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        if booking.status == 'expired':
+            return Response(
+                {'error': 'Bronyň möhleti eýýäm geçdi'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
         booking.status = 'cancelled'
         booking.save()
 
@@ -244,6 +351,7 @@ class StatsViewSet(viewsets.ViewSet):
         total_properties = Property.objects.count()
         available_properties = Property.objects.filter(is_available=True).count()
         total_bookings = Booking.objects.count()
+        archived_bookings = ArchivedBooking.objects.count()
         pending_bookings = Booking.objects.filter(status='pending').count()
         confirmed_bookings = Booking.objects.filter(status='confirmed').count()
 
@@ -254,7 +362,145 @@ class StatsViewSet(viewsets.ViewSet):
             },
             'bookings': {
                 'total': total_bookings,
+                'archived': archived_bookings,
                 'pending': pending_bookings,
                 'confirmed': confirmed_bookings
             }
         })
+
+    @action(detail=False, methods=['get'], permission_classes=[permissions.IsAdminUser])
+    def analytics(self, request):
+        """
+        Eýelenme, girdeji we ortaça galmak wagty (günlük jemlerden).
+        Mysal: /stats/analytics/?date_from=2025-01-01&date_to=2025-12-31&group_by=category
+        group_by: property (default), category, month
+        """
+        group_by = request.query_params.get('group_by', 'property')
+        if group_by not in rollups.GROUPS:
+            return Response(
+                {'error': f"group_by şulardan biri bolmaly: {', '.join(rollups.GROUPS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            date_from = datetime.strptime(request.query_params.get('date_from', ''), '%Y-%m-%d').date()
+            date_to = datetime.strptime(request.query_params.get('date_to', ''), '%Y-%m-%d').date()
+        except ValueError:
+            return Response(
+                {'error': 'date_from we date_to gerek (YYYY-MM-DD)'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if date_to < date_from:
+            return Response(
+                {'error': 'date_to date_from-dan öň bolup bilmez'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response({
+            'date_from': date_from,
+            'date_to': date_to,
+            'group_by': group_by,
+            'results': rollups.analytics(date_from, date_to, group_by),
+        })
+
+
+class SyncViewSet(viewsets.ViewSet):
+    """
+    Mobil programma üçin delta sinhronizasiýa.
+    URL görnüşi: /api/sync/?since=2025-01-01T10:00:00Z
+    Jogapdaky next_since indiki sinhronizasiýada since hökmünde iberilýär.
+    """
+
+    def list(self, request):
+        since = request.query_params.get('since')
+        if since:
+            # URL-de kodlanmadyk '+' boşluga öwrülýär
+            try:
+                since = parse_datetime(since.replace(' ', '+'))
+            except ValueError:  # formaty dogry, emma senesi ýok (meselem 13-nji aý)
+                since = None
+            if since is None:
+                return Response(
+                    {'error': 'since formaty nädogry (ISO 8601)'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since)
+
+        return Response(build_changes(since or None, request))
+
+
+class ImportViewSet(viewsets.ViewSet):
+    """
+    Katalogy faýldan köpçülikleýin import etmek (täze toýhana ulgamy üçin).
+    POST /api/import/ (multipart): kind=properties, type=csv, file=<faýl>
+    Jogap: döredilen/täzelenen sany we ýalňyş setirler.
+    """
+    permission_classes = [permissions.IsAdminUser]
+    parser_classes = [MultiPartParser]
+
+    def create(self, request):
+        kind = request.data.get('kind')
+        if kind not in imports.IMPORTERS:
+            return Response(
+                {'error': f"kind şulardan biri bolmaly: {', '.join(imports.IMPORTERS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({'error': 'file gerek'}, status=status.HTTP_400_BAD_REQUEST)
+
+        file_format = request.data.get('type') or upload.name.rsplit('.', 1)[-1].lower()
+        if file_format not in imports.FORMATS:
+            return Response(
+                {'error': f"type şulardan biri bolmaly: {', '.join(imports.FORMATS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        stream = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+        try:
+            report = imports.import_stream(kind, stream, file_format)
+        except UnicodeDecodeError:
+            return Response({'error': 'Faýl UTF-8 bolmaly'}, status=status.HTTP_400_BAD_REQUEST)
+        finally:
+            stream.detach()
+
+        return Response(report, status=status.HTTP_200_OK if not report['errors'] else status.HTTP_207_MULTI_STATUS)
+
+
+def catalog_snapshot(request):
+    """
+    Doly katalogyň gysylan suraty (offline we haýal baglanyşyk üçin).
+    URL: /api/catalog/snapshot/ - ETag bilen, üýtgemedik bolsa 304 gaýtarýar.
+    Surat fon işinde gurulýar (venues/snapshot.py), bu ýerde diňe okalýar.
+    """
+    manifest = read_manifest()
+    if manifest is None:
+        schedule_build()
+        response = JsonResponse({'error': 'Katalog suraty entek taýýar däl'}, status=503)
+        response.headers['Retry-After'] = '30'
+        return response
+    accepted = request.headers.get('Accept-Encoding', '')
+
+    if 'br' in manifest['files'] and 'br' in accepted:
+        encoding = 'br'
+    else:
+        encoding = 'gzip'
+    etag = f'"{manifest["version"]}-{encoding}"'
+
+    if etag in request.headers.get('If-None-Match', ''):
+        response = HttpResponseNotModified()
+    else:
+        path = snapshot_dir() / manifest['files'][encoding]
+        if encoding == 'gzip' and 'gzip' not in accepted:
+            # Gysylan faýly kabul etmeýän müşderiler üçin
+            response = HttpResponse(gzip.decompress(path.read_bytes()), content_type='application/json')
+        else:
+            response = FileResponse(open(path, 'rb'), content_type='application/json')
+            response.headers['Content-Encoding'] = encoding
+
+    response.headers['ETag'] = etag
+    response.headers['Cache-Control'] = 'no-cache'
+    patch_vary_headers(response, ['Accept-Encoding'])
+    return response